@@ -1,3 +1,8 @@
+from typing import Dict, Mapping, Optional, Sequence
+
+from health_lifestyle_diabetes.domain.ports.calibration_metrics_port import (
+    CalibrationMetricsPort,
+)
 from health_lifestyle_diabetes.domain.ports.calibrator_port import CalibrationPort
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
 
@@ -7,9 +12,15 @@ class CalibrationService:
     Service applicatif orchestrant le calibrage du modèle.
     """
 
-    def __init__(self, calibrator: CalibrationPort, logger: LoggerPort):
+    def __init__(
+        self,
+        calibrator: CalibrationPort,
+        logger: LoggerPort,
+        calibration_metrics: Optional[CalibrationMetricsPort] = None,
+    ):
         self.calibrator = calibrator
         self.logger = logger
+        self.calibration_metrics = calibration_metrics
 
     def calibrate_model(
         self,
@@ -21,4 +32,55 @@ class CalibrationService:
         self.logger.info("Début du calibrage modèle...")
         calibrated_model = self.calibrator.calibrate(model, X_calib, y_calib, **kwargs)
         self.logger.info("Modèle calibré prêt à l'utilisation.")
-        return calibrated_model
\ No newline at end of file
+        return calibrated_model
+
+    def compare_calibration(
+        self,
+        y_true: Sequence[int],
+        probas: Mapping[str, Sequence[float]],
+        *,
+        n_bins: int = 10,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Compare la calibration de plusieurs vecteurs de probabilités
+        (ex: {"before": ..., "after": ...}) en un seul passage.
+        """
+        if self.calibration_metrics is None:
+            raise ValueError("Aucun calibration_metrics configuré pour la comparaison.")
+
+        report = self.calibration_metrics.compare_calibration(y_true, probas, n_bins=n_bins)
+        for name, metrics in report.items():
+            self.logger.info(
+                f"Calibration [{name}] | ECE={metrics['ece']:.4f} | "
+                f"Brier={metrics['brier_score']:.4f} | LogLoss={metrics['log_loss']:.4f}"
+            )
+        return report
+
+    def calibrate_and_compare(
+        self,
+        model,
+        X_calib,
+        y_calib,
+        X_eval,
+        y_eval,
+        *,
+        n_bins: int = 10,
+        **kwargs
+    ):
+        """
+        Calibre le modèle puis compare avant / après sur un jeu d'évaluation.
+
+        Returns
+        -------
+        (calibrated_model, report)
+        """
+        calibrated_model = self.calibrate_model(model, X_calib, y_calib, **kwargs)
+        report = self.compare_calibration(
+            y_eval,
+            {
+                "before": model.predict_proba(X_eval)[:, 1],
+                "after": calibrated_model.predict_proba(X_eval)[:, 1],
+            },
+            n_bins=n_bins,
+        )
+        return calibrated_model, report
@@ -48,6 +48,10 @@ class ExperimentTrackingService:
         self.logger.info(f"Métriques d'évaluation : {metrics}")
         self.tracker.log_metrics(metrics)
 
+    def log_training_iteration(self, metrics: Mapping[str, float], step: int) -> None:
+        """Log des métriques d'une itération d'entraînement (courbe d'apprentissage)."""
+        self.tracker.log_metrics(metrics, step=step)
+
     def log_artifact(self, path: str) -> None:
         """Log d'un artefact produit par le modèle (fichier)."""
         self.logger.debug(f"Enregistrement d'un artefact : {path}")
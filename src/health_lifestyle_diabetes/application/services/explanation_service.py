@@ -0,0 +1,48 @@
+from typing import Any, List, Optional
+
+from health_lifestyle_diabetes.domain.entities.prediction_explanation import (
+    PredictionExplanation,
+)
+from health_lifestyle_diabetes.domain.ports.explainer_port import ExplainerPort
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+
+
+class ExplanationService:
+    """
+    Service applicatif exposant les principaux contributeurs de chaque
+    prédiction (explications locales), dans un budget de latence.
+    """
+
+    def __init__(
+        self,
+        explainer: ExplainerPort,
+        logger: LoggerPort,
+        top_k: int = 5,
+        latency_budget_ms: Optional[float] = None,
+    ):
+        self.explainer = explainer
+        self.logger = logger
+        self.top_k = top_k
+        self.latency_budget_ms = latency_budget_ms
+
+    def explain_predictions(
+        self,
+        model: Any,
+        X: Any,
+        *,
+        top_k: Optional[int] = None,
+        latency_budget_ms: Optional[float] = None,
+    ) -> List[Optional[PredictionExplanation]]:
+        """
+        Retourne les top-k contributions de chaque enregistrement scoré
+        (None pour les lignes non traitées dans le budget de latence).
+        """
+        self.logger.debug(f"Demande d'explications | n={len(X)}")
+        return self.explainer.explain(
+            model,
+            X,
+            top_k=top_k or self.top_k,
+            latency_budget_ms=(
+                latency_budget_ms if latency_budget_ms is not None else self.latency_budget_ms
+            ),
+        )
@@ -0,0 +1,225 @@
+# application/services/run_leaderboard_service.py
+
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from health_lifestyle_diabetes.domain.entities.metrics import EvaluationResults
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.run_query_port import RunQueryPort
+
+# Métriques scalaires d'EvaluationResults (classables).
+RANKABLE_METRICS: Tuple[str, ...] = tuple(
+    f.name
+    for f in fields(EvaluationResults)
+    if f.name not in ("extra_metrics", "confidence_intervals")
+)
+
+# Métriques pour lesquelles une valeur plus faible est meilleure.
+LOWER_IS_BETTER = frozenset(
+    {"false_positive_rate", "false_negative_rate", "ece", "mce", "brier_score", "log_loss"}
+)
+
+_ID_COLUMNS = ["run_id", "run_name", "status", "start_time", "end_time"]
+
+
+class RunLeaderboardService:
+    """
+    Classement et comparaison des runs d'une expérience.
+
+    - Récupère toutes les runs en un seul DataFrame colonnaire (appels
+      `search_runs_page` paginés), mis en cache en mémoire pendant
+      `cache_ttl` secondes et, si `cache_dir` est fourni, sur disque
+      (pickle) pour les sessions suivantes.
+    - Classe les runs selon n'importe quelle métrique d'EvaluationResults
+      (sens automatique : AUC ↑, Brier ↓...) ou toute autre métrique loggée.
+    - Compare les paramètres des k meilleures runs (seuls ceux qui diffèrent).
+    """
+
+    def __init__(
+        self,
+        run_query: RunQueryPort,
+        logger: LoggerPort,
+        *,
+        experiment_name: str = "health_lifestyle_diabetes",
+        page_size: int = 1000,
+        cache_ttl: float = 300.0,
+        cache_dir: Optional[str | Path] = None,
+    ):
+        self.run_query = run_query
+        self.logger = logger
+        self.experiment_name = experiment_name
+        self.page_size = page_size
+        self.cache_ttl = cache_ttl
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
+
+    # -----------------------------------------
+    # Récupération
+    # -----------------------------------------
+    def fetch_runs(
+        self, experiment_name: Optional[str] = None, *, refresh: bool = False
+    ) -> pd.DataFrame:
+        """Toutes les runs de l'expérience (une ligne par run)."""
+        name = experiment_name or self.experiment_name
+
+        if not refresh:
+            cached = self._cache.get(name) or self._load_disk_cache(name)
+            if cached is not None and time.time() - cached[0] < self.cache_ttl:
+                self._cache[name] = cached
+                return cached[1]
+
+        pages: List[pd.DataFrame] = []
+        token: Optional[str] = None
+        while True:
+            page, token = self.run_query.search_runs_page(
+                name, max_results=self.page_size, page_token=token
+            )
+            if not page.empty:
+                pages.append(page)
+            if token is None:
+                break
+
+        runs = (
+            pd.concat(pages, ignore_index=True, sort=False)
+            if pages
+            else pd.DataFrame(columns=_ID_COLUMNS)
+        )
+        metric_columns = [c for c in runs.columns if c.startswith("metrics.")]
+        if metric_columns:
+            runs[metric_columns] = runs[metric_columns].apply(pd.to_numeric, errors="coerce")
+
+        self.logger.info(f"Runs récupérées : {len(runs)} ({len(pages)} pages) pour '{name}'.")
+        entry = (time.time(), runs)
+        self._cache[name] = entry
+        self._save_disk_cache(name, entry)
+        return runs
+
+    def invalidate(self, experiment_name: Optional[str] = None) -> None:
+        """Vide le cache (une expérience, ou toutes)."""
+        names = [experiment_name] if experiment_name else list(self._cache)
+        for name in names:
+            self._cache.pop(name, None)
+            path = self._cache_path(name)
+            if path is not None and path.exists():
+                path.unlink()
+
+    # -----------------------------------------
+    # Classement
+    # -----------------------------------------
+    def rank(
+        self,
+        metric: str = "auc_roc",
+        *,
+        top_k: Optional[int] = 10,
+        ascending: Optional[bool] = None,
+        finished_only: bool = True,
+        experiment_name: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Runs classées selon `metric` (nom de champ d'EvaluationResults ou de
+        métrique loggée). `ascending=None` : sens déduit de la métrique.
+        Les runs sans valeur pour la métrique sont écartées.
+        """
+        runs = self.fetch_runs(experiment_name)
+        column = f"metrics.{metric}"
+        if column not in runs.columns:
+            raise ValueError(
+                f"Métrique inconnue ou jamais loggée : '{metric}'. "
+                f"Métriques d'EvaluationResults : {', '.join(RANKABLE_METRICS)}"
+            )
+
+        if finished_only and "status" in runs.columns:
+            runs = runs[runs["status"] == "FINISHED"]
+        runs = runs[runs[column].notna()]
+
+        if ascending is None:
+            ascending = metric in LOWER_IS_BETTER
+        if top_k is None:
+            ranked = runs.sort_values(column, ascending=ascending, kind="stable")
+        elif ascending:
+            ranked = runs.nsmallest(top_k, column, keep="first")
+        else:
+            ranked = runs.nlargest(top_k, column, keep="first")
+
+        ranked = ranked.reset_index(drop=True)
+        ranked.insert(0, "rank", range(1, len(ranked) + 1))
+        return ranked
+
+    def leaderboard(
+        self,
+        metric: str = "auc_roc",
+        *,
+        top_k: int = 10,
+        metrics: Optional[List[str]] = None,
+        experiment_name: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Vue compacte : rang, run, métrique de tri puis les autres métriques
+        d'EvaluationResults disponibles (noms sans préfixe).
+        """
+        ranked = self.rank(metric, top_k=top_k, experiment_name=experiment_name)
+        wanted = metrics or [metric, *(m for m in RANKABLE_METRICS if m != metric)]
+        columns = [f"metrics.{m}" for m in wanted if f"metrics.{m}" in ranked.columns]
+        view = ranked[["rank", "run_id", "run_name", *columns]]
+        return view.rename(columns=lambda c: c.removeprefix("metrics."))
+
+    # -----------------------------------------
+    # Comparaison des paramètres
+    # -----------------------------------------
+    def diff_params(
+        self,
+        metric: str = "auc_roc",
+        *,
+        top_k: int = 5,
+        experiment_name: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Paramètres qui diffèrent entre les `top_k` meilleures runs.
+
+        Index : nom du paramètre ; colonnes : runs dans l'ordre du classement
+        (`run_name` si unique, sinon `run_id`). Valeur absente : NaN.
+        """
+        ranked = self.rank(metric, top_k=top_k, experiment_name=experiment_name)
+        param_columns = [c for c in ranked.columns if c.startswith("params.")]
+        if ranked.empty or not param_columns:
+            return pd.DataFrame()
+
+        params = ranked[param_columns]
+        varying = params.columns[params.nunique(dropna=False) > 1]
+        labels = ranked["run_name"] if ranked["run_name"].is_unique else ranked["run_id"]
+
+        diff = params[varying].T
+        diff.columns = labels.tolist()
+        diff.index = [c.removeprefix("params.") for c in varying]
+        diff.index.name = "param"
+        return diff.sort_index()
+
+    # -----------------------------------------
+    # Cache disque
+    # -----------------------------------------
+    def _cache_path(self, name: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        safe = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in name)
+        return self.cache_dir / f"runs_{safe}.pkl"
+
+    def _load_disk_cache(self, name: str) -> Optional[Tuple[float, pd.DataFrame]]:
+        path = self._cache_path(name)
+        if path is None or not path.exists():
+            return None
+        try:
+            return path.stat().st_mtime, pd.read_pickle(path)
+        except Exception as exc:  # cache corrompu : ignoré
+            self.logger.warning(f"Cache des runs illisible, ignoré : {exc}")
+            return None
+
+    def _save_disk_cache(self, name: str, entry: Tuple[float, pd.DataFrame]) -> None:
+        path = self._cache_path(name)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry[1].to_pickle(path)
@@ -1,6 +1,9 @@
 # health_lifestyle_diabetes/application/use_cases/apply_feature_engineering_uc.py
 
+from typing import Optional
+
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
 from health_lifestyle_diabetes.infrastructure.feature_engineering.pipeline_feature_engineering import (
     FeatureEngineeringPipeline,
 )
@@ -17,9 +20,11 @@ class ApplyFeatureEngineeringUseCase:
         self,
         pipeline: FeatureEngineeringPipeline,
         logger: LoggerPort,
+        tracer: Optional[TracerPort] = None,
     ):
         self.pipeline = pipeline
         self.logger = logger
+        self.tracer = tracer or NullTracer()
 
     def execute(self, dataset: DataFrame) -> DataFrame:
         """
@@ -42,7 +47,9 @@ class ApplyFeatureEngineeringUseCase:
             f"colonnes_initiales={dataset.shape[1]}"
         )
 
-        enriched_dataset = self.pipeline.transform(dataset)
+        with self.tracer.span("apply_feature_engineering", rows=dataset.shape[0]) as span:
+            enriched_dataset = self.pipeline.transform(dataset)
+            span.set_attribute("columns", enriched_dataset.shape[1])
 
         self.logger.info(
             "Feature engineering terminé | "
@@ -0,0 +1,231 @@
+# src/health_lifestyle_diabetes/application/use_cases/cross_validate_model_uc.py
+
+import os
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from health_lifestyle_diabetes.domain.entities.cross_validation_results import (
+    CrossValidationResults,
+)
+from health_lifestyle_diabetes.domain.ports.cross_validation_splitter_port import (
+    CrossValidationSplitterPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
+from health_lifestyle_diabetes.domain.ports.model_trainer_port import ModelTrainerPort
+from health_lifestyle_diabetes.domain.services.evaluation_service import (
+    EvaluationService,
+)
+
+# ---------------------------------------------------------------------
+# État des processus workers (initialisé une seule fois par worker pour
+# éviter de re-sérialiser le dataset complet à chaque fold).
+# ---------------------------------------------------------------------
+_WORKER_STATE: dict = {}
+
+
+def _init_fold_worker(
+    trainer: ModelTrainerPort,
+    X: DataFrame,
+    y: Any,
+    oof_path: str,
+    oof_shape: Tuple[int, int],
+) -> None:
+    _WORKER_STATE.update(
+        trainer=trainer, X=X, y=y, oof_path=oof_path, oof_shape=oof_shape
+    )
+
+
+def _fit_fold(
+    repeat: int, fold: int, train_idx: np.ndarray, valid_idx: np.ndarray
+) -> Tuple[int, int, int]:
+    """
+    Entraîne un fold et écrit ses probabilités directement dans le memmap OOF.
+    """
+    X, y = _WORKER_STATE["X"], _WORKER_STATE["y"]
+
+    model = _WORKER_STATE["trainer"].train(X.iloc[train_idx], y.iloc[train_idx])
+    proba = model.predict_proba(X.iloc[valid_idx])[:, 1]
+
+    oof = np.memmap(
+        _WORKER_STATE["oof_path"],
+        dtype=np.float32,
+        mode="r+",
+        shape=_WORKER_STATE["oof_shape"],
+    )
+    oof[repeat, valid_idx] = proba
+    oof.flush()
+    del oof
+
+    return repeat, fold, len(valid_idx)
+
+
+class CrossValidateModelUseCase:
+    """
+    Use case de validation croisée avec entraînement parallèle des folds.
+
+    Responsabilités :
+    -----------------
+    - générer les folds via le CrossValidationSplitterPort (indices seulement),
+    - entraîner chaque fold dans un processus worker (n_jobs > 1),
+    - stocker les probabilités out-of-fold dans un memmap float32,
+    - calculer les métriques une seule fois sur le vecteur OOF.
+
+    Le memmap OOF est conservé uniquement si `oof_dir` est fourni ; sinon
+    il est créé dans le répertoire temporaire puis supprimé dès que les
+    probabilités sont relues (y compris en cas d'échec d'un fold).
+
+    Notes
+    -----
+    Avec n_jobs > 1, penser à limiter les threads internes du modèle
+    (nthread / thread_count / n_jobs) pour éviter la sur-souscription CPU.
+    """
+
+    def __init__(
+        self,
+        splitter: CrossValidationSplitterPort,
+        trainer: ModelTrainerPort,
+        evaluation_service: EvaluationService,
+        logger: LoggerPort,
+        n_jobs: int = 1,
+        oof_dir: Optional[Path] = None,
+        tracer: Optional[TracerPort] = None,
+    ):
+        self.splitter = splitter
+        self.trainer = trainer
+        self.evaluation_service = evaluation_service
+        self.logger = logger
+        self.n_jobs = n_jobs
+        self.oof_dir = Path(oof_dir) if oof_dir else None
+        self.tracer = tracer or NullTracer()
+
+    # ------------------------------------------------------------------
+    def execute(
+        self,
+        dataset: DataFrame,
+        *,
+        feature_columns: Sequence[str],
+        target_column: str,
+    ) -> CrossValidationResults:
+        """
+        Exécute la validation croisée complète.
+
+        Parameters
+        ----------
+        dataset : DataFrame
+            Dataset contenant features et cible.
+        feature_columns : sequence[str]
+            Features utilisées pour l'entraînement.
+        target_column : str
+            Colonne cible binaire.
+
+        Returns
+        -------
+        CrossValidationResults
+            Métriques OOF et chemin du memmap des probabilités (None si
+            aucun `oof_dir` n'a été fourni : fichier temporaire supprimé).
+        """
+        n_splits, n_repeats = self.splitter.n_splits, self.splitter.n_repeats
+        self.logger.info(
+            "Démarrage de la validation croisée | "
+            f"n_splits={n_splits} | n_repeats={n_repeats} | n_jobs={self.n_jobs}"
+        )
+
+        # Conversion catégorielle unique : catégories cohérentes entre folds.
+        X = dataset[list(feature_columns)]
+        object_cols = X.select_dtypes(exclude="number").columns
+        if len(object_cols) > 0:
+            X = X.astype({col: "category" for col in object_cols})
+        y = dataset[target_column]
+
+        keep_oof = self.oof_dir is not None
+        oof_dir = self.oof_dir if keep_oof else Path(tempfile.gettempdir())
+        oof_dir.mkdir(parents=True, exist_ok=True)
+        oof_path = str(oof_dir / f"oof_{uuid.uuid4().hex}.float32")
+        oof_shape = (n_repeats, len(dataset))
+        oof = np.memmap(oof_path, dtype=np.float32, mode="w+", shape=oof_shape)
+        oof[:] = np.nan
+        oof.flush()
+        del oof
+
+        try:
+            fold_sizes, oof_proba = self._fit_folds(dataset, X, y, oof_path, oof_shape)
+        finally:
+            if not keep_oof:
+                Path(oof_path).unlink(missing_ok=True)
+
+        if np.isnan(oof_proba).any():
+            raise ValueError("Certaines lignes n'ont reçu aucune prédiction out-of-fold.")
+
+        with self.tracer.span("cross_validate.evaluate", n_samples=len(oof_proba)):
+            evaluation = self.evaluation_service.evaluate(
+                y_true=y.to_numpy(),
+                y_proba=oof_proba,
+            )
+
+        self.logger.info(
+            "Validation croisée terminée | "
+            f"AUC_OOF={evaluation.auc_roc:.4f} | F1_OOF={evaluation.f1:.4f} | "
+            f"oof_path={oof_path if keep_oof else None}"
+        )
+
+        return CrossValidationResults(
+            evaluation=evaluation,
+            oof_path=oof_path if keep_oof else None,
+            n_splits=n_splits,
+            n_repeats=n_repeats,
+            fold_sizes=tuple(fold_sizes),
+        )
+
+    # ------------------------------------------------------------------
+    def _fit_folds(
+        self,
+        dataset: DataFrame,
+        X: DataFrame,
+        y: Any,
+        oof_path: str,
+        oof_shape: Tuple[int, int],
+    ) -> Tuple[List[int], np.ndarray]:
+        """
+        Entraîne tous les folds (memmap OOF rempli par les workers) et
+        retourne la taille de chaque fold et la moyenne OOF en mémoire.
+        """
+        folds = list(self.splitter.split_folds(dataset))
+        init_args = (self.trainer, X, y, oof_path, oof_shape)
+
+        fold_sizes: List[int] = []
+        # En mode processus, seuls les spans du processus courant sont mesurés
+        # (durée totale des folds, pas le détail par fold).
+        with self.tracer.span("cross_validate.folds", n_folds=len(folds), n_jobs=self.n_jobs):
+            if self.n_jobs == 1:
+                _init_fold_worker(*init_args)
+                for repeat, fold, train_idx, valid_idx in folds:
+                    with self.tracer.span("fold", repeat=repeat, fold=fold):
+                        fold_sizes.append(_fit_fold(repeat, fold, train_idx, valid_idx)[2])
+                    self.logger.debug(f"Fold terminé | repeat={repeat} | fold={fold}")
+            else:
+                max_workers = min(
+                    self.n_jobs if self.n_jobs > 0 else os.cpu_count() or 1, len(folds)
+                )
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_fold_worker,
+                    initargs=init_args,
+                ) as executor:
+                    futures = [executor.submit(_fit_fold, *fold) for fold in folds]
+                    for future in futures:
+                        repeat, fold, size = future.result()
+                        fold_sizes.append(size)
+                        self.logger.debug(f"Fold terminé | repeat={repeat} | fold={fold}")
+
+        # Moyenne des répétitions → un seul vecteur OOF pour les métriques.
+        oof = np.memmap(oof_path, dtype=np.float32, mode="r", shape=oof_shape)
+        oof_proba = np.asarray(oof.mean(axis=0))
+        del oof
+        return fold_sizes, oof_proba
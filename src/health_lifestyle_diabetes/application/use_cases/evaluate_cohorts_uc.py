@@ -0,0 +1,95 @@
+# src/health_lifestyle_diabetes/application/use_cases/evaluate_cohorts_uc.py
+
+from typing import Any, Optional, Sequence
+
+from health_lifestyle_diabetes.domain.entities.decision_threshold_policy import (
+    DecisionThresholdPolicy,
+)
+from health_lifestyle_diabetes.domain.ports.cohort_metrics_port import (
+    CohortMetricsPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
+
+# Cohortes auditées par défaut (équité & dérive).
+DEFAULT_SLICE_COLUMNS = (
+    "age_group",
+    "gender",
+    "ethnicity",
+    "income_level",
+    "bmi_category",
+)
+
+
+class EvaluateCohortsUseCase:
+    """
+    Use case d'évaluation par cohorte (sliced evaluation).
+
+    Responsabilités :
+    -----------------
+    - appliquer le seuil de décision métier,
+    - calculer les métriques de toutes les cohortes en une passe groupée,
+    - retourner une table « tidy » (une ligne par slice).
+    """
+
+    def __init__(
+        self,
+        cohort_metrics: CohortMetricsPort,
+        decision_threshold: DecisionThresholdPolicy,
+        logger: LoggerPort,
+        tracer: Optional[TracerPort] = None,
+    ):
+        self.cohort_metrics = cohort_metrics
+        self.decision_threshold = decision_threshold
+        self.logger = logger
+        self.tracer = tracer or NullTracer()
+
+    def execute(
+        self,
+        dataset: Any,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        *,
+        slice_columns: Optional[Sequence[str]] = None,
+        min_slice_size: int = 0,
+    ) -> Any:
+        """
+        Parameters
+        ----------
+        dataset : Any
+            Table contenant les colonnes de cohorte, alignée sur y_true / y_proba.
+        y_true : sequence[int]
+            Labels réels.
+        y_proba : sequence[float]
+            Probabilités prédites.
+        slice_columns : sequence[str] | None
+            Colonnes de cohorte (défaut : DEFAULT_SLICE_COLUMNS).
+        min_slice_size : int
+            Effectif minimal pour conserver une slice dans le résultat.
+
+        Returns
+        -------
+        Any
+            Table des métriques par (slice_column, slice_value).
+        """
+        slice_columns = list(slice_columns or DEFAULT_SLICE_COLUMNS)
+        self.logger.info(
+            f"Démarrage de l'évaluation par cohorte | colonnes={slice_columns} | "
+            f"seuil={self.decision_threshold.threshold}"
+        )
+
+        with self.tracer.span("evaluate_cohorts", n_samples=len(y_true)) as span:
+            table = self.cohort_metrics.compute_cohort_metrics(
+                dataset,
+                slice_columns=slice_columns,
+                y_true=y_true,
+                y_proba=y_proba,
+                threshold=self.decision_threshold.threshold,
+            )
+            span.set_attribute("slices", len(table))
+
+        if min_slice_size > 0:
+            table = table[table["n"] >= min_slice_size].reset_index(drop=True)
+
+        self.logger.info(f"Évaluation par cohorte terminée | slices={len(table)}")
+        return table
@@ -4,6 +4,7 @@ from typing import Optional, Sequence
 
 from health_lifestyle_diabetes.domain.entities.metrics import EvaluationResults
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
 from health_lifestyle_diabetes.domain.services.evaluation_service import (
     EvaluationService,
 )
@@ -31,9 +32,11 @@ class EvaluateModelUseCase:
         self,
         evaluation_service: EvaluationService,
         logger: LoggerPort,
+        tracer: Optional[TracerPort] = None,
     ):
         self.evaluation_service = evaluation_service
         self.logger = logger
+        self.tracer = tracer or NullTracer()
 
 
 
@@ -85,10 +88,11 @@ class EvaluateModelUseCase:
         # Évaluation métier
         # ------------------------------------------------------------------
         self.logger.info("Lancement du service d'évaluation métier.")
-        results = self.evaluation_service.evaluate(
-            y_true=y_true,
-            y_proba=y_proba,
-        )
+        with self.tracer.span("evaluate_model", n_samples=len(y_true)):
+            results = self.evaluation_service.evaluate(
+                y_true=y_true,
+                y_proba=y_proba,
+            )
 
         self.logger.info(
             "Évaluation terminée | "
@@ -112,11 +116,12 @@ class EvaluateModelUseCase:
                 f"title='{plot_title}'"
             )
 
-            self.evaluation_service.plotter(
-                metrics=results.extra_metrics or {},
-                title=plot_title,
-                selected_metrics=selected_metrics,
-            )
+            with self.tracer.span("evaluate_model.plot"):
+                self.evaluation_service.plotter(
+                    metrics=results.extra_metrics or {},
+                    title=plot_title,
+                    selected_metrics=selected_metrics,
+                )
 
             self.logger.info("Visualisation des métriques terminée.")
         else:
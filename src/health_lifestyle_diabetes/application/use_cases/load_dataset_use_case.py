@@ -1,7 +1,10 @@
+from typing import Any, Optional
+
 from health_lifestyle_diabetes.domain.ports.dataset_repository_port import (
     DatasetRepositoryPort,
 )
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
 from pandas import DataFrame
 
 
@@ -10,12 +13,34 @@ class LoadDatasetUseCase:
     Use Case : Charger un dataset depuis la source configurée.
     """
 
-    def __init__(self, repository: DatasetRepositoryPort, logger: LoggerPort):
+    def __init__(
+        self,
+        repository: DatasetRepositoryPort,
+        logger: LoggerPort,
+        tracer: Optional[TracerPort] = None,
+    ):
         self.repository = repository
         self.logger = logger
+        self.tracer = tracer or NullTracer()
 
     def execute(self) -> DataFrame:
         self.logger.info("Démarrage du chargement du dataset...")
-        data = self.repository.load_dataset()
+        with self.tracer.span("load_dataset") as span:
+            data = self.repository.load_dataset()
+            span.set_attribute("rows", data.shape[0])
         self.logger.info(f"Dataset chargé : {data.shape[0]} lignes, {data.shape[1]} colonnes.")
         return data
+
+    def execute_since(self, watermark: Any, watermark_column: str) -> DataFrame:
+        """
+        Charge uniquement le delta de lignes postérieures au watermark
+        du dernier entraînement (ré-entraînement incrémental / warm-start).
+        """
+        self.logger.info(
+            f"Démarrage du chargement incrémental ({watermark_column} > {watermark})..."
+        )
+        with self.tracer.span("load_dataset_since", watermark_column=watermark_column) as span:
+            data = self.repository.load_dataset_since(watermark, watermark_column)
+            span.set_attribute("rows", data.shape[0])
+        self.logger.info(f"Delta chargé : {data.shape[0]} lignes, {data.shape[1]} colonnes.")
+        return data
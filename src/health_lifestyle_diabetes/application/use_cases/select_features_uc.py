@@ -0,0 +1,140 @@
+# src/health_lifestyle_diabetes/application/use_cases/select_features_uc.py
+
+from typing import List, Optional, Sequence
+
+from health_lifestyle_diabetes.domain.entities.feature_selection_result import (
+    FeatureSelectionResult,
+    FeatureSelectionStep,
+)
+from health_lifestyle_diabetes.domain.ports.feature_subset_evaluator_port import (
+    FeatureSubsetEvaluatorPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
+from health_lifestyle_diabetes.domain.ports.selected_features_repository_port import (
+    SelectedFeaturesRepositoryPort,
+)
+
+
+class SelectFeaturesUseCase:
+    """
+    Use case de sélection automatique des features (élimination backward).
+
+    Algorithme :
+    ------------
+    À chaque étape, les `n_candidates` features les moins importantes du
+    modèle proxy courant sont candidates au retrait ; les sous-ensembles
+    correspondants sont évalués en parallèle et le meilleur est conservé.
+    La recherche s'arrête à `min_features` ou après `patience` étapes sans
+    rester dans la tolérance du meilleur score.
+
+    Le sous-ensemble retenu est le plus petit dont le score est à moins de
+    `tolerance` du meilleur score observé (parcimonie), puis il est
+    persisté comme artefact versionné.
+    """
+
+    def __init__(
+        self,
+        evaluator: FeatureSubsetEvaluatorPort,
+        repository: SelectedFeaturesRepositoryPort,
+        logger: LoggerPort,
+        *,
+        n_candidates: int = 5,
+        min_features: int = 5,
+        tolerance: float = 0.001,
+        patience: int = 3,
+        tracer: Optional[TracerPort] = None,
+    ):
+        self.evaluator = evaluator
+        self.repository = repository
+        self.logger = logger
+        self.n_candidates = n_candidates
+        self.min_features = min_features
+        self.tolerance = tolerance
+        self.patience = patience
+        self.tracer = tracer or NullTracer()
+
+    def execute(
+        self,
+        candidate_features: Sequence[str],
+        *,
+        save: bool = True,
+    ) -> FeatureSelectionResult:
+        """
+        Parameters
+        ----------
+        candidate_features : sequence[str]
+            Features de départ (ex: NUMERICAL_FEATURES + CATEGORICAL_FEATURES).
+        save : bool
+            Persiste le résultat via le repository.
+
+        Returns
+        -------
+        FeatureSelectionResult
+            Sous-ensemble retenu, score et historique de la recherche.
+        """
+        current: List[str] = list(dict.fromkeys(candidate_features))
+        self.logger.info(
+            f"Démarrage de la sélection de features | candidates={len(current)} | "
+            f"min_features={self.min_features} | tolérance={self.tolerance}"
+        )
+
+        with self.tracer.span("select_features.step", n_features=len(current)):
+            (score, importances), = self.evaluator.evaluate_many([current])
+        history = [FeatureSelectionStep(n_features=len(current), score=score)]
+        subsets = {len(current): list(current)}
+        best_score = score
+        stale_steps = 0
+
+        while len(current) > self.min_features and stale_steps < self.patience:
+            weakest = sorted(current, key=lambda f: importances.get(f, 0.0))[: self.n_candidates]
+            candidates = [[f for f in current if f != removed] for removed in weakest]
+            with self.tracer.span(
+                "select_features.step", n_features=len(current), n_subsets=len(candidates)
+            ):
+                results = self.evaluator.evaluate_many(candidates)
+
+            best_idx = max(range(len(results)), key=lambda i: results[i][0])
+            score, importances = results[best_idx]
+            current = candidates[best_idx]
+            history.append(
+                FeatureSelectionStep(
+                    n_features=len(current), score=score, removed_feature=weakest[best_idx]
+                )
+            )
+            subsets[len(current)] = list(current)
+
+            self.logger.info(
+                f"Sélection | n_features={len(current)} | score={score:.5f} | "
+                f"retirée='{weakest[best_idx]}'"
+            )
+
+            best_score = max(best_score, score)
+            stale_steps = 0 if score >= best_score - self.tolerance else stale_steps + 1
+
+        # Parcimonie : plus petit sous-ensemble dans la tolérance du meilleur score.
+        retained = min(
+            (step for step in history if step.score >= best_score - self.tolerance),
+            key=lambda step: step.n_features,
+        )
+
+        result = FeatureSelectionResult(
+            features=tuple(subsets[retained.n_features]),
+            score=retained.score,
+            metric=getattr(self.evaluator, "metric", "score"),
+            candidate_features=tuple(candidate_features),
+            history=tuple(history),
+        )
+        self.logger.info(
+            f"Sélection terminée | n_features={len(result.features)} | "
+            f"score={result.score:.5f} | meilleur={best_score:.5f}"
+        )
+
+        if save:
+            with self.tracer.span("select_features.save"):
+                result = self.repository.save(result)
+        return result
+
+    def load_selected_features(self) -> Optional[List[str]]:
+        """Dernière liste de features persistée (None si aucune)."""
+        return self.repository.load()
@@ -1,37 +1,63 @@
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
+import numpy as np
+
+from health_lifestyle_diabetes.domain.entities.split_indices import SplitIndices
 from health_lifestyle_diabetes.domain.ports.dataset_splitter_port import (
     DatasetSplitterPort,
 )
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import (
-    YamlConfigLoader,
-)
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
+
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
+
 
-# Get repository root path
-root = get_repository_root()
+def default_split_paths(settings: Optional["AppSettings"] = None) -> Dict[str, Path]:
+    """Chemins train/test par défaut (configs/paths.yaml), résolus à la demande."""
+    inputs = (settings or get_settings()).paths.data.input
+    return {
+        "train": inputs.train_dataset,
+        "test": inputs.test_dataset,
+        "train_indices": inputs.train_indices,
+        "test_indices": inputs.test_indices,
+        "fingerprint": inputs.split_fingerprint,
+    }
 
-# Load configuration
-config_loader = YamlConfigLoader()
-paths = config_loader.load_config(f"{root}/configs/paths.yaml")
-# Define train and test dataset paths
-PATHS : Dict[str, Path] = {
-    "train": root / Path(paths["data"]["input"]["train_dataset"]),
-    "test": root / Path(paths["data"]["input"]["test_dataset"]),
-}
+
+def __getattr__(name: str):
+    """Constantes de chemin résolues à la demande (PEP 562), sans effet de bord à l'import."""
+    if name == "PATHS":
+        return default_split_paths()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class SplitDatasetUseCase:
     """
     Use case : Splitter un dataset selon la config chargée.
+
+    Les copies CSV train/test ne sont écrites que si `save=True` est
+    demandé explicitement ; le mode index (`execute_indices`) ne persiste
+    que les positions de lignes (.npy) et l'empreinte du split.
     """
 
-    def __init__(self, splitter: DatasetSplitterPort, logger: LoggerPort, save: bool = True, save_paths: Optional[Dict[str, Path]] = None):
+    def __init__(
+        self,
+        splitter: DatasetSplitterPort,
+        logger: LoggerPort,
+        save: bool = False,
+        save_paths: Optional[Dict[str, Path]] = None,
+        save_indices: bool = True,
+        settings: Optional["AppSettings"] = None,
+        tracer: Optional[TracerPort] = None,
+    ):
         self.splitter = splitter
         self.logger = logger
+        self.tracer = tracer or NullTracer()
         self.save = save
-        self.save_paths = save_paths or PATHS
+        self.save_paths = {**default_split_paths(settings), **(save_paths or {})}
+        self.save_indices = save_indices
 
     def execute(self, df: Any) -> Tuple[Any, Any]:
         """
@@ -40,15 +66,48 @@ class SplitDatasetUseCase:
 
         self.logger.info("Démarrage du split dataset...")
 
-        train_df, test_df = self.splitter.split(df)
+        with self.tracer.span("split_dataset", rows=len(df)):
+            train_df, test_df = self.splitter.split(df)
 
         self.logger.info(f"Split terminé : "
                          f"train={train_df.shape}, test={test_df.shape}")
         if self.save:
             self.logger.info("Sauvegarde des datasets splittés...")
-            # Implémenter la logique de sauvegarde ici si nécessaire.
-            train_df.to_csv(PATHS["train"], index=False)
-            test_df.to_csv(PATHS["test"], index=False)
+            with self.tracer.span("split_dataset.save"):
+                self.save_paths["train"].parent.mkdir(parents=True, exist_ok=True)
+                train_df.to_csv(self.save_paths["train"], index=False)
+                test_df.to_csv(self.save_paths["test"], index=False)
             self.logger.info("Datasets sauvegardés avec succès.")
 
-        return train_df, test_df
\ No newline at end of file
+        return train_df, test_df
+
+    def execute_indices(self, df: Any) -> SplitIndices:
+        """
+        Applique le split en mode index : aucune copie du dataset.
+
+        Retourne les positions train/test (à utiliser via df.iloc[...])
+        et, si `save_indices=True`, les persiste au format .npy avec
+        l'empreinte du split.
+        """
+
+        self.logger.info("Démarrage du split dataset (mode index)...")
+
+        with self.tracer.span("split_dataset_indices", rows=len(df)):
+            indices = self.splitter.split_indices(df)
+
+        self.logger.info(
+            f"Split terminé : train={len(indices.train)}, test={len(indices.test)} | "
+            f"fingerprint={indices.fingerprint}"
+        )
+        if self.save_indices:
+            self.logger.info("Sauvegarde des indices du split...")
+            with self.tracer.span("split_dataset_indices.save"):
+                self.save_paths["train_indices"].parent.mkdir(parents=True, exist_ok=True)
+                np.save(self.save_paths["train_indices"], indices.train)
+                np.save(self.save_paths["test_indices"], indices.test)
+                self.save_paths["fingerprint"].write_text(
+                    indices.fingerprint, encoding="utf-8"
+                )
+            self.logger.info("Indices sauvegardés avec succès.")
+
+        return indices
@@ -0,0 +1,32 @@
+"""
+Entité métier regroupant le résultat d'une validation croisée.
+
+Les métriques sont calculées une seule fois sur le vecteur de
+probabilités out-of-fold (OOF), ce qui donne une estimation plus stable
+qu'une moyenne de métriques par fold.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from health_lifestyle_diabetes.domain.entities.metrics import EvaluationResults
+
+
+@dataclass(frozen=True)
+class CrossValidationResults:
+    """
+    Résultats d'une validation croisée (K-fold, éventuellement répétée).
+    """
+
+    # Métriques calculées sur les probabilités OOF
+    evaluation: EvaluationResults
+
+    # Fichier memmap float32 (n_repeats, n_samples) des probabilités OOF ;
+    # None si le fichier était temporaire (supprimé après les métriques)
+    oof_path: Optional[str]
+
+    n_splits: int
+    n_repeats: int
+
+    # Taille de chaque fold de validation, dans l'ordre de génération
+    fold_sizes: Tuple[int, ...] = ()
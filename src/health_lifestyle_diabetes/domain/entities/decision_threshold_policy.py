@@ -16,8 +16,16 @@ Exemples de politiques :
 - Diagnostic : seuil élevé → minimiser les faux positifs
 """
 
+import math
 from dataclasses import dataclass
 
+from health_lifestyle_diabetes.domain.entities.threshold_selection import (
+    ThresholdSelection,
+)
+
+# Seuil strictement supérieur à toute probabilité : aucun cas positif.
+NEVER_POSITIVE_THRESHOLD = math.nextafter(1.0, math.inf)
+
 
 @dataclass(frozen=True)
 class DecisionThresholdPolicy:
@@ -26,14 +34,19 @@ class DecisionThresholdPolicy:
 
     Cette classe représente une règle métier stable,
     indépendante du modèle et des outils techniques.
+
+    La décision est `y_proba >= threshold` : un seuil de 0 classe tous les
+    cas positifs, NEVER_POSITIVE_THRESHOLD (juste au-dessus de 1) n'en
+    classe aucun.
     """
 
     threshold: float
 
     def __post_init__(self):
-        if not 0.0 < self.threshold < 1.0:
+        if not 0.0 <= self.threshold <= NEVER_POSITIVE_THRESHOLD:
             raise ValueError(
-                "Le seuil de décision doit être compris strictement entre 0 et 1."
+                "Le seuil de décision doit être compris entre 0 et 1 "
+                "(ou valoir NEVER_POSITIVE_THRESHOLD)."
             )
 
     # ------------------------------------------------------------------
@@ -66,4 +79,16 @@ class DecisionThresholdPolicy:
 
         Compromis entre précision et rappel.
         """
-        return cls(threshold=0.50)
\ No newline at end of file
+        return cls(threshold=0.50)
+
+    @classmethod
+    def from_selection(cls, selection: ThresholdSelection) -> "DecisionThresholdPolicy":
+        """
+        Politique issue d'une optimisation de seuil (F1, Youden, coût...).
+
+        Le seuil est repris tel quel (sans arrondi ni bornage) : appliqué
+        aux mêmes probabilités, il reproduit les tp / fp / tn / fn de la
+        sélection, y compris le seuil sentinelle « aucun positif »
+        au-dessus de max(proba), ramené au plus à NEVER_POSITIVE_THRESHOLD.
+        """
+        return cls(threshold=min(selection.threshold, NEVER_POSITIVE_THRESHOLD))
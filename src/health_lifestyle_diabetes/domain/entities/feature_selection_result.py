@@ -0,0 +1,35 @@
+"""
+Entité métier décrivant le résultat d'une sélection automatique de features.
+
+L'historique conserve, pour chaque étape d'élimination, la taille du
+sous-ensemble, son score de validation et la feature retirée : il permet
+de justifier le compromis parcimonie / performance retenu.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class FeatureSelectionStep:
+    """
+    Une étape de la recherche (sous-ensemble courant après retrait).
+    """
+
+    n_features: int
+    score: float
+    removed_feature: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class FeatureSelectionResult:
+    """
+    Sous-ensemble de features retenu et traçabilité de la recherche.
+    """
+
+    features: Tuple[str, ...]
+    score: float
+    metric: str
+    candidate_features: Tuple[str, ...]
+    history: Tuple[FeatureSelectionStep, ...] = ()
+    version: Optional[int] = None
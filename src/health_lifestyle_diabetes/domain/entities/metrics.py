@@ -11,10 +11,21 @@ MCC & Kappa :
 Ce sont des métriques **techniques** utilisées surtout par les data scientists.
 Elles ont **peu de valeur en décision clinique**, mais apportent une
 information supplémentaire sur la robustesse du modèle (déséquilibre, accord).
+
+Calibration :
+-------------
+ECE / MCE / Brier / log-loss mesurent l'adéquation entre probabilités
+prédites et fréquences observées ; renseignées si un port de métriques de
+calibration est configuré.
+
+Intervalles de confiance :
+--------------------------
+Optionnels, obtenus par bootstrap. Ils permettent de juger si un écart
+entre deux runs (ex: +0.002 d'AUC) dépasse le bruit d'échantillonnage.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -39,5 +50,14 @@ class EvaluationResults:
     kappa: Optional[float] = None  # technique, faible usage clinique direct
     mcc: Optional[float] = None  # technique, utile en cas de déséquilibre
 
+    # Métriques de calibration (optionnelles)
+    ece: Optional[float] = None
+    mce: Optional[float] = None
+    brier_score: Optional[float] = None
+    log_loss: Optional[float] = None
+
     # Pour attacher toute autre métrique calculée par l'infrastructure
     extra_metrics: Optional[Dict[str, float]] = None
+
+    # Intervalles de confiance bootstrap {métrique: (borne_basse, borne_haute)}
+    confidence_intervals: Optional[Dict[str, Tuple[float, float]]] = None
@@ -0,0 +1,31 @@
+"""
+Entité métier décrivant l'explication locale d'une prédiction.
+
+Chaque explication liste les principales contributions (valeurs SHAP)
+d'un enregistrement scoré : la somme `base_value + Σ contributions`
+(toutes features confondues) vaut la marge brute du modèle (log-odds).
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class FeatureContribution:
+    """
+    Contribution d'une feature à une prédiction.
+    """
+
+    feature: str
+    contribution: float
+
+
+@dataclass(frozen=True)
+class PredictionExplanation:
+    """
+    Top-k contributions d'un enregistrement scoré.
+    """
+
+    base_value: float
+    contributions: Tuple[FeatureContribution, ...]
+    from_cache: bool = False
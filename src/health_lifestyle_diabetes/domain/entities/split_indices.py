@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class SplitIndices:
+    """
+    Résultat d'un split train/test exprimé en positions de lignes.
+
+    Aucune copie du dataset n'est faite : le consommateur prend ses vues
+    (ex: df.iloc[split.train]) au moment où il en a besoin.
+
+    Attributes
+    ----------
+    train : Any
+        Positions entières des lignes d'entraînement (ex: np.ndarray).
+    test : Any
+        Positions entières des lignes de test.
+    fingerprint : str
+        Empreinte déterministe (sha256) du split : mêmes données et mêmes
+        paramètres ⇒ même empreinte. Permet de vérifier qu'un entraînement
+        et une évaluation utilisent bien le même découpage.
+    """
+
+    train: Any
+    test: Any
+    fingerprint: str
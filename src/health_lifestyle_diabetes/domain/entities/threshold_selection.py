@@ -0,0 +1,29 @@
+"""
+Entité métier décrivant un seuil de décision optimisé.
+
+Elle est produite par un ThresholdOptimizerPort à partir des probabilités
+d'un jeu de validation, et peut être convertie en DecisionThresholdPolicy.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ThresholdSelection:
+    """
+    Seuil retenu pour un objectif donné, avec la matrice de confusion associée.
+    """
+
+    threshold: float
+    objective: str  # f1 | youden | recall_floor | cost
+    score: float  # valeur de l'objectif au seuil retenu
+
+    precision: float
+    recall: float
+    specificity: float
+    f1: float
+
+    tp: int
+    fp: int
+    tn: int
+    fn: int
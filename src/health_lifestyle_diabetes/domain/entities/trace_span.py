@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class TraceSpan:
+    """
+    Mesure d'une étape chronométrée (span), éventuellement imbriquée.
+
+    Attributes
+    ----------
+    name : str
+        Nom de l'étape (ex: "feature_engineering.demographics").
+    path : str
+        Chemin complet depuis le span racine, séparé par "/"
+        (ex: "apply_feature_engineering/feature_engineering.demographics").
+    depth : int
+        Profondeur d'imbrication (0 pour un span racine).
+    attributes : dict
+        Attributs libres (nombre de lignes, modèle, ...).
+    duration_s : float
+        Durée mesurée (secondes), renseignée à la fermeture du span.
+    peak_memory_bytes : int | None
+        Pic de mémoire Python allouée pendant le span, au-delà de la mémoire
+        au démarrage (tracemalloc) ; None si la mesure mémoire est désactivée.
+    status : str
+        "ok", ou "error" si une exception a traversé le span.
+    """
+
+    name: str
+    path: str
+    depth: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    duration_s: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+    status: str = "ok"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ajoute un attribut (ex: taille du résultat, connue en fin d'étape)."""
+        self.attributes[key] = value
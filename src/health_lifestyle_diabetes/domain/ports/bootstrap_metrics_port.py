@@ -0,0 +1,31 @@
+from typing import Dict, Optional, Protocol, Sequence, Tuple
+
+
+class BootstrapMetricsPort(Protocol):
+    """
+    Port définissant un service capable d'estimer la variabilité des
+    métriques de classification par rééchantillonnage bootstrap.
+
+    L'infrastructure fournit l'implémentation (ex: NumpyBootstrapMetricsAdapter).
+    """
+
+    def compute_confidence_intervals(
+        self,
+        y_true: Sequence[int],
+        y_pred: Sequence[int],
+        y_proba: Sequence[float],
+        *,
+        n_resamples: int = 1000,
+        confidence_level: float = 0.95,
+        random_state: Optional[int] = None,
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        Calcule les intervalles de confiance percentile des métriques.
+
+        Retour
+        ------
+        Dict[str, Tuple[float, float]]
+            Exemple : {"auc_roc": (0.912, 0.927), "f1": (0.801, 0.823), ...}
+            Les clés reprennent les noms de champs d'EvaluationResults.
+        """
+        ...
@@ -0,0 +1,51 @@
+from typing import Any, Dict, Mapping, Protocol, Sequence
+
+
+class CalibrationMetricsPort(Protocol):
+    """
+    Port définissant un service capable de mesurer la calibration des
+    probabilités prédites (ECE, MCE, Brier, log-loss, table de fiabilité).
+
+    L'infrastructure fournit l'implémentation (ex: NumpyCalibrationMetricsAdapter).
+    """
+
+    def compute_calibration_metrics(
+        self,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        *,
+        n_bins: int = 10,
+    ) -> Dict[str, float]:
+        """
+        Retour
+        ------
+        Dict[str, float]
+            Clés : "ece", "mce", "brier_score", "log_loss".
+        """
+        ...
+
+    def compare_calibration(
+        self,
+        y_true: Sequence[int],
+        probas: Mapping[str, Sequence[float]],
+        *,
+        n_bins: int = 10,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Calcule les métriques de calibration de plusieurs vecteurs de
+        probabilités en un seul passage (ex: {"before": ..., "after": ...}).
+        """
+        ...
+
+    def reliability_table(
+        self,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        *,
+        n_bins: int = 10,
+    ) -> Any:
+        """
+        Table de fiabilité : une ligne par bin (bornes, effectif,
+        probabilité moyenne, fréquence observée, écart).
+        """
+        ...
@@ -0,0 +1,43 @@
+from typing import Any, Protocol, Sequence
+
+
+class CohortMetricsPort(Protocol):
+    """
+    Port définissant un service capable de calculer les métriques de
+    classification par sous-population (cohorte / slice).
+
+    Usage : audit d'équité (genre, ethnicité, revenu...) et détection de
+    dérive sur des segments de patients.
+    """
+
+    def compute_cohort_metrics(
+        self,
+        dataset: Any,
+        *,
+        slice_columns: Sequence[str],
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        threshold: float,
+    ) -> Any:
+        """
+        Calcule les métriques de chaque modalité de chaque colonne de slice.
+
+        Paramètres
+        ----------
+        dataset : Any
+            Table contenant les colonnes de slice (alignée sur y_true / y_proba).
+        slice_columns : sequence[str]
+            Colonnes définissant les cohortes (ex: "gender", "age_group").
+        y_true : séquence d'entiers
+            Labels réels (0/1).
+        y_proba : séquence de flottants
+            Probabilités prédites.
+        threshold : float
+            Seuil de décision appliqué pour les métriques à seuil.
+
+        Retour
+        ------
+        Any
+            Table « tidy » : une ligne par (slice_column, slice_value).
+        """
+        ...
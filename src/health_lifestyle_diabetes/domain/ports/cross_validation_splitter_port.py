@@ -0,0 +1,35 @@
+# src/health_lifestyle_diabetes/domain/ports/cross_validation_splitter_port.py
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Protocol, Tuple
+
+
+class CrossValidationSplitterPort(Protocol):
+    """
+    Port décrivant le contrat d'un service de validation croisée.
+
+    Contrairement à DatasetSplitterPort, aucune copie du dataset n'est
+    produite : seules les positions (indices entiers) des lignes de chaque
+    fold sont retournées, le consommateur prenant ses propres vues.
+    """
+
+    n_splits: int
+    n_repeats: int
+
+    def split_folds(self, dataset: Any) -> Iterator[Tuple[int, int, Any, Any]]:
+        """
+        Génère les folds de validation croisée.
+
+        Parameters
+        ----------
+        dataset : Any
+            Table de données contenant la colonne cible.
+
+        Yields
+        ------
+        (repeat, fold, train_indices, valid_indices)
+            Numéro de répétition, numéro de fold et positions des lignes
+            d'entraînement / de validation.
+        """
+        ...
@@ -32,6 +32,27 @@ class DatasetRepositoryPort(Protocol):
         """
         ...
 
+    def load_dataset_since(self, watermark: Any, watermark_column: str) -> Any:
+        """
+        Charge uniquement les lignes plus récentes que le dernier
+        entraînement (watermark), pour un ré-entraînement incrémental.
+
+        Paramètres
+        ----------
+        watermark : Any
+            Dernière valeur vue lors de l'entraînement précédent
+            (date d'inscription, identifiant croissant, etc.).
+        watermark_column : str
+            Colonne monotone utilisée pour comparer au watermark.
+
+        Retour
+        ------
+        Any
+            Lignes dont `watermark_column` est strictement supérieure
+            au watermark.
+        """
+        ...
+
     def save_dataset(self, data: Any, path: Path) -> None:
         """
         Sauvegarde un dataset vers une destination (fichier, répertoire, etc.).
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Protocol, Tuple
 
+from health_lifestyle_diabetes.domain.entities.split_indices import SplitIndices
+
 
 class DatasetSplitterPort(Protocol):
     """
@@ -44,4 +46,20 @@ class DatasetSplitterPort(Protocol):
         -------
         (train_dataset, test_dataset)
         """
-        ...
\ No newline at end of file
+        ...
+
+    def split_indices(self, dataset: Any) -> SplitIndices:
+        """
+        Calcule le split train/test sans matérialiser de copies.
+
+        Parameters
+        ----------
+        dataset : Any
+            Table de données (ex : DataFrame, Spark DataFrame…)
+
+        Returns
+        -------
+        SplitIndices
+            Positions des lignes train/test et empreinte déterministe.
+        """
+        ...
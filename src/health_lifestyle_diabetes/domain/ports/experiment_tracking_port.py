@@ -52,7 +52,7 @@ class ExperimentTrackingPort(Protocol):
         """
         ...
 
-    def log_metrics(self, metrics: Mapping[str, float]) -> None:
+    def log_metrics(self, metrics: Mapping[str, float], step: int | None = None) -> None:
         """
         Log des métriques numériques.
 
@@ -60,6 +60,9 @@ class ExperimentTrackingPort(Protocol):
         ----------
         metrics : Mapping[str, float]
             Exemple : {"auc": 0.87, "f1": 0.78}
+        step : int | None
+            Index d'itération (courbes d'apprentissage) ; None pour une
+            métrique ponctuelle.
         """
         ...
 
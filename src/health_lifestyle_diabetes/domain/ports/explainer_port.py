@@ -0,0 +1,43 @@
+from typing import Any, List, Optional, Protocol
+
+from health_lifestyle_diabetes.domain.entities.prediction_explanation import (
+    PredictionExplanation,
+)
+
+
+class ExplainerPort(Protocol):
+    """
+    Port définissant un service d'explication locale des prédictions
+    (contributions par feature, ex: TreeSHAP).
+    """
+
+    def explain(
+        self,
+        model: Any,
+        X: Any,
+        *,
+        top_k: int = 5,
+        latency_budget_ms: Optional[float] = None,
+    ) -> List[Optional[PredictionExplanation]]:
+        """
+        Explique chaque ligne de X.
+
+        Paramètres
+        ----------
+        model : Any
+            Modèle entraîné.
+        X : Any
+            Enregistrements scorés.
+        top_k : int
+            Nombre de contributions retournées par enregistrement
+            (triées par valeur absolue décroissante).
+        latency_budget_ms : float | None
+            Budget de latence ; les lignes non traitées à l'échéance
+            sont retournées à None.
+
+        Retour
+        ------
+        List[Optional[PredictionExplanation]]
+            Une entrée par ligne de X, dans le même ordre.
+        """
+        ...
@@ -0,0 +1,25 @@
+from typing import Dict, List, Protocol, Sequence, Tuple
+
+
+class FeatureSubsetEvaluatorPort(Protocol):
+    """
+    Port définissant un évaluateur de sous-ensembles de features
+    (modèle proxy rapide entraîné puis scoré sur un jeu de validation).
+    """
+
+    metric: str
+
+    def evaluate_many(
+        self,
+        subsets: Sequence[Sequence[str]],
+    ) -> List[Tuple[float, Dict[str, float]]]:
+        """
+        Évalue plusieurs sous-ensembles.
+
+        Retour
+        ------
+        List[Tuple[float, Dict[str, float]]]
+            Pour chaque sous-ensemble (même ordre) : le score de validation
+            et l'importance de chaque feature dans le modèle proxy.
+        """
+        ...
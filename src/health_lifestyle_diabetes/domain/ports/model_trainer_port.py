@@ -26,9 +26,13 @@ class ModelTrainerPort(Protocol):
     et d'inférence pour un modèle ML.
     """
 
-    def train(self, X_train: Any, y_train: Any, X_valid: Any | None = None, y_valid: Any | None = None, show_curves: bool=False) -> Any:
+    def train(self, X_train: Any, y_train: Any, X_valid: Any | None = None, y_valid: Any | None = None, show_curves: bool=False, init_model: Any | None = None) -> Any:
         """
         Entraîne un modèle et retourne l'instance entraînée.
+
+        Si `init_model` est fourni (modèle déjà entraîné ou chemin vers
+        un booster sauvegardé), l'entraînement reprend à partir de ce
+        modèle (warm-start) au lieu de repartir de zéro.
         """
         ...
 
@@ -0,0 +1,36 @@
+"""
+run_query_port.py
+================================================
+Port (contrat) de lecture des runs trackées.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Protocol, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class RunQueryPort(Protocol):
+    """
+    Pendant en lecture d'ExperimentTrackingPort : recherche paginée des
+    runs d'une expérience, au format colonnaire.
+
+    Chaque page est un DataFrame à une ligne par run, avec au minimum
+    `run_id`, `run_name`, `status`, `start_time`, `end_time`, puis une
+    colonne `params.<clé>` par paramètre et `metrics.<clé>` par métrique
+    (dernière valeur loggée).
+    """
+
+    def search_runs_page(
+        self,
+        experiment_name: str,
+        *,
+        max_results: int = 1000,
+        page_token: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, Optional[str]]:
+        """
+        Retourne une page de runs et le jeton de la page suivante
+        (None s'il n'y en a plus). Une expérience inconnue donne une page vide.
+        """
+        ...
@@ -0,0 +1,20 @@
+from typing import List, Optional, Protocol
+
+from health_lifestyle_diabetes.domain.entities.feature_selection_result import (
+    FeatureSelectionResult,
+)
+
+
+class SelectedFeaturesRepositoryPort(Protocol):
+    """
+    Port de persistance de la liste de features sélectionnées
+    (artefact versionné consommé par le pipeline et les trainers).
+    """
+
+    def save(self, result: FeatureSelectionResult) -> FeatureSelectionResult:
+        """Persiste le résultat et retourne celui-ci avec son numéro de version."""
+        ...
+
+    def load(self) -> Optional[List[str]]:
+        """Retourne la dernière liste persistée, ou None si absente."""
+        ...
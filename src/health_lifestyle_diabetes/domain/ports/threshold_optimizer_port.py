@@ -0,0 +1,53 @@
+from typing import Dict, Optional, Protocol, Sequence
+
+from health_lifestyle_diabetes.domain.entities.threshold_selection import (
+    ThresholdSelection,
+)
+
+
+class ThresholdOptimizerPort(Protocol):
+    """
+    Port définissant un service capable de balayer tous les seuils de
+    décision possibles et de retenir le meilleur selon un objectif métier.
+
+    L'infrastructure fournit l'implémentation (ex: NumpyThresholdOptimizer).
+    """
+
+    def sweep(
+        self,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+    ) -> Dict[str, Sequence[float]]:
+        """
+        Calcule les comptes de confusion pour tous les seuils candidats.
+
+        Retour
+        ------
+        Dict[str, Sequence[float]]
+            {"threshold", "tp", "fp", "tn", "fn"} : un élément par seuil
+            candidat, seuils triés par ordre décroissant.
+        """
+        ...
+
+    def find_optimal_threshold(
+        self,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        objective: str = "f1",
+        *,
+        min_recall: Optional[float] = None,
+        cost_fp: float = 1.0,
+        cost_fn: float = 1.0,
+    ) -> ThresholdSelection:
+        """
+        Retourne le seuil optimal pour l'objectif demandé.
+
+        Objectifs
+        ---------
+        - "f1"           : maximise le F1-score,
+        - "youden"       : maximise J = sensibilité + spécificité - 1,
+        - "recall_floor" : maximise la précision sous contrainte recall >= min_recall
+                           (politique de dépistage),
+        - "cost"         : minimise cost_fp * FP + cost_fn * FN.
+        """
+        ...
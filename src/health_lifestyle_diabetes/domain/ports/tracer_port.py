@@ -0,0 +1,55 @@
+"""
+tracer_port.py
+================================================
+Port (contrat) de traçage / profilage des étapes applicatives.
+"""
+from __future__ import annotations
+
+from typing import Any, ContextManager, Protocol
+
+from health_lifestyle_diabetes.domain.entities.trace_span import TraceSpan
+
+
+class TracerPort(Protocol):
+    """
+    Découpe l'exécution en spans chronométrés et imbriqués.
+
+    Usage :
+        with tracer.span("split_dataset", rows=len(df)) as span:
+            ...
+            span.set_attribute("train_rows", len(train))
+
+    L'implémentation décide de la mesure (durée, mémoire) et de l'export
+    (logs, tracker). Une exception traversant le span est propagée.
+    """
+
+    def span(self, name: str, **attributes: Any) -> ContextManager[TraceSpan]:
+        """Ouvre un span enfant du span courant (ou racine)."""
+        ...
+
+
+class _NullSpanContext:
+    """Contexte réutilisable : aucune mesure, aucun export."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> TraceSpan:
+        return _NullSpan("null", "null")
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+class _NullSpan(TraceSpan):
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NULL_SPAN_CONTEXT = _NullSpanContext()
+
+
+class NullTracer(TracerPort):
+    """Implémentation par défaut : spans no-op (coût quasi nul)."""
+
+    def span(self, name: str, **attributes: Any) -> ContextManager[TraceSpan]:
+        return _NULL_SPAN_CONTEXT
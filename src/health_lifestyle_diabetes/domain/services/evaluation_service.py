@@ -1,9 +1,16 @@
+from dataclasses import replace
 from typing import Sequence
 
 from health_lifestyle_diabetes.domain.entities.decision_threshold_policy import (
     DecisionThresholdPolicy,
 )
 from health_lifestyle_diabetes.domain.entities.metrics import EvaluationResults
+from health_lifestyle_diabetes.domain.ports.bootstrap_metrics_port import (
+    BootstrapMetricsPort,
+)
+from health_lifestyle_diabetes.domain.ports.calibration_metrics_port import (
+    CalibrationMetricsPort,
+)
 from health_lifestyle_diabetes.domain.ports.metrics_port import MetricsPort
 from health_lifestyle_diabetes.domain.services.threshold_service import ThresholdService
 from health_lifestyle_diabetes.domain.ports.metrics_plotter_port import (
@@ -17,10 +24,19 @@ class EvaluationService:
     Service applicatif orchestrant l'évaluation d'un modèle.
     """
 
-    def __init__(self, metrics_adapter: MetricsPort, decision_threshold: DecisionThresholdPolicy, plotter: MetricsPlotterPort):
+    def __init__(
+        self,
+        metrics_adapter: MetricsPort,
+        decision_threshold: DecisionThresholdPolicy,
+        plotter: MetricsPlotterPort,
+        bootstrap_adapter: Optional[BootstrapMetricsPort] = None,
+        calibration_metrics: Optional[CalibrationMetricsPort] = None,
+    ):
         self.metrics_adapter = metrics_adapter
         self.decision_threshold = decision_threshold
         self.metrics_plotter = plotter
+        self.bootstrap_adapter = bootstrap_adapter
+        self.calibration_metrics = calibration_metrics
 
 
     def evaluate(
@@ -32,6 +48,13 @@ class EvaluationService:
         y_pred = ThresholdService.apply_threshold(y_proba, threshold=self.decision_threshold.threshold)
         metrics = self.metrics_adapter.compute_metrics(y_true, y_pred, y_proba)
 
+        # Les métriques de calibration rejoignent extra_metrics, donc le tracking.
+        if self.calibration_metrics is not None:
+            metrics = {
+                **metrics,
+                **self.calibration_metrics.compute_calibration_metrics(y_true, y_proba),
+            }
+
         return EvaluationResults(
                 auc_roc=metrics.get("auc_roc"),
                 auc_pr=metrics.get("auc_pr"),
@@ -39,13 +62,49 @@ class EvaluationService:
                 precision=metrics.get("precision"),
                 recall=metrics.get("recall"),
                 f1=metrics.get("f1"),
-                false_positive_rate=metrics.get("fpr"),
-                false_negative_rate=metrics.get("fnr"),
+                false_positive_rate=metrics.get("false_positive_rate", metrics.get("fpr")),
+                false_negative_rate=metrics.get("false_negative_rate", metrics.get("fnr")),
                 kappa=metrics.get("kappa"),
                 mcc=metrics.get("mcc"),
+                ece=metrics.get("ece"),
+                mce=metrics.get("mce"),
+                brier_score=metrics.get("brier_score"),
+                log_loss=metrics.get("log_loss"),
                 extra_metrics=metrics,
     )
 
+    def evaluate_with_bootstrap(
+        self,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        *,
+        n_resamples: int = 1000,
+        confidence_level: float = 0.95,
+        random_state: Optional[int] = 42,
+    ) -> EvaluationResults:
+        """
+        Évaluation ponctuelle enrichie d'intervalles de confiance bootstrap.
+
+        Les intervalles sont attachés à `EvaluationResults.confidence_intervals`
+        et permettent de juger si l'écart entre deux runs est significatif.
+        """
+        if self.bootstrap_adapter is None:
+            raise ValueError(
+                "Aucun bootstrap_adapter configuré pour le mode bootstrap."
+            )
+
+        results = self.evaluate(y_true, y_proba)
+        y_pred = ThresholdService.apply_threshold(y_proba, threshold=self.decision_threshold.threshold)
+        intervals = self.bootstrap_adapter.compute_confidence_intervals(
+            y_true,
+            y_pred,
+            y_proba,
+            n_resamples=n_resamples,
+            confidence_level=confidence_level,
+            random_state=random_state,
+        )
+        return replace(results, confidence_intervals=intervals)
+
     def plotter(self,
                 metrics: Dict[str, float],
                 *,
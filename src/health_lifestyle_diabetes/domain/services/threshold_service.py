@@ -9,7 +9,9 @@ Rôle :
 - centraliser la logique liée au seuil (facile à tester et modifier).
 """
 
-from typing import List, Sequence
+from typing import Sequence
+
+import numpy as np
 
 
 class ThresholdService:
@@ -21,7 +23,7 @@ class ThresholdService:
     def apply_threshold(
         y_proba: Sequence[float],
         threshold: float,
-    ) -> List[int]:
+    ) -> np.ndarray:
         """
         Convertit une séquence de probabilités en labels 0/1.
 
@@ -34,7 +36,7 @@ class ThresholdService:
 
         Retour
         ------
-        List[int]
-            Labels binaires correspondant à la décision.
+        np.ndarray
+            Labels binaires (int8) correspondant à la décision.
         """
-        return [1 if p >= threshold else 0 for p in y_proba]
+        return (np.asarray(y_proba) >= threshold).astype(np.int8)
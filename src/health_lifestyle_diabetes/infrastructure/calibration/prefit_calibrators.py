@@ -0,0 +1,457 @@
+"""
+Calibrateurs « prefit » : ajustés uniquement sur des probabilités
+held-out, sans réentraîner le modèle de boosting.
+
+Chaque calibrateur :
+- s'ajuste sur (y_proba, y_true) d'un jeu de calibration,
+- s'applique par forme close (Platt, température) ou par lookup vectorisé
+  (isotonique, histogram binning),
+- se sérialise en un petit artefact JSON (quelques paramètres / bins).
+"""
+
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Type
+
+import numpy as np
+
+from health_lifestyle_diabetes.domain.ports.calibrator_port import CalibrationPort
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.metrics.confusion_kernels import (
+    as_binary_array,
+)
+from health_lifestyle_diabetes.infrastructure.utils.exceptions import (
+    ModelCalibrationError,
+)
+
+_EPS = 1e-12
+# v2 : Platt ajusté sur la probabilité brute (v1 : sur son logit).
+ARTIFACT_VERSION = 2
+
+
+def _logit(p: np.ndarray) -> np.ndarray:
+    p = np.clip(p, _EPS, 1.0 - _EPS)
+    return np.log(p) - np.log1p(-p)
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + np.tanh(0.5 * z))
+
+
+# ============================================================
+# Calibrateurs
+# ============================================================
+
+
+class PrefitCalibrator(ABC):
+    """
+    Classe de base des calibrateurs prefit.
+
+    Les sous-classes implémentent `_fit`, `_transform`, `get_params` et
+    `set_params` (vérifié à l'instanciation).
+    """
+
+    method: str = ""
+
+    def fit(self, y_proba: Sequence[float], y_true: Sequence[int]) -> "PrefitCalibrator":
+        y_proba = np.asarray(y_proba, dtype=np.float64)
+        y_true = as_binary_array(y_true)
+        if y_proba.shape != y_true.shape or y_proba.size == 0:
+            raise ModelCalibrationError(
+                "y_proba et y_true doivent être non vides et de même taille."
+            )
+        if y_true.min() == y_true.max():
+            raise ModelCalibrationError(
+                "Le jeu de calibration doit contenir les deux classes."
+            )
+        self._fit(y_proba, y_true)
+        return self
+
+    def transform(self, y_proba: Sequence[float]) -> np.ndarray:
+        """Retourne les probabilités calibrées (np.ndarray float64)."""
+        return self._transform(np.asarray(y_proba, dtype=np.float64))
+
+    @abstractmethod
+    def _fit(self, y_proba: np.ndarray, y_true: np.ndarray) -> None:
+        """Ajuste les paramètres sur des entrées déjà validées."""
+
+    @abstractmethod
+    def _transform(self, y_proba: np.ndarray) -> np.ndarray:
+        """Applique la calibration à un tableau float64."""
+
+    # ------------------------------------------------------------
+    # Sérialisation
+    # ------------------------------------------------------------
+    @abstractmethod
+    def get_params(self) -> Dict[str, Any]:
+        """Paramètres ajustés, sérialisables en JSON."""
+
+    @abstractmethod
+    def set_params(self, params: Dict[str, Any]) -> None:
+        """Restaure les paramètres produits par `get_params`."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": ARTIFACT_VERSION,
+            "method": self.method,
+            "params": self.get_params(),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "PrefitCalibrator":
+        method = payload.get("method")
+        if method not in CALIBRATORS:
+            raise ModelCalibrationError(f"Méthode de calibration inconnue : {method}")
+        if method == PlattCalibrator.method and payload.get("version", 1) < 2:
+            raise ModelCalibrationError(
+                "Artefact Platt v1 (ajusté sur logit(p)) incompatible : "
+                "réajuster le calibrateur."
+            )
+        calibrator = CALIBRATORS[method]()
+        calibrator.set_params(payload["params"])
+        return calibrator
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        return path
+
+    @staticmethod
+    def load(path: str | Path) -> "PrefitCalibrator":
+        try:
+            payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise ModelCalibrationError(
+                f"Impossible de charger le calibrateur : {path}"
+            ) from exc
+        return PrefitCalibrator.from_dict(payload)
+
+
+class PlattCalibrator(PrefitCalibrator):
+    """
+    Platt scaling : p' = sigmoid(a * p + b).
+
+    Comme la calibration 'sigmoid' de sklearn pour un modèle sans
+    decision_function (LightGBM, XGBoost...), la sigmoïde est ajustée sur
+    la probabilité brute du modèle : a = -A et b = -B de
+    `sklearn.calibration._sigmoid_calibration`. Ajustement par
+    Newton-Raphson sur la log-loss avec les cibles lissées de Platt (1999).
+    """
+
+    method = "platt"
+
+    def __init__(self, max_iter: int = 100, tol: float = 1e-10):
+        self.max_iter = max_iter
+        self.tol = tol
+        self.a = 1.0
+        self.b = 0.0
+
+    def _fit(self, y_proba: np.ndarray, y_true: np.ndarray) -> None:
+        z = y_proba
+        n_pos = float(y_true.sum())
+        n_neg = float(y_true.size - n_pos)
+        target = np.where(y_true == 1, (n_pos + 1) / (n_pos + 2), 1 / (n_neg + 2))
+
+        def loss(a: float, b: float) -> float:
+            # Log-loss stable : log(1 + e^u) - t * u.
+            u = a * z + b
+            return float(np.sum(np.logaddexp(0.0, u) - target * u))
+
+        # Point de départ de Platt (et de sklearn) : pente nulle, prior lissé.
+        a, b = 0.0, float(np.log((n_pos + 1.0) / (n_neg + 1.0)))
+        current = loss(a, b)
+        for _ in range(self.max_iter):
+            p = _sigmoid(a * z + b)
+            residual = p - target
+            w = np.maximum(p * (1.0 - p), _EPS)
+            g_a, g_b = residual @ z, residual.sum()
+            h_aa, h_ab, h_bb = w @ (z * z), w @ z, w.sum()
+            det = h_aa * h_bb - h_ab * h_ab
+            if det <= _EPS:
+                break
+            step_a = (h_bb * g_a - h_ab * g_b) / det
+            step_b = (h_aa * g_b - h_ab * g_a) / det
+
+            # Backtracking : Newton seul diverge sur des probabilités saturées.
+            scale = 1.0
+            while scale > 1e-8:
+                candidate = loss(a - scale * step_a, b - scale * step_b)
+                if candidate <= current:
+                    break
+                scale *= 0.5
+            else:
+                break
+            a, b = a - scale * step_a, b - scale * step_b
+            converged = current - candidate < self.tol * max(1.0, abs(current))
+            current = candidate
+            if converged:
+                break
+        self.a, self.b = float(a), float(b)
+
+    def _transform(self, y_proba: np.ndarray) -> np.ndarray:
+        return _sigmoid(self.a * y_proba + self.b)
+
+    def get_params(self) -> Dict[str, Any]:
+        return {"a": self.a, "b": self.b}
+
+    def set_params(self, params: Dict[str, Any]) -> None:
+        self.a, self.b = float(params["a"]), float(params["b"])
+
+
+class TemperatureCalibrator(PrefitCalibrator):
+    """
+    Temperature scaling : p' = sigmoid(logit(p) / T).
+
+    Un seul paramètre, ajusté par Newton sur 1/T ; préserve l'ordre
+    des scores (AUC inchangée).
+    """
+
+    method = "temperature"
+
+    def __init__(self, max_iter: int = 100, tol: float = 1e-10):
+        self.max_iter = max_iter
+        self.tol = tol
+        self.temperature = 1.0
+
+    def _fit(self, y_proba: np.ndarray, y_true: np.ndarray) -> None:
+        z = _logit(y_proba)
+        inv_t = 1.0
+        for _ in range(self.max_iter):
+            p = _sigmoid(inv_t * z)
+            grad = (p - y_true) @ z
+            hess = np.maximum(p * (1.0 - p), _EPS) @ (z * z)
+            if hess <= _EPS:
+                break
+            new_inv_t = max(inv_t - grad / hess, 1e-3)
+            if abs(new_inv_t - inv_t) < self.tol:
+                inv_t = new_inv_t
+                break
+            inv_t = new_inv_t
+        self.temperature = float(1.0 / inv_t)
+
+    def _transform(self, y_proba: np.ndarray) -> np.ndarray:
+        return _sigmoid(_logit(y_proba) / self.temperature)
+
+    def get_params(self) -> Dict[str, Any]:
+        return {"temperature": self.temperature}
+
+    def set_params(self, params: Dict[str, Any]) -> None:
+        self.temperature = float(params["temperature"])
+
+
+class IsotonicCalibrator(PrefitCalibrator):
+    """
+    Régression isotonique (Pool Adjacent Violators).
+
+    Les probabilités sont d'abord agrégées par valeur unique ; l'artefact
+    ne contient que les points de rupture, appliqués par np.interp.
+    """
+
+    method = "isotonic"
+
+    def __init__(self):
+        self.x_thresholds = np.array([0.0, 1.0])
+        self.y_thresholds = np.array([0.0, 1.0])
+
+    def _fit(self, y_proba: np.ndarray, y_true: np.ndarray) -> None:
+        x_unique, inverse = np.unique(y_proba, return_inverse=True)
+        weights = np.bincount(inverse).astype(np.float64)
+        sums = np.bincount(inverse, weights=y_true)
+
+        # PAV : pile de blocs (somme, poids, x_min, x_max).
+        block_sum, block_w, block_lo, block_hi = [], [], [], []
+        for i in range(x_unique.size):
+            s, w, lo = sums[i], weights[i], i
+            while block_w and block_sum[-1] / block_w[-1] >= s / w:
+                s += block_sum.pop()
+                w += block_w.pop()
+                lo = block_lo.pop()
+                block_hi.pop()
+            block_sum.append(s)
+            block_w.append(w)
+            block_lo.append(lo)
+            block_hi.append(i)
+
+        values = np.asarray(block_sum) / np.asarray(block_w)
+        lo = x_unique[np.asarray(block_lo)]
+        hi = x_unique[np.asarray(block_hi)]
+        x = np.column_stack([lo, hi]).ravel()
+        y = np.repeat(values, 2)
+        keep = np.r_[True, np.diff(x) > 0]
+        self.x_thresholds, self.y_thresholds = x[keep], y[keep]
+
+    def _transform(self, y_proba: np.ndarray) -> np.ndarray:
+        return np.interp(y_proba, self.x_thresholds, self.y_thresholds)
+
+    def get_params(self) -> Dict[str, Any]:
+        return {
+            "x_thresholds": self.x_thresholds.tolist(),
+            "y_thresholds": self.y_thresholds.tolist(),
+        }
+
+    def set_params(self, params: Dict[str, Any]) -> None:
+        self.x_thresholds = np.asarray(params["x_thresholds"], dtype=np.float64)
+        self.y_thresholds = np.asarray(params["y_thresholds"], dtype=np.float64)
+
+
+class HistogramBinningCalibrator(PrefitCalibrator):
+    """
+    Histogram binning sur bins à effectifs égaux.
+
+    Chaque bin est remplacé par la fréquence observée de positifs ;
+    application par np.searchsorted (lookup O(log n_bins)).
+    """
+
+    method = "histogram"
+
+    def __init__(self, n_bins: int = 15):
+        self.n_bins = n_bins
+        self.edges = np.array([], dtype=np.float64)
+        self.bin_values = np.array([0.5])
+
+    def _fit(self, y_proba: np.ndarray, y_true: np.ndarray) -> None:
+        quantiles = np.quantile(y_proba, np.linspace(0.0, 1.0, self.n_bins + 1)[1:-1])
+        edges = np.unique(quantiles)
+        bins = np.searchsorted(edges, y_proba, side="right")
+
+        n_bins = edges.size + 1
+        counts = np.bincount(bins, minlength=n_bins)
+        positives = np.bincount(bins, weights=y_true, minlength=n_bins)
+
+        # Bins vides (ex : ex-aequo au minimum, premier quantile = min) :
+        # fusionnés avec leur voisin non vide en retirant leur borne.
+        # Chaque bin conservé part de la borne inférieure d'un bin non vide.
+        filled = np.flatnonzero(counts)
+        self.edges = edges[filled[1:] - 1]
+        self.bin_values = positives[filled] / counts[filled]
+
+    def _transform(self, y_proba: np.ndarray) -> np.ndarray:
+        return self.bin_values[np.searchsorted(self.edges, y_proba, side="right")]
+
+    def get_params(self) -> Dict[str, Any]:
+        return {
+            "n_bins": self.n_bins,
+            "edges": self.edges.tolist(),
+            "bin_values": self.bin_values.tolist(),
+        }
+
+    def set_params(self, params: Dict[str, Any]) -> None:
+        self.n_bins = int(params["n_bins"])
+        self.edges = np.asarray(params["edges"], dtype=np.float64)
+        self.bin_values = np.asarray(params["bin_values"], dtype=np.float64)
+
+
+CALIBRATORS: Dict[str, Type[PrefitCalibrator]] = {
+    PlattCalibrator.method: PlattCalibrator,
+    TemperatureCalibrator.method: TemperatureCalibrator,
+    IsotonicCalibrator.method: IsotonicCalibrator,
+    HistogramBinningCalibrator.method: HistogramBinningCalibrator,
+}
+
+# Alias alignés sur le vocabulaire de CalibratedClassifierCV.
+_METHOD_ALIASES = {"sigmoid": "platt", "histogram_binning": "histogram"}
+
+
+def build_calibrator(method: str, **params) -> PrefitCalibrator:
+    """Instancie un calibrateur prefit à partir de son nom."""
+    method = _METHOD_ALIASES.get(method, method)
+    if method not in CALIBRATORS:
+        raise ModelCalibrationError(
+            f"Méthode de calibration inconnue : {method} "
+            f"(attendu : {sorted(CALIBRATORS)})"
+        )
+    return CALIBRATORS[method](**params)
+
+
+# ============================================================
+# Modèle calibré
+# ============================================================
+
+
+class CalibratedModel:
+    """
+    Modèle déjà entraîné + calibrateur prefit.
+
+    Expose predict_proba / predict comme un classifieur sklearn ; le
+    modèle sous-jacent n'est jamais réentraîné.
+    """
+
+    def __init__(self, estimator: Any, calibrator: PrefitCalibrator, threshold: float = 0.5):
+        self.estimator = estimator
+        self.calibrator = calibrator
+        self.threshold = threshold
+        self.classes_ = getattr(estimator, "classes_", np.array([0, 1]))
+
+    def predict_proba(self, X) -> np.ndarray:
+        proba = self.calibrator.transform(self.estimator.predict_proba(X)[:, 1])
+        return np.column_stack([1.0 - proba, proba])
+
+    def predict(self, X) -> np.ndarray:
+        return (self.predict_proba(X)[:, 1] >= self.threshold).astype(np.int8)
+
+
+# ============================================================
+# Adapter CalibrationPort
+# ============================================================
+
+
+class PrefitCalibrationAdapter(CalibrationPort):
+    """
+    Adapter de calibration sans réentraînement du modèle.
+
+    Contrairement à SklearnCalibrationAdapter (CalibratedClassifierCV,
+    cv=5 → cinq réentraînements), seul le calibrateur est ajusté, sur les
+    probabilités du modèle pour le jeu de calibration.
+    """
+
+    def __init__(self, logger: LoggerPort, method: str = "platt", n_bins: int = 15):
+        self.logger = logger
+        self.method = method
+        self.n_bins = n_bins
+
+    def calibrate(self, model, X_calib, y_calib, **kwargs) -> CalibratedModel:
+        """
+        kwargs possibles :
+        - method: 'platt' | 'sigmoid' | 'isotonic' | 'temperature' | 'histogram'
+        - n_bins: int (histogram uniquement)
+        - y_proba: probabilités déjà calculées sur X_calib (évite un predict)
+        - artifact_path: chemin JSON où sauvegarder le calibrateur
+        """
+        y_proba = kwargs.get("y_proba")
+        if y_proba is None:
+            y_proba = model.predict_proba(X_calib)[:, 1]
+
+        calibrator = self.fit_calibrator(
+            y_proba,
+            y_calib,
+            method=kwargs.get("method", self.method),
+            n_bins=kwargs.get("n_bins", self.n_bins),
+        )
+
+        artifact_path: Optional[str | Path] = kwargs.get("artifact_path")
+        if artifact_path is not None:
+            calibrator.save(artifact_path)
+            self.logger.info(f"Calibrateur sauvegardé : {artifact_path}")
+
+        return CalibratedModel(model, calibrator)
+
+    def fit_calibrator(
+        self,
+        y_proba: Sequence[float],
+        y_true: Sequence[int],
+        *,
+        method: Optional[str] = None,
+        n_bins: Optional[int] = None,
+    ) -> PrefitCalibrator:
+        """Ajuste un calibrateur directement sur des probabilités held-out."""
+        method = method or self.method
+        params = {}
+        if _METHOD_ALIASES.get(method, method) == HistogramBinningCalibrator.method:
+            params["n_bins"] = n_bins or self.n_bins
+
+        self.logger.info(f"Calibration prefit | method='{method}' | n={len(y_proba)}")
+        calibrator = build_calibrator(method, **params).fit(y_proba, y_true)
+        self.logger.info(f"Calibration terminée | method='{calibrator.method}'")
+        return calibrator
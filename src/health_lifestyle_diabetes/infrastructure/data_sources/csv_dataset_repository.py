@@ -1,30 +1,27 @@
 # src/health_lifestyle_diabetes/infrastructure/data_sources/csv_dataset_repository.py
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from health_lifestyle_diabetes.domain.ports.dataset_repository_port import (
     DatasetRepositoryPort,
 )
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import (
-    YamlConfigLoader,
-)
 from health_lifestyle_diabetes.infrastructure.utils.exceptions import (
     DatasetLoadingError,
     DatasetSavingError,
 )
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
-from pandas import DataFrame, read_csv
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
+from pandas import DataFrame, concat, read_csv
 
-# Détermine la racine du projet.
-root = get_repository_root()
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
 
-# Charge le fichier de configuration 'paths.yaml' pour connaître les emplacements des données.
-paths = YamlConfigLoader.load_config(root / "configs/paths.yaml")
-raw_path = paths["data"]["input"]["raw_dataset"]
 
-# Extrait le chemin relatif du dataset brut.
-INPUT_DATA_PATH = root / raw_path  # Construit le chemin complet du fichier CSV.
+def __getattr__(name: str):
+    """Constantes de chemin résolues à la demande (PEP 562), sans effet de bord à l'import."""
+    if name == "INPUT_DATA_PATH":
+        return get_settings().paths.data.input.raw_dataset
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class CSVDatasetRepository(DatasetRepositoryPort):
@@ -37,15 +34,27 @@ class CSVDatasetRepository(DatasetRepositoryPort):
         self,
         logger: LoggerPort,
         source_path: Optional[Path] = None,
+        chunk_size: int = 100_000,
+        settings: Optional["AppSettings"] = None,
     ):
         """
         Parameters
         ----------
         source_path : Path
             Le chemin du fichier CSV à charger.
+        chunk_size : int
+            Nombre de lignes lues par bloc lors d'un chargement incrémental.
+        settings : AppSettings, optional
+            Configuration injectée (défaut : `get_settings()`), utilisée si
+            `source_path` n'est pas fourni.
         """
-        self._source_path = source_path if source_path is not None else INPUT_DATA_PATH
+        self._source_path = (
+            source_path
+            if source_path is not None
+            else (settings or get_settings()).paths.data.input.raw_dataset
+        )
         self._logger = logger
+        self._chunk_size = chunk_size
 
     def load_dataset(self):
         """
@@ -67,6 +76,41 @@ class CSVDatasetRepository(DatasetRepositoryPort):
             self._logger.error(f"Erreur lors du chargement du dataset : {e}")
             raise DatasetLoadingError(str(e))
 
+    def load_dataset_since(self, watermark: Any, watermark_column: str) -> DataFrame:
+        """
+        Charge uniquement les lignes dont `watermark_column` est strictement
+        supérieure au watermark du dernier entraînement.
+
+        Le CSV est lu par blocs et filtré au fil de l'eau : seules les
+        nouvelles lignes sont conservées en mémoire.
+        """
+        self._logger.info(
+            f"Chargement incrémental depuis : {self._source_path} | "
+            f"{watermark_column} > {watermark}"
+        )
+
+        try:
+            if not self._source_path.exists():
+                raise DatasetLoadingError(f"Fichier introuvable : {self._source_path}")
+
+            chunks = []
+            for chunk in read_csv(self._source_path, chunksize=self._chunk_size):
+                if watermark_column not in chunk.columns:
+                    raise DatasetLoadingError(
+                        f"Colonne de watermark introuvable : '{watermark_column}'"
+                    )
+                chunks.append(chunk[chunk[watermark_column] > watermark])
+
+            df = concat(chunks, ignore_index=True) if chunks else DataFrame()
+            self._logger.info(
+                f"Delta chargé avec succès ({df.shape[0]} nouvelles lignes)."
+            )
+            return df
+
+        except Exception as e:
+            self._logger.error(f"Erreur lors du chargement incrémental : {e}")
+            raise DatasetLoadingError(str(e))
+
     def save_dataset(self, data: DataFrame, path: Path) -> None:
         """
         Sauvegarde un dataset au format CSV.
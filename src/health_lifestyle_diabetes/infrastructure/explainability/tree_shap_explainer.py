@@ -0,0 +1,212 @@
+"""
+Explications locales TreeSHAP via les implémentations natives des
+librairies de boosting :
+
+- XGBoost  : Booster.predict(..., pred_contribs=True)
+- LightGBM : predict(..., pred_contrib=True)
+- CatBoost : get_feature_importance(type="ShapValues")
+
+Les trois retournent une matrice (n, p + 1) : p contributions puis la
+valeur de base (espérance de la marge) en dernière colonne.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from health_lifestyle_diabetes.domain.entities.prediction_explanation import (
+    FeatureContribution,
+    PredictionExplanation,
+)
+from health_lifestyle_diabetes.domain.ports.explainer_port import ExplainerPort
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+
+
+class TreeShapExplainerAdapter(ExplainerPort):
+    """
+    Adapter TreeSHAP natif, batché, multi-thread et mis en cache.
+
+    - Les lignes sont hachées (pandas.util.hash_pandas_object) ; une ligne
+      déjà expliquée pour le même modèle est servie depuis un cache LRU.
+    - Les lignes manquantes (dédupliquées) sont calculées par batchs ; le
+      calcul natif est parallélisé sur `n_jobs` threads par la librairie.
+    - Le budget de latence est vérifié entre deux batchs (le premier
+      batch est toujours calculé).
+    """
+
+    def __init__(
+        self,
+        logger: LoggerPort,
+        batch_size: int = 1024,
+        n_jobs: int = -1,
+        cache_size: int = 100_000,
+    ):
+        self.logger = logger
+        self.batch_size = batch_size
+        self.n_jobs = n_jobs
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[int, np.ndarray]" = OrderedDict()
+        self._cached_model: Any = None
+
+    # ------------------------------------------------------------------
+    # API publique
+    # ------------------------------------------------------------------
+    def explain(
+        self,
+        model: Any,
+        X: Any,
+        *,
+        top_k: int = 5,
+        latency_budget_ms: Optional[float] = None,
+    ) -> List[Optional[PredictionExplanation]]:
+        start = time.perf_counter()
+        deadline = None if latency_budget_ms is None else start + latency_budget_ms / 1000.0
+
+        X = X if isinstance(X, pd.DataFrame) else pd.DataFrame(X)
+        feature_names = np.asarray(X.columns.astype(str))
+        self._bind_model(model)
+
+        row_hashes = pd.util.hash_pandas_object(X, index=False).to_numpy()
+        n_rows, n_cols = len(X), X.shape[1] + 1
+
+        # Matrice (n, p + 1) des contributions, NaN = non (encore) expliquée.
+        matrix = np.full((n_rows, n_cols), np.nan, dtype=np.float32)
+        from_cache = np.zeros(n_rows, dtype=bool)
+        for i, row_hash in enumerate(row_hashes):
+            cached = self._cache_get(row_hash)
+            if cached is not None:
+                matrix[i] = cached
+                from_cache[i] = True
+
+        # Lignes à calculer, dédupliquées par hash.
+        missing_hashes, first_rows, inverse = np.unique(
+            row_hashes[~from_cache], return_index=True, return_inverse=True
+        )
+        missing_rows = np.flatnonzero(~from_cache)
+        unique_rows = missing_rows[first_rows]
+        unique_values = np.full((unique_rows.size, n_cols), np.nan, dtype=np.float32)
+
+        computed = 0
+        for batch_start in range(0, unique_rows.size, self.batch_size):
+            # Au moins un batch est toujours calculé.
+            if computed and deadline is not None and time.perf_counter() >= deadline:
+                break
+            batch = slice(batch_start, batch_start + self.batch_size)
+            values = self.compute_contributions(model, X.iloc[unique_rows[batch]])
+            unique_values[batch] = values
+            for row_hash, row_values in zip(missing_hashes[batch], values):
+                self._cache_put(int(row_hash), row_values)
+            computed += values.shape[0]
+        matrix[missing_rows] = unique_values[inverse]
+
+        explanations = self._top_k(matrix, feature_names, top_k, from_cache)
+
+        skipped = sum(e is None for e in explanations)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.logger.info(
+            f"Explications TreeSHAP | lignes={len(explanations)} | cache={sum(from_cache)} | "
+            f"calculées={computed} | durée={elapsed_ms:.1f} ms"
+        )
+        if skipped:
+            self.logger.warning(
+                f"Budget de latence atteint ({latency_budget_ms} ms) : "
+                f"{skipped} lignes non expliquées."
+            )
+        return explanations
+
+    def compute_contributions(self, model: Any, X: pd.DataFrame) -> np.ndarray:
+        """
+        Matrice brute (n, p + 1) des contributions SHAP, biais en dernière colonne.
+        """
+        module_name = type(model).__module__
+
+        # ======================
+        # XGBoost
+        # ======================
+        if hasattr(model, "get_booster") and "xgboost" in module_name:
+            import xgboost as xgb
+
+            dmatrix = xgb.DMatrix(X, enable_categorical=True, nthread=self.n_jobs)
+            values = model.get_booster().predict(dmatrix, pred_contribs=True)
+
+        # ======================
+        # CatBoost
+        # ======================
+        elif hasattr(model, "get_feature_importance") and "catboost" in module_name:
+            from catboost import Pool
+
+            pool = Pool(X, cat_features=model.get_cat_feature_indices())
+            values = model.get_feature_importance(
+                pool, type="ShapValues", thread_count=self.n_jobs
+            )
+
+        # ======================
+        # LightGBM
+        # ======================
+        elif hasattr(model, "booster_") and "lightgbm" in module_name:
+            values = model.predict(X, pred_contrib=True, num_threads=self.n_jobs)
+
+        # ======================
+        # Non supporté
+        # ======================
+        else:
+            raise ValueError(
+                f"Modèle non supporté pour les explications TreeSHAP : {type(model)}"
+            )
+
+        return np.asarray(values, dtype=np.float32)
+
+    # ------------------------------------------------------------------
+    # Cache LRU (lié à un seul modèle à la fois)
+    # ------------------------------------------------------------------
+    def _bind_model(self, model: Any) -> None:
+        if model is not self._cached_model:
+            self._cache.clear()
+            self._cached_model = model
+
+    def _cache_get(self, row_hash: int) -> Optional[np.ndarray]:
+        row_hash = int(row_hash)
+        values = self._cache.get(row_hash)
+        if values is not None:
+            self._cache.move_to_end(row_hash)
+        return values
+
+    def _cache_put(self, row_hash: int, values: np.ndarray) -> None:
+        self._cache[row_hash] = values
+        self._cache.move_to_end(row_hash)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _top_k(
+        matrix: np.ndarray,
+        feature_names: np.ndarray,
+        top_k: int,
+        from_cache: np.ndarray,
+    ) -> List[Optional[PredictionExplanation]]:
+        contributions = np.abs(matrix[:, :-1])
+        k = min(top_k, contributions.shape[1])
+        top = np.argpartition(-contributions, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(contributions, top, axis=1), axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_values = np.take_along_axis(matrix[:, :-1], top, axis=1)
+        explained = ~np.isnan(matrix[:, -1])
+
+        return [
+            PredictionExplanation(
+                base_value=float(matrix[i, -1]),
+                contributions=tuple(
+                    FeatureContribution(str(feature_names[j]), float(v))
+                    for j, v in zip(top[i], top_values[i])
+                ),
+                from_cache=bool(from_cache[i]),
+            )
+            if explained[i]
+            else None
+            for i in range(matrix.shape[0])
+        ]
@@ -1,9 +1,13 @@
 # src/health_lifestyle_diabetes/infrastructure/ml/feature_engineering/pipeline_feature_engineering.py
 
+import time
+from typing import TYPE_CHECKING, Optional, Sequence
+
 from health_lifestyle_diabetes.domain.ports.feature_engineering_port import (
     FeatureEngineeringPort,
 )
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
 from health_lifestyle_diabetes.infrastructure.feature_engineering.base_preprocessing import (
     clean_categorical_variables,
 )
@@ -28,18 +32,19 @@ from health_lifestyle_diabetes.infrastructure.feature_engineering.medical_featur
 from health_lifestyle_diabetes.infrastructure.feature_engineering.metabolic_features import (
     MetabolicFeatureEngineer,
 )
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import (
-    YamlConfigLoader,
+from health_lifestyle_diabetes.infrastructure.features_selections.features_selection import (
+    TARGET_COLUMN,
+)
+from health_lifestyle_diabetes.infrastructure.monitoring.metrics_registry import (
+    DEFAULT_SIZE_BUCKETS,
+    MetricsRegistry,
+    get_metrics_registry,
 )
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
 from pandas import DataFrame
 
-# ---------------------------------------------------------------------
-# Configuration
-# ---------------------------------------------------------------------
-root = get_repository_root()
-config = YamlConfigLoader.load_config(root / "configs/preprocessing.yaml")
-age_group_strategy = config["feature_engineering"]["age_group_strategy"]
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
 
 
 class FeatureEngineeringPipeline(FeatureEngineeringPort):
@@ -63,10 +68,51 @@ class FeatureEngineeringPipeline(FeatureEngineeringPort):
     pour la modélisation prédictive et l’analyse de risque.
     """
 
-    def __init__(self, logger: LoggerPort):
+    def __init__(
+        self,
+        logger: LoggerPort,
+        selected_features: Optional[Sequence[str]] = None,
+        settings: Optional["AppSettings"] = None,
+        tracer: Optional[TracerPort] = None,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Parameters
+        ----------
+        logger : LoggerPort
+            Service de logging injecté.
+        selected_features : sequence[str], optional
+            Si fourni (ex: `load_selected_features()`), le dataset enrichi est
+            restreint à ces colonnes (plus la cible si présente).
+        settings : AppSettings, optional
+            Configuration injectée (défaut : `get_settings()`).
+        tracer : TracerPort, optional
+            Traceur : un span par étape du pipeline (défaut : no-op).
+        metrics : MetricsRegistry, optional
+            Registre recevant latence, lignes et tailles de batch
+            (défaut : registre partagé du processus).
+        """
         self.logger = logger
+        self.tracer = tracer or NullTracer()
+
+        metrics = metrics or get_metrics_registry()
+        self._latency = metrics.histogram(
+            "hld_feature_engineering_latency_seconds",
+            "Durée d'un appel au pipeline de feature engineering.",
+        )
+        self._rows = metrics.counter(
+            "hld_feature_engineering_rows_total", "Lignes transformées."
+        )
+        self._batch_rows = metrics.histogram(
+            "hld_feature_engineering_batch_rows",
+            "Taille des batches transformés (lignes).",
+            buckets=DEFAULT_SIZE_BUCKETS,
+        )
+        self.selected_features = list(selected_features) if selected_features is not None else None
 
         # Feature engineering blocks
+        settings = settings or get_settings()
+        age_group_strategy = settings.preprocessing.feature_engineering.age_group_strategy
         self.demographics = DemographicsFeatureEngineer(
             logger=self.logger,
             age_group_strategy=age_group_strategy
@@ -78,46 +124,75 @@ class FeatureEngineeringPipeline(FeatureEngineeringPort):
         self.lifestyle = LifestyleFeatureEngineer(logger=self.logger)
 
     def transform(self, df: DataFrame) -> DataFrame:
-        df_enriched = df.copy(deep=True)
         self.logger.info("Démarrage du pipeline complet de Feature Engineering...")
+        start = time.perf_counter()
+        with self.tracer.span("feature_engineering", rows=len(df)) as span:
+            df_enriched = self._transform(df)
+            span.set_attribute("columns", len(df_enriched.columns))
+        self._latency.observe(time.perf_counter() - start)
+        self._rows.inc(len(df))
+        self._batch_rows.observe(len(df))
+
+        self.logger.info(
+            f"Pipeline exécuté avec succès. Nombre total de colonnes : {len(df_enriched.columns)}"
+        )
+        return df_enriched
+
+    def _transform(self, df: DataFrame) -> DataFrame:
+        with self.tracer.span("copy"):
+            df_enriched = df.copy(deep=True)
 
         # --------------------------------------------------------------
         # Étape 0 : Suppression du data leakage
         # --------------------------------------------------------------
-        df_enriched = drop_leakage_columns(df_enriched, self.logger)
+        with self.tracer.span("exclusion"):
+            df_enriched = drop_leakage_columns(df_enriched, self.logger)
 
         # --------------------------------------------------------------
         # Étape 1 : Nettoyage des variables catégorielles
         # --------------------------------------------------------------
-        df_enriched = clean_categorical_variables(df_enriched,self.logger)
+        with self.tracer.span("base_preprocessing"):
+            df_enriched = clean_categorical_variables(df_enriched, self.logger)
 
         # --------------------------------------------------------------
         # Étape 2 : Variables démographiques
         # --------------------------------------------------------------
-        df_enriched = self.demographics.transform(df_enriched)
+        with self.tracer.span("demographics"):
+            df_enriched = self.demographics.transform(df_enriched)
 
         # --------------------------------------------------------------
         # Étape 3 : Variables médicales cliniques
         # --------------------------------------------------------------
-        df_enriched = self.medical.transform(df_enriched)
+        with self.tracer.span("medical"):
+            df_enriched = self.medical.transform(df_enriched)
 
         # --------------------------------------------------------------
         # Étape 4 : Interactions physiologiques
         # --------------------------------------------------------------
-        df_enriched = self.clinical.transform(df_enriched)
+        with self.tracer.span("clinical"):
+            df_enriched = self.clinical.transform(df_enriched)
 
         # --------------------------------------------------------------
         # Étape 5 : Métabolisme avancé
         # --------------------------------------------------------------
-        df_enriched = self.metabolic.transform(df_enriched)
+        with self.tracer.span("metabolic"):
+            df_enriched = self.metabolic.transform(df_enriched)
 
         # --------------------------------------------------------------
         # Étape 6 : Comportement & mode de vie
         # --------------------------------------------------------------
-        df_enriched = self.behavioral.transform(df_enriched)
-        df_enriched = self.lifestyle.transform(df_enriched)
+        with self.tracer.span("behavioral"):
+            df_enriched = self.behavioral.transform(df_enriched)
+        with self.tracer.span("lifestyle"):
+            df_enriched = self.lifestyle.transform(df_enriched)
+
+        # --------------------------------------------------------------
+        # Étape 7 : Restriction aux features sélectionnées (optionnelle)
+        # --------------------------------------------------------------
+        if self.selected_features is not None:
+            columns = self.selected_features + (
+                [TARGET_COLUMN] if TARGET_COLUMN in df_enriched.columns else []
+            )
+            df_enriched = df_enriched[columns]
 
-        self.logger.info(
-            f"Pipeline exécuté avec succès. Nombre total de colonnes : {len(df_enriched.columns)}"
-        )
         return df_enriched
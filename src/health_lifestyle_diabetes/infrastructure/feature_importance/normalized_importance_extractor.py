@@ -0,0 +1,213 @@
+"""
+Extraction normalisée des importances de features (XGBoost, LightGBM, CatBoost).
+
+Chaque librairie expose des types et des formats différents (noms f0..fN
+et features absentes pour XGBoost, types propres à CatBoost...). Ce module
+retourne toujours un vecteur float32 de longueur fixe, aligné sur la liste
+de features d'entraînement, pour trois types homogènes :
+
+- "gain"  : gain total apporté par les splits sur la feature,
+- "split" : nombre de splits utilisant la feature,
+- "cover" : nombre (pondéré) d'observations traversant ces splits.
+
+L'agrégation multi-runs devient une simple opération sur un tableau 2D.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from health_lifestyle_diabetes.domain.ports.feature_importance_port import (
+    FeatureImportancePort,
+)
+
+IMPORTANCE_TYPES = ("gain", "split", "cover")
+
+# Correspondance vers les types natifs XGBoost (totaux, et non moyennes par split).
+_XGBOOST_TYPES = {"gain": "total_gain", "split": "weight", "cover": "total_cover"}
+
+
+class NormalizedImportanceExtractor(FeatureImportancePort):
+    """
+    Importances alignées sur la liste de features d'entraînement.
+
+    Les features jamais utilisées valent 0 ; avec `normalize=True`, le
+    vecteur est ramené à une somme de 1 (comparaison entre runs).
+    """
+
+    def __init__(self, importance_type: str = "gain", normalize: bool = True):
+        if importance_type not in IMPORTANCE_TYPES:
+            raise ValueError(f"importance_type doit être l'un de {IMPORTANCE_TYPES}")
+        self.importance_type = importance_type
+        self.normalize = normalize
+
+    # ------------------------------------------------------------------
+    # FeatureImportancePort
+    # ------------------------------------------------------------------
+    def get_feature_importances(self, model: Any) -> Dict[str, float]:
+        feature_names = self.model_feature_names(model)
+        vector = self.extract(model, feature_names)
+        order = np.argsort(-vector, kind="stable")
+        return {feature_names[i]: float(vector[i]) for i in order}
+
+    # ------------------------------------------------------------------
+    # API vectorielle
+    # ------------------------------------------------------------------
+    def extract(
+        self,
+        model: Any,
+        feature_names: Optional[Sequence[str]] = None,
+        importance_type: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Vecteur float32 de shape (len(feature_names),), aligné sur `feature_names`
+        (par défaut, les features du modèle).
+        """
+        importance_type = importance_type or self.importance_type
+        if importance_type not in IMPORTANCE_TYPES:
+            raise ValueError(f"importance_type doit être l'un de {IMPORTANCE_TYPES}")
+
+        model_features = self.model_feature_names(model)
+        raw = self._raw_importances(model, model_features, importance_type)
+
+        if feature_names is None:
+            vector = raw
+        else:
+            position = {name: i for i, name in enumerate(model_features)}
+            index = np.array([position.get(name, -1) for name in feature_names], dtype=np.int64)
+            vector = np.where(index >= 0, raw[np.maximum(index, 0)], 0.0)
+
+        vector = np.asarray(vector, dtype=np.float32)
+        if self.normalize:
+            total = vector.sum()
+            if total > 0:
+                vector /= total
+        return vector
+
+    def extract_all(self, model: Any, feature_names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Matrice float32 de shape (3, p) : lignes gain, split, cover."""
+        return np.vstack([self.extract(model, feature_names, t) for t in IMPORTANCE_TYPES])
+
+    def stack(self, models: Sequence[Any], feature_names: Sequence[str]) -> np.ndarray:
+        """
+        Importances de plusieurs modèles (runs, folds) : shape (n_models, p).
+        Ex : `stack(models, features).mean(axis=0)` pour l'importance moyenne.
+        """
+        return np.vstack([self.extract(model, feature_names) for model in models])
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def model_feature_names(model: Any) -> List[str]:
+        """Liste des features d'entraînement, dans l'ordre du modèle."""
+        module_name = type(model).__module__
+        if "xgboost" in module_name and hasattr(model, "get_booster"):
+            booster = model.get_booster()
+            if booster.feature_names:
+                return list(booster.feature_names)
+            return [f"f{i}" for i in range(booster.num_features())]
+        if "lightgbm" in module_name and hasattr(model, "booster_"):
+            return list(model.booster_.feature_name())
+        if "catboost" in module_name and hasattr(model, "feature_names_"):
+            return list(model.feature_names_)
+        raise ValueError(
+            f"Modèle non supporté pour l'extraction des importances : {type(model)}"
+        )
+
+    # ------------------------------------------------------------------
+    def _raw_importances(
+        self, model: Any, model_features: List[str], importance_type: str
+    ) -> np.ndarray:
+        module_name = type(model).__module__
+        n_features = len(model_features)
+
+        # ======================
+        # XGBoost
+        # ======================
+        if "xgboost" in module_name:
+            booster = model.get_booster()
+            scores = booster.get_score(importance_type=_XGBOOST_TYPES[importance_type])
+            position = {name: i for i, name in enumerate(model_features)}
+            vector = np.zeros(n_features, dtype=np.float64)
+            for name, value in scores.items():
+                # Noms absents du booster : "fN" désigne la N-ième colonne.
+                i = position.get(name)
+                if i is None and name.startswith("f") and name[1:].isdigit():
+                    i = int(name[1:])
+                if i is not None and i < n_features:
+                    vector[i] = value
+            return vector
+
+        # ======================
+        # LightGBM
+        # ======================
+        if "lightgbm" in module_name:
+            booster = model.booster_
+            if importance_type in ("gain", "split"):
+                return booster.feature_importance(importance_type=importance_type).astype(np.float64)
+
+            # cover : somme des effectifs des nœuds internes, par feature.
+            trees = booster.trees_to_dataframe()
+            internal = trees[trees["split_feature"].notna()]
+            counts = internal.groupby("split_feature")["count"].sum()
+            return counts.reindex(model_features, fill_value=0).to_numpy(dtype=np.float64)
+
+        # ======================
+        # CatBoost
+        # ======================
+        if "catboost" in module_name:
+            if importance_type == "gain":
+                return np.asarray(
+                    model.get_feature_importance(type="PredictionValuesChange"), dtype=np.float64
+                )
+            return self._catboost_tree_statistics(model, n_features, importance_type)
+
+        raise ValueError(
+            f"Modèle non supporté pour l'extraction des importances : {type(model)}"
+        )
+
+    @staticmethod
+    def _catboost_tree_statistics(model: Any, n_features: int, importance_type: str) -> np.ndarray:
+        """
+        Splits et cover CatBoost depuis l'export JSON du modèle.
+
+        Arbres symétriques : chaque split d'un arbre est traversé par toutes
+        les observations, donc sa cover vaut la somme des poids des feuilles.
+        Les splits CTR sont attribués aux features catégorielles combinées.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "model.json"
+            model.save_model(str(path), format="json")
+            dump = json.loads(path.read_text(encoding="utf-8"))
+
+        info = dump.get("features_info", {})
+        float_flat = {
+            f["feature_index"]: f["flat_feature_index"] for f in info.get("float_features", [])
+        }
+        cat_flat = {
+            f["feature_index"]: f["flat_feature_index"] for f in info.get("categorical_features", [])
+        }
+
+        vector = np.zeros(n_features, dtype=np.float64)
+        for tree in dump.get("oblivious_trees", []):
+            weight = (
+                float(np.sum(tree.get("leaf_weights", [])))
+                if importance_type == "cover"
+                else 1.0
+            )
+            for split in tree.get("splits", []):
+                if "float_feature_index" in split:
+                    flats = [float_flat.get(split["float_feature_index"])]
+                elif "cat_feature_index" in split:
+                    flats = [cat_flat.get(split["cat_feature_index"])]
+                else:
+                    flats = [
+                        cat_flat.get(element.get("cat_feature_index"))
+                        for element in split.get("elements", [])
+                    ]
+                for flat in flats:
+                    if flat is not None and flat < n_features:
+                        vector[flat] += weight
+        return vector
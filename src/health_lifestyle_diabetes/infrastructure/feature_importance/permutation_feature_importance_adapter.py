@@ -0,0 +1,201 @@
+"""
+Importance par permutation, indépendante du type de modèle.
+
+Contrairement aux importances « gain » des librairies de boosting
+(biaisées vers les variables à forte cardinalité), elle mesure la perte de
+score lorsque le lien entre une feature et la cible est rompu.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from health_lifestyle_diabetes.domain.ports.feature_importance_port import (
+    FeatureImportancePort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.metrics.confusion_kernels import (
+    rank_auc,
+    ranking_scores,
+)
+
+SCORERS = {
+    "roc_auc": rank_auc,
+    "average_precision": lambda y, p: ranking_scores(y, p)[1],
+}
+
+# État propre à chaque process worker (chargé une seule fois par l'initializer).
+_WORKER_STATE: dict = {}
+
+
+def _init_permutation_worker(model: Any, X: DataFrame, y: np.ndarray, scoring: str) -> None:
+    """
+    Initialise un worker : le modèle et une copie de travail de X sont
+    chargés une seule fois, puis réutilisés pour toutes ses features.
+
+    Chaque colonne de dtype NumPy de la copie de travail est adossée à un
+    ndarray possédé par le worker (`buffers`) : permuter revient à écrire
+    dans ce buffer, sans réallouer ni remplacer la colonne du DataFrame.
+    """
+    buffers = {
+        column: X[column].to_numpy(copy=True)
+        for column in X.columns
+        if isinstance(X[column].dtype, np.dtype)
+    }
+    working = DataFrame(
+        {column: buffers.get(column, X[column].copy()) for column in X.columns},
+        index=X.index,
+        copy=False,
+    )
+    n_rows = len(X)
+    _WORKER_STATE.update(
+        model=model,
+        X=working,
+        y=y,
+        scorer=SCORERS[scoring],
+        buffers=buffers,
+        # Tampons réutilisés pour toutes les features du worker.
+        identity=np.arange(n_rows),
+        perm=np.empty(n_rows, dtype=np.int64),
+        saved={},
+    )
+
+
+def _saved_buffer(dtype: np.dtype) -> np.ndarray:
+    """Tampon de sauvegarde de la colonne originale (un par dtype et par worker)."""
+    saved = _WORKER_STATE["saved"]
+    if dtype not in saved:
+        saved[dtype] = np.empty(len(_WORKER_STATE["identity"]), dtype=dtype)
+    return saved[dtype]
+
+
+def _permute_feature(column: str, seed: np.random.SeedSequence, n_repeats: int) -> Tuple[str, np.ndarray]:
+    """
+    Score du modèle après permutation de `column`, répété `n_repeats` fois.
+
+    Colonnes NumPy : les valeurs originales sont copiées dans un tampon
+    préalloué, puis chaque permutation est écrite en place dans le buffer
+    de la colonne (`np.take(..., out=...)`, index mélangé en place) ; la
+    colonne est restaurée par `np.copyto`. Colonnes à dtype d'extension
+    (category, nullable...) : la colonne permutée est réassignée.
+    """
+    model, X, y = _WORKER_STATE["model"], _WORKER_STATE["X"], _WORKER_STATE["y"]
+    scorer = _WORKER_STATE["scorer"]
+    rng = np.random.default_rng(seed)
+    scores = np.empty(n_repeats, dtype=np.float64)
+
+    buffer = _WORKER_STATE["buffers"].get(column)
+    if buffer is not None and np.may_share_memory(X[column].to_numpy(), buffer):
+        identity, perm = _WORKER_STATE["identity"], _WORKER_STATE["perm"]
+        saved = _saved_buffer(buffer.dtype)
+        np.copyto(saved, buffer)
+        try:
+            for r in range(n_repeats):
+                # Même tirage que rng.permutation(n) (arange + shuffle).
+                np.copyto(perm, identity)
+                rng.shuffle(perm)
+                np.take(saved, perm, out=buffer)
+                scores[r] = scorer(y, model.predict_proba(X)[:, 1])
+        finally:
+            np.copyto(buffer, saved)
+        return column, scores
+
+    original = X[column].array
+    try:
+        for r in range(n_repeats):
+            X[column] = original.take(rng.permutation(len(X)))
+            scores[r] = scorer(y, model.predict_proba(X)[:, 1])
+    finally:
+        X[column] = original
+    return column, scores
+
+
+class PermutationFeatureImportanceAdapter(FeatureImportancePort):
+    """
+    Importance par permutation : baisse moyenne du score (ROC-AUC par
+    défaut) quand une colonne est permutée.
+
+    - une copie de travail unique de X par process (pas de copie par feature) ;
+      les colonnes NumPy sont permutées en place dans des buffers préalloués,
+    - score vectorisé (rang de Mann-Whitney, un seul tri),
+    - `n_repeats` permutations par feature, graines dérivées de
+      `random_state` (résultat identique quel que soit `n_jobs`),
+    - parallélisation des features sur plusieurs process.
+    """
+
+    def __init__(
+        self,
+        X_eval: DataFrame,
+        y_eval: Sequence[int],
+        logger: LoggerPort,
+        *,
+        features: Optional[Sequence[str]] = None,
+        n_repeats: int = 5,
+        scoring: str = "roc_auc",
+        random_state: int = 42,
+        n_jobs: int = 1,
+    ):
+        if scoring not in SCORERS:
+            raise ValueError(f"scoring doit être l'un de {sorted(SCORERS)}")
+
+        self.X_eval = X_eval
+        self.y_eval = np.asarray(y_eval)
+        self.logger = logger
+        self.features = list(features) if features is not None else list(X_eval.columns)
+        self.n_repeats = n_repeats
+        self.scoring = scoring
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+
+    def get_feature_importances(self, model: Any) -> Dict[str, float]:
+        stats = self.get_importance_statistics(model)
+        return {
+            name: values["importance_mean"]
+            for name, values in sorted(
+                stats.items(), key=lambda x: x[1]["importance_mean"], reverse=True
+            )
+        }
+
+    def get_importance_statistics(self, model: Any) -> Dict[str, Dict[str, float]]:
+        """
+        Retourne {feature: {"importance_mean", "importance_std"}}.
+        """
+        baseline = SCORERS[self.scoring](self.y_eval, model.predict_proba(self.X_eval)[:, 1])
+        seeds = np.random.SeedSequence(self.random_state).spawn(len(self.features))
+        tasks = list(zip(self.features, seeds))
+
+        self.logger.info(
+            f"Permutation importance | features={len(tasks)} | repeats={self.n_repeats} | "
+            f"scoring={self.scoring} | baseline={baseline:.4f} | n_jobs={self.n_jobs}"
+        )
+
+        init_args = (model, self.X_eval, self.y_eval, self.scoring)
+        results: List[Tuple[str, np.ndarray]]
+        if self.n_jobs == 1:
+            _init_permutation_worker(*init_args)
+            try:
+                results = [_permute_feature(c, s, self.n_repeats) for c, s in tasks]
+            finally:
+                _WORKER_STATE.clear()
+        else:
+            max_workers = min(self.n_jobs if self.n_jobs > 0 else os.cpu_count() or 1, len(tasks))
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_permutation_worker,
+                initargs=init_args,
+            ) as executor:
+                futures = [executor.submit(_permute_feature, c, s, self.n_repeats) for c, s in tasks]
+                results = [f.result() for f in futures]
+
+        stats = {
+            column: {
+                "importance_mean": float(baseline - scores.mean()),
+                "importance_std": float(scores.std()),
+            }
+            for column, scores in results
+        }
+        self.logger.info("Permutation importance terminée.")
+        return stats
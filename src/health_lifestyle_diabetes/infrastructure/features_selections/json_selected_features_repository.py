@@ -0,0 +1,128 @@
+# src/health_lifestyle_diabetes/infrastructure/features_selections/json_selected_features_repository.py
+import json
+import os
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from health_lifestyle_diabetes.domain.entities.feature_selection_result import (
+    FeatureSelectionResult,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.selected_features_repository_port import (
+    SelectedFeaturesRepositoryPort,
+)
+from health_lifestyle_diabetes.infrastructure.features_selections.features_selection import (
+    SELECTED_FEATURES,
+)
+from health_lifestyle_diabetes.infrastructure.utils.exceptions import (
+    DatasetLoadingError,
+    DatasetSavingError,
+)
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
+
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
+
+SCHEMA_VERSION = 1
+
+
+def __getattr__(name: str):
+    """Constantes de chemin résolues à la demande (PEP 562), sans effet de bord à l'import."""
+    if name == "SELECTED_FEATURES_PATH":
+        return _default_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _default_path(settings: Optional["AppSettings"] = None) -> Path:
+    """Emplacement de l'artefact des features sélectionnées (configs/paths.yaml)."""
+    return (settings or get_settings()).paths.data.output.selected_features
+
+
+class JsonSelectedFeaturesRepository(SelectedFeaturesRepositoryPort):
+    """
+    Persistance JSON versionnée de la liste de features sélectionnées.
+
+    - `selected_features.json` contient toujours la dernière version,
+    - chaque sauvegarde est archivée en `selected_features.v<N>.json`,
+    - l'écriture est atomique (fichier temporaire + os.replace).
+    """
+
+    def __init__(
+        self,
+        logger: LoggerPort,
+        path: Optional[Path] = None,
+        settings: Optional["AppSettings"] = None,
+    ):
+        self.logger = logger
+        self.path = Path(path) if path is not None else _default_path(settings)
+
+    def save(self, result: FeatureSelectionResult) -> FeatureSelectionResult:
+        previous = self._read_payload()
+        version = int(previous["version"]) + 1 if previous else 1
+        result = replace(result, version=version)
+
+        payload = {
+            "schema_version": SCHEMA_VERSION,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            **asdict(result),
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            archive = self.path.with_name(f"{self.path.stem}.v{version}{self.path.suffix}")
+            for target in (archive, self.path):
+                tmp = target.with_suffix(target.suffix + ".tmp")
+                tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+                os.replace(tmp, target)
+        except OSError as exc:
+            raise DatasetSavingError(
+                f"Impossible de sauvegarder les features sélectionnées : {exc}"
+            ) from exc
+
+        self.logger.info(
+            f"Features sélectionnées sauvegardées | version={version} | "
+            f"n_features={len(result.features)} | fichier={self.path}"
+        )
+        return result
+
+    def load(self) -> Optional[List[str]]:
+        payload = self._read_payload()
+        if payload is None:
+            return None
+        self.logger.info(
+            f"Features sélectionnées chargées | version={payload.get('version')} | "
+            f"n_features={len(payload['features'])}"
+        )
+        return list(payload["features"])
+
+    def _read_payload(self) -> Optional[dict]:
+        if not self.path.exists():
+            return None
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            raise DatasetLoadingError(
+                f"Artefact de features sélectionnées illisible : {self.path}"
+            ) from exc
+
+
+def load_selected_features(
+    path: Optional[Path] = None, settings: Optional["AppSettings"] = None
+) -> List[str]:
+    """
+    Liste de features à utiliser pour l'entraînement / l'inférence.
+
+    Retourne la dernière version de l'artefact produit par la sélection
+    automatique, ou `SELECTED_FEATURES` (liste historique) s'il n'existe pas.
+    """
+    path = Path(path) if path is not None else _default_path(settings)
+    if not path.exists():
+        return list(SELECTED_FEATURES)
+    try:
+        return list(json.loads(path.read_text(encoding="utf-8"))["features"])
+    except (OSError, ValueError, KeyError) as exc:
+        raise DatasetLoadingError(
+            f"Artefact de features sélectionnées illisible : {path}"
+        ) from exc
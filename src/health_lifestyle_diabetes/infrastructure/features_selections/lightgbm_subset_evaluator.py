@@ -0,0 +1,162 @@
+# src/health_lifestyle_diabetes/infrastructure/features_selections/lightgbm_subset_evaluator.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import lightgbm as lgb
+import numpy as np
+from pandas import Categorical, DataFrame
+
+from health_lifestyle_diabetes.domain.ports.feature_subset_evaluator_port import (
+    FeatureSubsetEvaluatorPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.metrics.confusion_kernels import rank_auc
+
+# Modèle proxy : volontairement léger, l'early stopping borne le coût.
+DEFAULT_PROXY_PARAMS: Dict[str, Any] = {
+    "n_estimators": 400,
+    "learning_rate": 0.1,
+    "num_leaves": 31,
+    "min_child_samples": 50,
+    "subsample": 0.8,
+    "subsample_freq": 1,
+    "colsample_bytree": 0.8,
+    "max_bin": 63,
+    "verbose": -1,
+}
+
+# État propre à chaque process worker (chargé une seule fois par l'initializer).
+_WORKER_STATE: dict = {}
+
+
+def _init_subset_worker(
+    X_train: DataFrame,
+    y_train: np.ndarray,
+    X_valid: DataFrame,
+    y_valid: np.ndarray,
+    params: Dict[str, Any],
+    early_stopping_rounds: int,
+) -> None:
+    _WORKER_STATE.update(
+        X_train=X_train,
+        y_train=y_train,
+        X_valid=X_valid,
+        y_valid=y_valid,
+        params=params,
+        early_stopping_rounds=early_stopping_rounds,
+    )
+
+
+def _evaluate_subset(features: Tuple[str, ...]) -> Tuple[float, Dict[str, float]]:
+    """
+    Entraîne le proxy LightGBM (early stopping sur la validation) sur
+    `features` et retourne (ROC-AUC de validation, importances gain).
+    """
+    columns = list(features)
+    X_valid, y_valid = _WORKER_STATE["X_valid"][columns], _WORKER_STATE["y_valid"]
+
+    model = lgb.LGBMClassifier(**_WORKER_STATE["params"])
+    model.fit(
+        _WORKER_STATE["X_train"][columns],
+        _WORKER_STATE["y_train"],
+        eval_set=[(X_valid, y_valid)],
+        eval_metric="auc",
+        callbacks=[lgb.early_stopping(_WORKER_STATE["early_stopping_rounds"], verbose=False)],
+    )
+    score = rank_auc(y_valid, model.predict_proba(X_valid)[:, 1])
+    gains = model.booster_.feature_importance(importance_type="gain")
+    return float(score), dict(zip(columns, map(float, gains)))
+
+
+class LightGBMSubsetEvaluator(FeatureSubsetEvaluatorPort):
+    """
+    Évaluateur de sous-ensembles de features par un proxy LightGBM.
+
+    - conversion catégorielle faite une seule fois,
+    - sous-ensembles évalués en parallèle (ProcessPoolExecutor, données
+      chargées une seule fois par worker),
+    - résultats mis en cache par ensemble de features (l'ordre n'importe pas).
+    """
+
+    metric = "roc_auc"
+
+    def __init__(
+        self,
+        X_train: DataFrame,
+        y_train: Sequence[int],
+        X_valid: DataFrame,
+        y_valid: Sequence[int],
+        logger: LoggerPort,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        early_stopping_rounds: int = 30,
+        n_jobs: int = 1,
+        random_state: int = 42,
+    ):
+        self.logger = logger
+        self.n_jobs = n_jobs
+        self.early_stopping_rounds = early_stopping_rounds
+        self.params = {
+            **DEFAULT_PROXY_PARAMS,
+            "random_state": random_state,
+            # Un thread par process en mode parallèle : pas de sur-souscription.
+            "n_jobs": 1 if n_jobs != 1 else -1,
+            **(params or {}),
+        }
+
+        self.X_train, self.X_valid = self._as_category(X_train, X_valid)
+        self.y_train = np.asarray(y_train)
+        self.y_valid = np.asarray(y_valid)
+
+        self._cache: Dict[frozenset, Tuple[float, Dict[str, float]]] = {}
+
+    def evaluate_many(
+        self,
+        subsets: Sequence[Sequence[str]],
+    ) -> List[Tuple[float, Dict[str, float]]]:
+        keys = [frozenset(subset) for subset in subsets]
+        pending = {key: tuple(subset) for key, subset in zip(keys, subsets) if key not in self._cache}
+
+        self.logger.debug(
+            f"Évaluation de {len(subsets)} sous-ensembles | cache={len(subsets) - len(pending)}"
+        )
+
+        if pending:
+            init_args = (
+                self.X_train,
+                self.y_train,
+                self.X_valid,
+                self.y_valid,
+                self.params,
+                self.early_stopping_rounds,
+            )
+            if self.n_jobs == 1 or len(pending) == 1:
+                _init_subset_worker(*init_args)
+                try:
+                    results = [_evaluate_subset(subset) for subset in pending.values()]
+                finally:
+                    _WORKER_STATE.clear()
+            else:
+                max_workers = min(self.n_jobs if self.n_jobs > 0 else os.cpu_count() or 1, len(pending))
+                with ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_subset_worker,
+                    initargs=init_args,
+                ) as executor:
+                    results = list(executor.map(_evaluate_subset, pending.values()))
+            self._cache.update(zip(pending.keys(), results))
+
+        return [self._cache[key] for key in keys]
+
+    @staticmethod
+    def _as_category(X_train: DataFrame, X_valid: DataFrame) -> Tuple[DataFrame, DataFrame]:
+        """Conversion catégorielle avec les mêmes modalités en train et en validation."""
+        object_columns = X_train.select_dtypes(include=["object", "string"]).columns
+        if len(object_columns) == 0:
+            return X_train, X_valid
+        X_train, X_valid = X_train.copy(), X_valid.copy()
+        for col in object_columns:
+            X_train[col] = X_train[col].astype("category")
+            X_valid[col] = Categorical(X_valid[col], categories=X_train[col].cat.categories)
+        return X_train, X_valid
@@ -1,15 +1,17 @@
 # src/health_lifestyle_diabetes/infrastructure/logger/config.py
 
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
 
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import YamlConfigLoader
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
 
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
 
-def configure_logging(env: str = "dev") -> None:
+
+def configure_logging(env: str = "dev", settings: Optional["AppSettings"] = None) -> None:
     """
     Configure le logger global Loguru (console + fichier).
 
@@ -25,10 +27,7 @@ def configure_logging(env: str = "dev") -> None:
     """
 
     # ── Load config (lazy, pas d'effet de bord à l'import)
-    root = get_repository_root()
-    cfg = YamlConfigLoader().load_config(root / "configs/paths.yaml")
-
-    logs_dir = root / Path(cfg["logs"]["folder"])
+    logs_dir = (settings or get_settings()).paths.logs.folder
     logs_dir.mkdir(parents=True, exist_ok=True)
 
     # ── Reset pour éviter les doublons (notebooks, reload, tests)
@@ -0,0 +1,107 @@
+"""
+Benchmark du surcoût du logging dans la boucle de streaming.
+
+Le même DataFrame synthétique est streamé (délais à 0) avec plusieurs
+configurations de logger ; le temps par ligne est comparé à celui du
+NullLogger (référence sans logging).
+
+Configurations :
+- null          : NullLogger (aucun log),
+- loguru        : LoguruLogger, un log par ligne (sink vers /dev/null),
+- loguru-warn   : LoguruLogger("WARNING"), logs info filtrés avant formatage,
+- sampled       : SampledLogger (1 log sur 1000, comportement par défaut).
+
+Usage :
+    python -m health_lifestyle_diabetes.infrastructure.logger.logging_benchmark
+    python -m health_lifestyle_diabetes.infrastructure.logger.logging_benchmark \\
+        --rows 50000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.logger.loguru_logger import LoguruLogger
+from health_lifestyle_diabetes.infrastructure.logger.performance_logging import (
+    NullLogger,
+)
+from health_lifestyle_diabetes.infrastructure.streaming.pandas_dataframe_streamer import (
+    PandasDataFrameStreamer,
+)
+
+# Nom -> (fabrique du logger, log_every du streamer).
+SCENARIOS: Dict[str, tuple[Callable[[], LoggerPort], int]] = {
+    "null": (NullLogger, 1),
+    "loguru": (LoguruLogger, 1),
+    "loguru-warn": (lambda: LoguruLogger("WARNING"), 1),
+    "sampled": (LoguruLogger, 1000),
+}
+
+
+def make_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """DataFrame synthétique (colonnes numériques et catégorielles)."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "age": rng.integers(18, 90, rows),
+            "bmi": rng.normal(27.0, 4.0, rows),
+            "smoking_status": rng.choice(["Never", "Former", "Current"], rows),
+        }
+    )
+
+
+def time_stream(df: pd.DataFrame, log: LoggerPort, log_every: int) -> float:
+    """Durée (s) du parcours complet du flux."""
+    streamer = PandasDataFrameStreamer(logger=log, log_every=log_every)
+    start = time.perf_counter()
+    for _ in streamer.stream(df, min_delay=0.0, max_delay=0.0):
+        pass
+    return time.perf_counter() - start
+
+
+def run(rows: int, repeat: int) -> Dict[str, float]:
+    """Temps médian par ligne (µs) pour chaque scénario."""
+    df = make_frame(rows)
+    results: Dict[str, float] = {}
+    for name, (factory, log_every) in SCENARIOS.items():
+        durations: List[float] = [
+            time_stream(df, factory(), log_every) for _ in range(repeat)
+        ]
+        results[name] = statistics.median(durations) / rows * 1e6
+    return results
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # Sink unique vers /dev/null : mesure le coût du formatage/dispatch,
+    # pas celui du terminal.
+    logger.remove()
+    devnull = open(os.devnull, "w")
+    logger.add(devnull, level="DEBUG")
+    try:
+        results = run(args.rows, args.repeat)
+    finally:
+        logger.remove()
+        devnull.close()
+
+    reference = results["null"]
+    print(f"{'scénario':<14}{'µs/ligne':>10}{'surcoût':>12}")
+    for name, per_row in results.items():
+        print(f"{name:<14}{per_row:>10.2f}{per_row - reference:>+12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,17 @@
+from typing import Callable, Optional, Union
+
 from loguru import logger
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
 
+# Message éventuellement paresseux : construit seulement si le niveau est actif.
+Message = Union[str, Callable[[], str]]
+
+_LEVELS = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40}
+
+# Profondeur de base : `_emit` + méthode publique, pour remonter à
+# l'appelant réel.
+_BASE_DEPTH = 2
+
 
 class LoguruLogger(LoggerPort):
     """
@@ -8,22 +19,55 @@ class LoguruLogger(LoggerPort):
 
     - Ne configure pas Loguru (fait ailleurs, au point d'entrée).
     - Délègue les appels au logger global.
-    - Remonte l'appelant réel grâce à `opt(depth=1)` pour
+    - Remonte l'appelant réel grâce à `opt(depth=...)` pour
       afficher la bonne fonction, fichier et ligne dans les logs.
+      Un décorateur (ex: SampledLogger) ajoute ses propres frames via
+      `with_depth(n)`.
+
+    Mode performance (`level="INFO"`, `"WARNING"`...) : les appels sous le
+    niveau sont ignorés avant tout formatage, et un message peut être une
+    fonction sans argument (construit seulement si le niveau est actif).
+    Sans contexte, aucun `bind()` n'est fait.
     """
 
-    def info(self, message: str, **ctx) -> None:
+    def __init__(self, level: Optional[str] = None, depth: int = 0):
+        self.level = level
+        self.min_level = _LEVELS[level.upper()] if level else 0
+        self.depth = depth
+        # Logger pré-configuré : évite un `opt()` par appel sans contexte.
+        self._caller = logger.opt(depth=_BASE_DEPTH + depth)
+
+    def with_depth(self, offset: int) -> "LoguruLogger":
+        """Copie dont l'appelant rapporté est `offset` frames plus haut."""
+        return LoguruLogger(self.level, depth=self.depth + offset)
+
+    def is_enabled_for(self, level: str) -> bool:
+        return _LEVELS[level.upper()] >= self.min_level
+
+    def info(self, message: Message, **ctx) -> None:
         """Log une information décrivant le déroulement normal de l'application."""
-        logger.bind(**ctx).opt(depth=1).info(message)
+        if self.min_level <= 20:
+            self._emit("info", message, ctx)
 
-    def warning(self, message: str, **ctx) -> None:
+    def warning(self, message: Message, **ctx) -> None:
         """Log un avertissement signalant une situation anormale non bloquante."""
-        logger.bind(**ctx).opt(depth=1).warning(message)
+        if self.min_level <= 30:
+            self._emit("warning", message, ctx)
 
-    def error(self, message: str, **ctx) -> None:
+    def error(self, message: Message, **ctx) -> None:
         """Log une erreur indiquant un échec ou un comportement inattendu."""
-        logger.bind(**ctx).opt(depth=1).error(message)
+        if self.min_level <= 40:
+            self._emit("error", message, ctx)
 
-    def debug(self, message: str, **ctx) -> None:
+    def debug(self, message: Message, **ctx) -> None:
         """Log un message de debug destiné au diagnostic technique."""
-        logger.bind(**ctx).opt(depth=1).debug(message)
\ No newline at end of file
+        if self.min_level <= 10:
+            self._emit("debug", message, ctx)
+
+    def _emit(self, method: str, message: Message, ctx: dict) -> None:
+        if callable(message):
+            message = message()
+        target = (
+            logger.bind(**ctx).opt(depth=_BASE_DEPTH + self.depth) if ctx else self._caller
+        )
+        getattr(target, method)(message)
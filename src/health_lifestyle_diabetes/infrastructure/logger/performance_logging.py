@@ -0,0 +1,104 @@
+"""
+Loggers pour chemins chauds (boucles par ligne / par itération).
+
+- NullLogger    : adaptateur no-op du LoggerPort (benchmarks, inférence batch).
+- SampledLogger : décorateur d'un LoggerPort qui n'émet qu'un message sur
+  `every` (et/ou au plus un toutes les `min_interval` secondes) pour les
+  niveaux échantillonnés ; le nombre de messages ignorés est ajouté au
+  message émis. Les messages peuvent être paresseux (fonction sans
+  argument), construits seulement s'ils sont émis.
+"""
+
+import time
+from typing import Callable, Dict, Iterable, Optional, Union
+
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+
+Message = Union[str, Callable[[], str]]
+
+
+class NullLogger(LoggerPort):
+    """Adaptateur no-op : aucun formatage, aucune sortie."""
+
+    def is_enabled_for(self, level: str) -> bool:
+        return False
+
+    def debug(self, message: Message, **ctx) -> None:
+        pass
+
+    def info(self, message: Message, **ctx) -> None:
+        pass
+
+    def warning(self, message: Message, **ctx) -> None:
+        pass
+
+    def error(self, message: Message, **ctx) -> None:
+        pass
+
+
+class SampledLogger(LoggerPort):
+    """
+    Échantillonnage / limitation de débit des logs par enregistrement.
+
+    Un message est émis si c'est le premier depuis la dernière émission
+    qui atteint `every` appels, ou si `min_interval` secondes se sont
+    écoulées. Les niveaux hors `sampled_levels` (warning, error par
+    défaut) sont toujours transmis.
+
+    Si le logger décoré expose `with_depth` (LoguruLogger), les frames du
+    décorateur sont sautées : l'appelant réel reste celui rapporté.
+    """
+
+    def __init__(
+        self,
+        logger: LoggerPort,
+        every: int = 1000,
+        min_interval: Optional[float] = None,
+        sampled_levels: Iterable[str] = ("debug", "info"),
+    ):
+        # +2 frames : méthode publique + `_log`.
+        with_depth = getattr(logger, "with_depth", None)
+        self.logger = with_depth(2) if with_depth is not None else logger
+        self.every = max(1, every)
+        self.min_interval = min_interval
+        self.sampled_levels = frozenset(level.lower() for level in sampled_levels)
+        self._suppressed: Dict[str, int] = {}
+        self._last_emit: Dict[str, float] = {}
+
+    def is_enabled_for(self, level: str) -> bool:
+        check = getattr(self.logger, "is_enabled_for", None)
+        return check(level) if check is not None else True
+
+    def debug(self, message: Message, **ctx) -> None:
+        self._log("debug", message, ctx)
+
+    def info(self, message: Message, **ctx) -> None:
+        self._log("info", message, ctx)
+
+    def warning(self, message: Message, **ctx) -> None:
+        self._log("warning", message, ctx)
+
+    def error(self, message: Message, **ctx) -> None:
+        self._log("error", message, ctx)
+
+    def _log(self, level: str, message: Message, ctx: dict) -> None:
+        if level in self.sampled_levels:
+            if not self.is_enabled_for(level):
+                return
+            suppressed = self._suppressed.get(level)
+            if suppressed is not None and suppressed + 1 < self.every:
+                if self.min_interval is None or (
+                    time.monotonic() - self._last_emit[level] < self.min_interval
+                ):
+                    self._suppressed[level] = suppressed + 1
+                    return
+            self._suppressed[level] = 0
+            self._last_emit[level] = time.monotonic()
+            if callable(message):
+                message = message()
+            if suppressed:
+                message = f"{message} [+{suppressed} messages ignorés]"
+        elif callable(message):
+            message = message()
+
+        getattr(self.logger, level)(message, **ctx)
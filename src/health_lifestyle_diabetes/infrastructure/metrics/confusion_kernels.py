@@ -0,0 +1,353 @@
+"""
+Noyaux NumPy partagés pour le calcul des comptes de confusion.
+
+Toutes les métriques de classification binaire (seuil fixe, balayage de
+seuils, ROC/PR) se déduisent des quatre comptes TN/FP/FN/TP. Ces fonctions
+les calculent en une passe (np.bincount) ou en un seul tri (np.argsort +
+np.cumsum), sans ré-valider les entrées à chaque métrique comme le fait
+sklearn.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def as_binary_array(values: Sequence[int]) -> np.ndarray:
+    """Convertit une séquence de labels 0/1 en tableau int8 (sans copie si possible)."""
+    return np.asarray(values).astype(np.int8, copy=False)
+
+
+def confusion_counts(y_true: Sequence[int], y_pred: Sequence[int]) -> Tuple[int, int, int, int]:
+    """
+    Comptes (tn, fp, fn, tp) en une seule passe.
+
+    Le code 2 * y_true + y_pred vaut 0=TN, 1=FP, 2=FN, 3=TP.
+    """
+    codes = 2 * as_binary_array(y_true) + as_binary_array(y_pred)
+    tn, fp, fn, tp = np.bincount(codes, minlength=4)[:4]
+    return int(tn), int(fp), int(fn), int(tp)
+
+
+def binary_clf_curve(
+    y_true: Sequence[int],
+    y_proba: Sequence[float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Comptes TP / FP cumulés pour chaque seuil distinct, en O(n log n).
+
+    Les probabilités sont triées une seule fois par ordre décroissant ;
+    pour chaque valeur distincte t, les positifs prédits sont {p >= t}.
+
+    Returns
+    -------
+    thresholds : np.ndarray
+        Seuils distincts, ordre décroissant.
+    tps : np.ndarray
+        Vrais positifs pour chaque seuil.
+    fps : np.ndarray
+        Faux positifs pour chaque seuil.
+    """
+    y_true = as_binary_array(y_true)
+    y_proba = np.asarray(y_proba, dtype=np.float64)
+
+    if y_true.shape != y_proba.shape:
+        raise ValueError("y_true et y_proba doivent avoir la même taille.")
+
+    # Tri non stable suffisant : les ex-aequo sont regroupés juste après.
+    order = np.argsort(-y_proba)
+    y_score = y_proba[order]
+    y_sorted = y_true[order]
+
+    # Dernière position de chaque groupe de scores égaux.
+    distinct = np.flatnonzero(np.diff(y_score))
+    ends = np.r_[distinct, y_sorted.size - 1]
+
+    tps = np.cumsum(y_sorted, dtype=np.int64)[ends]
+    fps = (ends + 1) - tps
+    return y_score[ends], tps, fps
+
+
+def safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Division élément par élément renvoyant 0 là où le dénominateur est nul."""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.zeros(np.broadcast(numerator, denominator).shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def ranking_scores(
+    y_true: Sequence[int],
+    y_proba: Sequence[float],
+) -> Tuple[float, float]:
+    """
+    ROC-AUC et Average Precision à partir d'un seul tri.
+
+    - ROC-AUC : intégration trapézoïdale de la courbe (FPR, TPR),
+    - AP : somme des (R_k - R_{k-1}) * P_k, identique à
+      sklearn.metrics.average_precision_score (pas d'interpolation).
+
+    Retourne NaN si une seule classe est présente.
+    """
+    _, tps, fps = binary_clf_curve(y_true, y_proba)
+    if tps.size == 0:
+        return float("nan"), float("nan")
+
+    n_pos, n_neg = tps[-1], fps[-1]
+    if n_pos == 0 or n_neg == 0:
+        return float("nan"), float("nan")
+
+    tpr = np.r_[0.0, tps / n_pos]
+    fpr = np.r_[0.0, fps / n_neg]
+    auc_roc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2.0)
+
+    precision = tps / (tps + fps)
+    auc_pr = float(np.sum(np.diff(tpr) * precision))
+
+    return auc_roc, auc_pr
+
+
+def threshold_metrics(tn: float, fp: float, fn: float, tp: float) -> dict:
+    """
+    Toutes les métriques « à seuil » déduites des quatre comptes de confusion.
+
+    Fonctionne indifféremment sur des scalaires ou des tableaux de comptes
+    (un élément par seuil, par réplique bootstrap, par cohorte...).
+    """
+    tn, fp, fn, tp = (np.asarray(v, dtype=np.float64) for v in (tn, fp, fn, tp))
+    n = tn + fp + fn + tp
+
+    accuracy = safe_ratio(tp + tn, n)
+    precision = safe_ratio(tp, tp + fp)
+    recall = safe_ratio(tp, tp + fn)
+    f1 = safe_ratio(2 * tp, 2 * tp + fp + fn)
+    fpr = safe_ratio(fp, fp + tn)
+    fnr = safe_ratio(fn, fn + tp)
+
+    # Cohen's kappa : accord observé vs accord attendu par hasard.
+    p_expected = safe_ratio((tp + fp) * (tp + fn) + (fn + tn) * (fp + tn), n * n)
+    kappa = safe_ratio(accuracy - p_expected, 1.0 - p_expected)
+
+    # MCC : 0 si une ligne ou colonne de la matrice est vide (convention sklearn).
+    mcc = safe_ratio(
+        tp * tn - fp * fn,
+        np.sqrt((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn)),
+    )
+
+    return {
+        "accuracy": accuracy,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "false_positive_rate": fpr,
+        "false_negative_rate": fnr,
+        "kappa": kappa,
+        "mcc": mcc,
+    }
+
+
+def batched_confusion_counts(codes: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Comptes de confusion pondérés pour un lot de répliques.
+
+    Parameters
+    ----------
+    codes : np.ndarray, shape (n,)
+        Code de confusion par ligne (2 * y_true + y_pred, cf. confusion_counts).
+    weights : np.ndarray, shape (B, n)
+        Poids de chaque ligne dans chaque réplique (multiplicités bootstrap).
+
+    Returns
+    -------
+    np.ndarray, shape (B, 4)
+        Colonnes (tn, fp, fn, tp).
+    """
+    one_hot = np.zeros((codes.size, 4), dtype=weights.dtype)
+    one_hot[np.arange(codes.size), codes] = 1
+    return weights @ one_hot
+
+
+def batched_ranking_scores(
+    y_sorted: np.ndarray,
+    weights: np.ndarray,
+    ends: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ROC-AUC et Average Precision pondérées pour un lot de répliques.
+
+    Les lignes sont supposées déjà triées par probabilité décroissante
+    (un seul tri pour toutes les répliques) ; `ends` donne la dernière
+    position de chaque groupe de probabilités égales.
+
+    Returns
+    -------
+    (auc_roc, auc_pr) : deux np.ndarray de shape (B,), NaN si une réplique
+    ne contient qu'une seule classe.
+    """
+    tps = np.cumsum(weights * y_sorted, axis=1)[:, ends]
+    fps = np.cumsum(weights * (1 - y_sorted), axis=1)[:, ends]
+
+    n_pos = tps[:, -1:]
+    n_neg = fps[:, -1:]
+    valid = (n_pos[:, 0] > 0) & (n_neg[:, 0] > 0)
+
+    zeros = np.zeros((weights.shape[0], 1))
+    tpr = np.hstack([zeros, safe_ratio(tps, n_pos)])
+    fpr = np.hstack([zeros, safe_ratio(fps, n_neg)])
+
+    auc_roc = np.sum(np.diff(fpr, axis=1) * (tpr[:, 1:] + tpr[:, :-1]), axis=1) / 2.0
+    auc_pr = np.sum(np.diff(tpr, axis=1) * safe_ratio(tps, tps + fps), axis=1)
+
+    return np.where(valid, auc_roc, np.nan), np.where(valid, auc_pr, np.nan)
+
+
+def histogram_ranking_scores(pos_hist: np.ndarray, neg_hist: np.ndarray) -> Tuple[float, float]:
+    """
+    ROC-AUC et Average Precision approchées à partir d'histogrammes de
+    probabilités par classe (un seuil candidat par bord de bin).
+
+    Les probabilités d'un même bin sont traitées comme ex-aequo : l'erreur
+    est bornée par la résolution des bins.
+    """
+    tps = np.cumsum(pos_hist[::-1], dtype=np.float64)
+    fps = np.cumsum(neg_hist[::-1], dtype=np.float64)
+    n_pos, n_neg = tps[-1], fps[-1]
+    if n_pos == 0 or n_neg == 0:
+        return float("nan"), float("nan")
+
+    tpr = np.r_[0.0, tps / n_pos]
+    fpr = np.r_[0.0, fps / n_neg]
+    auc_roc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2.0)
+    auc_pr = float(np.sum(np.diff(tpr) * safe_ratio(tps, tps + fps)))
+    return auc_roc, auc_pr
+
+
+def grouped_ranking_scores(
+    group_ids: np.ndarray,
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    n_groups: int,
+    presorted: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    ROC-AUC et Average Precision de chaque groupe, en un seul tri.
+
+    Les lignes sont triées par (groupe, probabilité décroissante) : tri par
+    probabilité (sauté si ``presorted=True``, lignes déjà triées par
+    probabilité décroissante) puis tri stable (radix) par groupe. Les
+    sommes cumulées sont ensuite ramenées à l'origine de chaque groupe et
+    les contributions trapézoïdales agrégées par np.bincount.
+
+    Returns
+    -------
+    (auc_roc, auc_pr) : deux np.ndarray de shape (n_groups,), NaN pour les
+    groupes ne contenant qu'une seule classe.
+    """
+    group_ids = np.asarray(group_ids, dtype=np.int64)
+    y_true = as_binary_array(y_true)
+    y_proba = np.asarray(y_proba, dtype=np.float64)
+
+    order = np.arange(y_proba.size) if presorted else np.argsort(-y_proba)
+    order = order[np.argsort(group_ids[order], kind="stable")]
+    g_sorted = group_ids[order]
+    p_sorted = y_proba[order]
+    y_sorted = y_true[order]
+
+    # Fin de chaque bloc (groupe, probabilité) identique.
+    boundary = (np.diff(g_sorted) != 0) | (np.diff(p_sorted) != 0)
+    ends = np.r_[np.flatnonzero(boundary), g_sorted.size - 1]
+    g_ends = g_sorted[ends]
+
+    # Sommes cumulées ramenées au début de chaque groupe.
+    sizes = np.bincount(g_sorted, minlength=n_groups)
+    starts = np.r_[0, np.cumsum(sizes)[:-1]]
+    cum_pos = np.cumsum(y_sorted, dtype=np.int64)
+    base_pos = np.r_[0, cum_pos][starts]
+
+    tps = (cum_pos[ends] - base_pos[g_ends]).astype(np.float64)
+    fps = (ends + 1 - starts[g_ends]) - tps
+
+    first = np.r_[True, g_ends[1:] != g_ends[:-1]]
+    prev_tps = np.where(first, 0.0, np.r_[0.0, tps[:-1]])
+    prev_fps = np.where(first, 0.0, np.r_[0.0, fps[:-1]])
+
+    n_pos = np.bincount(g_sorted, weights=y_sorted, minlength=n_groups)
+    n_neg = sizes - n_pos
+    valid = (n_pos > 0) & (n_neg > 0)
+
+    area = np.bincount(
+        g_ends, weights=(fps - prev_fps) * (tps + prev_tps) / 2.0, minlength=n_groups
+    )
+    auc_roc = safe_ratio(area, n_pos * n_neg)
+
+    ap_terms = (tps - prev_tps) * safe_ratio(tps, tps + fps)
+    auc_pr = safe_ratio(np.bincount(g_ends, weights=ap_terms, minlength=n_groups), n_pos)
+
+    return np.where(valid, auc_roc, np.nan), np.where(valid, auc_pr, np.nan)
+
+
+def batched_reliability_counts(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    n_bins: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Statistiques de fiabilité par bin pour un lot de vecteurs de probabilités.
+
+    Paramètres
+    ----------
+    y_true : np.ndarray, shape (n,)
+    y_proba : np.ndarray, shape (k, n)
+        k vecteurs de probabilités (ex: avant / après calibration).
+    n_bins : int
+        Nombre de bins uniformes sur [0, 1].
+
+    Returns
+    -------
+    (count, positives, proba_sum) : np.ndarray de shape (k, n_bins).
+    Un seul indice de bin (lot, bin, label) est calculé pour tout le lot.
+    """
+    y_true = as_binary_array(y_true)
+    y_proba = np.atleast_2d(np.asarray(y_proba, dtype=np.float64))
+    k = y_proba.shape[0]
+
+    bins = np.minimum((y_proba * n_bins).astype(np.int64), n_bins - 1)
+    np.maximum(bins, 0, out=bins)
+    codes = (np.arange(k)[:, None] * n_bins + bins) * 2 + y_true
+    minlength = 2 * k * n_bins
+
+    by_label = np.bincount(codes.ravel(), minlength=minlength).reshape(k, n_bins, 2)
+    proba_sum = np.bincount(
+        codes.ravel(), weights=y_proba.ravel(), minlength=minlength
+    ).reshape(k, n_bins, 2).sum(axis=2)
+
+    return by_label.sum(axis=2), by_label[..., 1], proba_sum
+
+
+def rank_auc(y_true: Sequence[int], y_proba: Sequence[float]) -> float:
+    """
+    ROC-AUC par la statistique de Mann-Whitney (rangs moyens en cas d'égalité).
+
+    Un tri et deux bincount : adapté aux évaluations répétées (permutation
+    importance, sélection de features). NaN si une seule classe est présente.
+    """
+    y_true = as_binary_array(y_true)
+    y_proba = np.asarray(y_proba, dtype=np.float64)
+
+    order = np.argsort(y_proba)
+    sorted_proba = y_proba[order]
+    new_group = np.r_[True, sorted_proba[1:] != sorted_proba[:-1]]
+    group = np.cumsum(new_group) - 1
+    starts = np.flatnonzero(new_group)
+    ends = np.r_[starts[1:], y_proba.size]
+    mean_rank = (starts + ends + 1) / 2.0
+
+    n_pos = float(y_true.sum())
+    n_neg = y_true.size - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return float("nan")
+
+    pos_per_group = np.bincount(group, weights=y_true[order], minlength=starts.size)
+    rank_sum = float(pos_per_group @ mean_rank)
+    return (rank_sum - n_pos * (n_pos + 1) / 2.0) / (n_pos * n_neg)
@@ -0,0 +1,87 @@
+"""
+Benchmark NumpyMetricsAdapter vs SklearnMetricsAdapter.
+
+Les deux adaptateurs calculent les mêmes métriques (mêmes clés, même
+arrondi) sur un jeu synthétique de `--rows` lignes (10 millions par
+défaut) ; le temps médian de chaque adaptateur, l'accélération et l'écart
+maximal entre les résultats sont affichés.
+
+Usage :
+    python -m health_lifestyle_diabetes.infrastructure.metrics.metrics_benchmark
+    python -m health_lifestyle_diabetes.infrastructure.metrics.metrics_benchmark \\
+        --rows 1000000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from health_lifestyle_diabetes.domain.ports.metrics_port import MetricsPort
+from health_lifestyle_diabetes.infrastructure.metrics.numpy_metrics_adapter import (
+    NumpyMetricsAdapter,
+)
+from health_lifestyle_diabetes.infrastructure.metrics.sklearn_metrics_adapter import (
+    SklearnMetricsAdapter,
+)
+
+DEFAULT_ROWS = 10_000_000
+
+
+def make_inputs(
+    rows: int, seed: int = 0, threshold: float = 0.5
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Labels déséquilibrés (~15 % de positifs) et probabilités à 4 décimales (ex-aequo)."""
+    rng = np.random.default_rng(seed)
+    y_true = (rng.random(rows) < 0.15).astype(np.int8)
+    y_proba = np.round(np.clip(0.3 * y_true + 0.7 * rng.random(rows), 0.0, 1.0), 4)
+    y_pred = (y_proba >= threshold).astype(np.int8)
+    return y_true, y_pred, y_proba
+
+
+def time_adapter(
+    adapter: MetricsPort, inputs: Tuple[np.ndarray, ...], repeat: int
+) -> Tuple[float, Dict[str, float]]:
+    """Temps médian (s) et dernier résultat."""
+    durations: List[float] = []
+    result: Dict[str, float] = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = adapter.compute_metrics(*inputs)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), result
+
+
+def max_abs_diff(a: Dict[str, float], b: Dict[str, float]) -> float:
+    return max(
+        0.0 if (math.isnan(a[k]) and math.isnan(b[k])) else abs(a[k] - b[k]) for k in a
+    )
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    inputs = make_inputs(args.rows, args.seed)
+
+    numpy_s, numpy_result = time_adapter(NumpyMetricsAdapter(), inputs, args.repeat)
+    sklearn_s, sklearn_result = time_adapter(SklearnMetricsAdapter(), inputs, args.repeat)
+
+    print(f"lignes : {args.rows:,}")
+    print(f"{'adaptateur':<10}{'temps (s)':>12}")
+    print(f"{'numpy':<10}{numpy_s:>12.3f}")
+    print(f"{'sklearn':<10}{sklearn_s:>12.3f}")
+    print(f"accélération : x{sklearn_s / numpy_s:.1f}")
+    print(f"écart max des métriques : {max_abs_diff(numpy_result, sklearn_result):.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from health_lifestyle_diabetes.domain.ports.bootstrap_metrics_port import (
+    BootstrapMetricsPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.metrics.confusion_kernels import (
+    as_binary_array,
+    batched_confusion_counts,
+    batched_ranking_scores,
+    threshold_metrics,
+)
+
+# ---------------------------------------------------------------------
+# Données triées partagées par les processus workers (initialisées une
+# seule fois par worker via l'initializer du pool).
+# ---------------------------------------------------------------------
+_SORTED_DATA: dict = {}
+
+
+def _init_bootstrap_worker(y_sorted: np.ndarray, codes: np.ndarray, ends: np.ndarray) -> None:
+    _SORTED_DATA.update(y_sorted=y_sorted, codes=codes, ends=ends)
+
+
+def _bootstrap_batch(seed: np.random.SeedSequence, n_replicates: int) -> Dict[str, np.ndarray]:
+    """
+    Calcule toutes les métriques pour un lot de répliques bootstrap.
+
+    Les indices sont tirés directement dans l'espace trié : tirer
+    uniformément une position triée équivaut à tirer une ligne d'origine,
+    et évite de re-trier chaque réplique.
+    """
+    y_sorted = _SORTED_DATA["y_sorted"]
+    codes = _SORTED_DATA["codes"]
+    n = y_sorted.size
+
+    rng = np.random.default_rng(seed)
+    samples = rng.integers(0, n, size=(n_replicates, n))
+    offsets = (np.arange(n_replicates) * n)[:, None]
+    weights = np.bincount(
+        (samples + offsets).ravel(), minlength=n_replicates * n
+    ).reshape(n_replicates, n).astype(np.float64)
+    del samples
+
+    counts = batched_confusion_counts(codes, weights)
+    metrics = threshold_metrics(counts[:, 0], counts[:, 1], counts[:, 2], counts[:, 3])
+    metrics["auc_roc"], metrics["auc_pr"] = batched_ranking_scores(
+        y_sorted, weights, _SORTED_DATA["ends"]
+    )
+    return metrics
+
+
+class NumpyBootstrapMetricsAdapter(BootstrapMetricsPort):
+    """
+    Intervalles de confiance bootstrap calculés par lots vectorisés.
+
+    - un seul tri des probabilités pour toutes les répliques,
+    - chaque lot tire ses rééchantillonnages sous forme de multiplicités
+      (B, n), puis calcule les comptes de confusion et ROC/PR de toutes
+      ses répliques par opérations matricielles (aucun appel sklearn),
+    - les lots peuvent être répartis sur plusieurs processus (n_jobs).
+    """
+
+    def __init__(
+        self,
+        logger: LoggerPort,
+        n_jobs: int = 1,
+        max_batch_elements: int = 4_000_000,
+    ):
+        """
+        Parameters
+        ----------
+        n_jobs : int
+            Nombre de processus (1 = séquentiel, -1 = tous les cœurs).
+        max_batch_elements : int
+            Borne sur B * n par lot, pour contenir l'empreinte mémoire.
+        """
+        self.logger = logger
+        self.n_jobs = n_jobs
+        self.max_batch_elements = max_batch_elements
+
+    def compute_confidence_intervals(
+        self,
+        y_true: Sequence[int],
+        y_pred: Sequence[int],
+        y_proba: Sequence[float],
+        *,
+        n_resamples: int = 1000,
+        confidence_level: float = 0.95,
+        random_state: Optional[int] = None,
+    ) -> Dict[str, Tuple[float, float]]:
+        if not 0.0 < confidence_level < 1.0:
+            raise ValueError("confidence_level doit être compris strictement entre 0 et 1.")
+
+        y_true = as_binary_array(y_true)
+        y_pred = as_binary_array(y_pred)
+        y_proba = np.asarray(y_proba, dtype=np.float64)
+        n = y_true.size
+
+        # Tri unique, partagé par toutes les répliques.
+        order = np.argsort(-y_proba)
+        y_sorted = y_true[order].astype(np.float64)
+        codes = (2 * y_true + y_pred)[order]
+        ends = np.r_[np.flatnonzero(np.diff(y_proba[order])), n - 1]
+
+        batch_size = max(1, min(n_resamples, self.max_batch_elements // max(n, 1)))
+        batch_sizes = [batch_size] * (n_resamples // batch_size)
+        if n_resamples % batch_size:
+            batch_sizes.append(n_resamples % batch_size)
+        seeds = np.random.SeedSequence(random_state).spawn(len(batch_sizes))
+
+        n_workers = (os.cpu_count() or 1) if self.n_jobs == -1 else self.n_jobs
+        n_workers = max(1, min(n_workers, len(batch_sizes)))
+
+        self.logger.info(
+            f"Bootstrap | n={n} | répliques={n_resamples} | lots={len(batch_sizes)} | "
+            f"processus={n_workers}"
+        )
+
+        results: List[Dict[str, np.ndarray]]
+        init_args = (y_sorted, codes, ends)
+        if n_workers == 1:
+            _init_bootstrap_worker(*init_args)
+            results = [_bootstrap_batch(s, b) for s, b in zip(seeds, batch_sizes)]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                initializer=_init_bootstrap_worker,
+                initargs=init_args,
+            ) as executor:
+                results = list(executor.map(_bootstrap_batch, seeds, batch_sizes))
+
+        alpha = (1.0 - confidence_level) / 2.0
+        intervals: Dict[str, Tuple[float, float]] = {}
+        for name in results[0]:
+            values = np.concatenate([batch[name] for batch in results])
+            low, high = np.nanquantile(values, [alpha, 1.0 - alpha])
+            intervals[name] = (round(float(low), 4), round(float(high), 4))
+
+        self.logger.info(
+            f"Bootstrap terminé | IC{int(confidence_level * 100)}% AUC={intervals['auc_roc']}"
+        )
+        return intervals
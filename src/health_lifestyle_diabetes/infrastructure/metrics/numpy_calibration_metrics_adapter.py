@@ -0,0 +1,111 @@
+from typing import Dict, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+from health_lifestyle_diabetes.domain.ports.calibration_metrics_port import (
+    CalibrationMetricsPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.metrics.confusion_kernels import (
+    as_binary_array,
+    batched_reliability_counts,
+    safe_ratio,
+)
+
+_EPS = np.finfo(np.float64).eps
+
+
+class NumpyCalibrationMetricsAdapter(CalibrationMetricsPort):
+    """
+    Métriques de calibration calculées en NumPy pur.
+
+    Les statistiques de fiabilité (effectif, positifs, somme des
+    probabilités par bin) sont obtenues par np.bincount sur un indice
+    unique (vecteur, bin, label) : comparer « avant / après » calibration
+    ne coûte qu'un passage sur les données.
+    """
+
+    def __init__(self, logger: LoggerPort):
+        self.logger = logger
+
+    # ------------------------------------------------------------------
+    def compute_calibration_metrics(
+        self,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        *,
+        n_bins: int = 10,
+    ) -> Dict[str, float]:
+        return self.compare_calibration(
+            y_true, {"model": y_proba}, n_bins=n_bins
+        )["model"]
+
+    # ------------------------------------------------------------------
+    def compare_calibration(
+        self,
+        y_true: Sequence[int],
+        probas: Mapping[str, Sequence[float]],
+        *,
+        n_bins: int = 10,
+    ) -> Dict[str, Dict[str, float]]:
+        names = list(probas)
+        if not names:
+            return {}
+
+        y_true = as_binary_array(y_true)
+        stacked = np.vstack([np.asarray(probas[name], dtype=np.float64) for name in names])
+        if stacked.shape[1] != y_true.size:
+            raise ValueError("Chaque vecteur de probabilités doit être aligné sur y_true.")
+
+        count, positives, proba_sum = batched_reliability_counts(y_true, stacked, n_bins)
+        gap = np.abs(safe_ratio(proba_sum, count) - safe_ratio(positives, count))
+        ece = np.sum(count * gap, axis=1) / y_true.size
+        mce = np.max(np.where(count > 0, gap, 0.0), axis=1)
+
+        brier = np.mean((stacked - y_true) ** 2, axis=1)
+        clipped = np.clip(stacked, _EPS, 1.0 - _EPS)
+        log_loss = -np.mean(
+            np.where(y_true == 1, np.log(clipped), np.log1p(-clipped)), axis=1
+        )
+
+        results = {
+            name: {
+                "ece": round(float(ece[i]), 4),
+                "mce": round(float(mce[i]), 4),
+                "brier_score": round(float(brier[i]), 4),
+                "log_loss": round(float(log_loss[i]), 4),
+            }
+            for i, name in enumerate(names)
+        }
+
+        self.logger.debug(
+            f"Métriques de calibration calculées | vecteurs={names} | n_bins={n_bins}"
+        )
+        return results
+
+    # ------------------------------------------------------------------
+    def reliability_table(
+        self,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        *,
+        n_bins: int = 10,
+    ) -> pd.DataFrame:
+        count, positives, proba_sum = (
+            arr[0] for arr in batched_reliability_counts(y_true, y_proba, n_bins)
+        )
+        mean_proba = safe_ratio(proba_sum, count)
+        observed = safe_ratio(positives, count)
+        edges = np.linspace(0.0, 1.0, n_bins + 1)
+
+        return pd.DataFrame(
+            {
+                "bin_lower": edges[:-1],
+                "bin_upper": edges[1:],
+                "count": count,
+                "mean_proba": np.where(count > 0, mean_proba, np.nan),
+                "observed_rate": np.where(count > 0, observed, np.nan),
+                "gap": np.where(count > 0, np.abs(mean_proba - observed), np.nan),
+            }
+        )
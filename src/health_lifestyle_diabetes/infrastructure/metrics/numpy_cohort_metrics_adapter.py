@@ -0,0 +1,106 @@
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from health_lifestyle_diabetes.domain.ports.cohort_metrics_port import (
+    CohortMetricsPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.metrics.confusion_kernels import (
+    as_binary_array,
+    grouped_ranking_scores,
+    threshold_metrics,
+)
+
+
+class NumpyCohortMetricsAdapter(CohortMetricsPort):
+    """
+    Métriques par cohorte calculées en une seule passe groupée.
+
+    Toutes les modalités de toutes les colonnes de slice reçoivent un
+    identifiant de groupe global ; les comptes de confusion de tous les
+    groupes sont obtenus par un unique np.bincount, et ROC-AUC / AUC-PR
+    par un unique tri (groupe, probabilité) : les lignes sont triées une
+    seule fois par probabilité, puis chaque groupe par tri stable entier.
+    """
+
+    def __init__(self, logger: LoggerPort):
+        self.logger = logger
+
+    def compute_cohort_metrics(
+        self,
+        dataset: pd.DataFrame,
+        *,
+        slice_columns: Sequence[str],
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        threshold: float,
+    ) -> pd.DataFrame:
+        missing = [c for c in slice_columns if c not in dataset.columns]
+        if missing:
+            raise ValueError(f"Colonnes de slice introuvables : {missing}")
+
+        y_true = as_binary_array(y_true)
+        y_proba = np.asarray(y_proba, dtype=np.float64)
+        if not len(dataset) == y_true.size == y_proba.size:
+            raise ValueError("dataset, y_true et y_proba doivent être alignés.")
+
+        # Tri unique par probabilité décroissante (réutilisé par toutes les
+        # colonnes de slice pour les métriques de ranking).
+        order = np.argsort(-y_proba)
+        y_true = y_true[order]
+        y_proba = y_proba[order]
+
+        # ------------------------------------------------------------------
+        # Identifiants de groupe globaux (colonne, modalité)
+        # ------------------------------------------------------------------
+        group_blocks: List[np.ndarray] = []
+        labels_column: List[str] = []
+        labels_value: List[object] = []
+        offset = 0
+        for column in slice_columns:
+            codes, uniques = pd.factorize(dataset[column], use_na_sentinel=False)
+            group_blocks.append(codes[order].astype(np.int64) + offset)
+            labels_column.extend([column] * len(uniques))
+            labels_value.extend(list(uniques))
+            offset += len(uniques)
+
+        n_groups = offset
+        n_slices = len(slice_columns)
+        group_ids = np.concatenate(group_blocks)
+        y_rep = np.tile(y_true, n_slices)
+        proba_rep = np.tile(y_proba, n_slices)
+        pred_rep = (proba_rep >= threshold).astype(np.int8)
+
+        # ------------------------------------------------------------------
+        # Comptes de confusion de tous les groupes : un seul bincount
+        # ------------------------------------------------------------------
+        counts = np.bincount(
+            group_ids * 4 + 2 * y_rep + pred_rep, minlength=4 * n_groups
+        ).reshape(n_groups, 4)
+        tn, fp, fn, tp = counts.T
+
+        metrics = threshold_metrics(tn, fp, fn, tp)
+        auc_roc, auc_pr = grouped_ranking_scores(
+            group_ids, y_rep, proba_rep, n_groups, presorted=True
+        )
+
+        n = counts.sum(axis=1)
+        table = pd.DataFrame(
+            {
+                "slice_column": labels_column,
+                "slice_value": labels_value,
+                "n": n,
+                "prevalence": (tp + fn) / np.maximum(n, 1),
+                **metrics,
+                "auc_roc": auc_roc,
+                "auc_pr": auc_pr,
+            }
+        )
+
+        self.logger.info(
+            f"Métriques par cohorte calculées | colonnes={n_slices} | slices={n_groups} | "
+            f"lignes={y_true.size}"
+        )
+        return table
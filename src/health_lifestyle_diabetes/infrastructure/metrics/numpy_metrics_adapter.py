@@ -0,0 +1,54 @@
+from typing import Dict, Sequence
+
+from health_lifestyle_diabetes.domain.ports.metrics_port import MetricsPort
+from health_lifestyle_diabetes.infrastructure.metrics.confusion_kernels import (
+    confusion_counts,
+    ranking_scores,
+    threshold_metrics,
+)
+
+
+class NumpyMetricsAdapter(MetricsPort):
+    """
+    Implémentation NumPy du calcul des métriques, en un minimum de passes.
+
+    - la matrice de confusion 2x2 est construite une seule fois (np.bincount)
+      et toutes les métriques à seuil en sont dérivées,
+    - ROC-AUC et AUC-PR sont calculées à partir d'un seul tri des probabilités.
+
+    Mêmes clés et même arrondi que SklearnMetricsAdapter, dont il est un
+    remplaçant direct.
+    """
+
+    @staticmethod
+    def r(value: float) -> float:
+        """Arrondit à 4 décimales."""
+        return round(float(value), 4)
+
+    def compute_metrics(
+        self,
+        y_true: Sequence[int],
+        y_pred: Sequence[int],
+        y_proba: Sequence[float],
+    ) -> Dict[str, float]:
+
+        tn, fp, fn, tp = confusion_counts(y_true, y_pred)
+        metrics = threshold_metrics(tn, fp, fn, tp)
+        auc_roc, auc_pr = ranking_scores(y_true, y_proba)
+
+        # Retour arrondi à 4 décimales (ordre identique à SklearnMetricsAdapter)
+        return {
+            "accuracy": self.r(metrics["accuracy"]),
+            "precision": self.r(metrics["precision"]),
+            "recall": self.r(metrics["recall"]),
+            "f1": self.r(metrics["f1"]),
+
+            "auc_roc": self.r(auc_roc),
+            "auc_pr": self.r(auc_pr),
+
+            "false_positive_rate": self.r(metrics["false_positive_rate"]),
+            "false_negative_rate": self.r(metrics["false_negative_rate"]),
+
+            "kappa": self.r(metrics["kappa"]),
+            "mcc": self.r(metrics["mcc"]),
+        }
@@ -0,0 +1,294 @@
+"""
+Accumulateur incrémental de métriques pour le monitoring en ligne.
+
+Au lieu de conserver toutes les paires (y_true, y_proba), l'accumulateur
+maintient un état compact et fusionnable :
+- les 4 comptes de confusion au seuil de décision,
+- un histogramme des probabilités par classe (sketch ROC / PR),
+- la somme des probabilités par bin (calibration).
+
+L'état d'un worker peut être fusionné dans celui d'un autre (merge),
+ce qui permet d'agréger plusieurs processus de scoring.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from health_lifestyle_diabetes.domain.ports.metrics_port import MetricsPort
+from health_lifestyle_diabetes.infrastructure.metrics.confusion_kernels import (
+    as_binary_array,
+    histogram_ranking_scores,
+    safe_ratio,
+    threshold_metrics,
+)
+
+WINDOW_MODES = ("cumulative", "tumbling", "sliding")
+
+
+@dataclass
+class MetricsState:
+    """
+    État fusionnable d'un flux de prédictions labellisées.
+    """
+
+    n_bins: int
+    confusion: np.ndarray = field(default=None)  # (tn, fp, fn, tp)
+    pos_hist: np.ndarray = field(default=None)
+    neg_hist: np.ndarray = field(default=None)
+    proba_sum: np.ndarray = field(default=None)
+
+    def __post_init__(self):
+        if self.confusion is None:
+            self.confusion = np.zeros(4, dtype=np.int64)
+        if self.pos_hist is None:
+            self.pos_hist = np.zeros(self.n_bins, dtype=np.int64)
+        if self.neg_hist is None:
+            self.neg_hist = np.zeros(self.n_bins, dtype=np.int64)
+        if self.proba_sum is None:
+            self.proba_sum = np.zeros(self.n_bins, dtype=np.float64)
+
+    @property
+    def n_samples(self) -> int:
+        return int(self.confusion.sum())
+
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray, y_proba: np.ndarray) -> None:
+        """Ajoute un lot d'observations (une passe np.bincount par composante)."""
+        self.confusion += np.bincount(2 * y_true + y_pred, minlength=4)[:4]
+
+        bins = np.minimum((y_proba * self.n_bins).astype(np.int64), self.n_bins - 1)
+        pos = np.bincount(bins, weights=y_true, minlength=self.n_bins)
+        total = np.bincount(bins, minlength=self.n_bins)
+        self.pos_hist += pos.astype(np.int64)
+        self.neg_hist += total - pos.astype(np.int64)
+        self.proba_sum += np.bincount(bins, weights=y_proba, minlength=self.n_bins)
+
+    def merge(self, other: "MetricsState") -> "MetricsState":
+        """Fusionne `other` dans cet état (en place) et retourne self."""
+        if other.n_bins != self.n_bins:
+            raise ValueError("Impossible de fusionner des états de résolutions différentes.")
+        self.confusion += other.confusion
+        self.pos_hist += other.pos_hist
+        self.neg_hist += other.neg_hist
+        self.proba_sum += other.proba_sum
+        return self
+
+    def copy(self) -> "MetricsState":
+        return MetricsState(
+            n_bins=self.n_bins,
+            confusion=self.confusion.copy(),
+            pos_hist=self.pos_hist.copy(),
+            neg_hist=self.neg_hist.copy(),
+            proba_sum=self.proba_sum.copy(),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Sérialisation JSON-compatible (transport entre processus / services)."""
+        return {
+            "n_bins": self.n_bins,
+            "confusion": self.confusion.tolist(),
+            "pos_hist": self.pos_hist.tolist(),
+            "neg_hist": self.neg_hist.tolist(),
+            "proba_sum": self.proba_sum.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricsState":
+        return cls(
+            n_bins=int(data["n_bins"]),
+            confusion=np.asarray(data["confusion"], dtype=np.int64),
+            pos_hist=np.asarray(data["pos_hist"], dtype=np.int64),
+            neg_hist=np.asarray(data["neg_hist"], dtype=np.int64),
+            proba_sum=np.asarray(data["proba_sum"], dtype=np.float64),
+        )
+
+
+class StreamingMetricsAccumulator(MetricsPort):
+    """
+    Accumulateur de métriques mis à jour au fil de l'arrivée des labels.
+
+    Fenêtrage :
+    -----------
+    - "cumulative" : toutes les observations depuis le démarrage,
+    - "tumbling"   : fenêtres disjointes de `window_size` observations ;
+                     les métriques portent sur la dernière fenêtre complète,
+    - "sliding"    : les `window_size` dernières observations, découpées en
+                     `n_panes` panneaux (granularité window_size / n_panes).
+
+    Respecte la sémantique de MetricsPort : compute_metrics() calcule les
+    métriques d'un lot isolé, sans modifier l'état du flux.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        n_bins: int = 200,
+        calibration_bins: int = 10,
+        window: str = "cumulative",
+        window_size: Optional[int] = None,
+        n_panes: int = 10,
+    ):
+        if window not in WINDOW_MODES:
+            raise ValueError(f"Fenêtrage inconnu '{window}'. Choix possibles : {WINDOW_MODES}")
+        if window != "cumulative" and not window_size:
+            raise ValueError(f"Le fenêtrage '{window}' nécessite window_size.")
+        if n_bins % calibration_bins:
+            raise ValueError("n_bins doit être un multiple de calibration_bins.")
+
+        self.threshold = threshold
+        self.n_bins = n_bins
+        self.calibration_bins = calibration_bins
+        self.window = window
+        self.window_size = window_size
+
+        if window == "sliding":
+            self._pane_size = max(1, window_size // n_panes)
+            self._panes: Deque[MetricsState] = deque(maxlen=n_panes)
+        else:
+            self._pane_size = window_size
+            self._panes = deque(maxlen=1)
+        self._panes.append(MetricsState(n_bins))
+        self._last_window: Optional[MetricsState] = None
+
+    # ------------------------------------------------------------------
+    # Alimentation du flux
+    # ------------------------------------------------------------------
+    def update(
+        self,
+        y_true: Sequence[int],
+        y_proba: Sequence[float],
+        y_pred: Optional[Sequence[int]] = None,
+    ) -> None:
+        """
+        Ajoute des observations labellisées (scalaires ou lots).
+
+        Si `y_pred` est absent, la décision est dérivée du seuil configuré.
+        """
+        y_true = np.atleast_1d(as_binary_array(y_true)).astype(np.int64)
+        y_proba = np.atleast_1d(np.asarray(y_proba, dtype=np.float64))
+        y_pred = (
+            (y_proba >= self.threshold).astype(np.int64)
+            if y_pred is None
+            else np.atleast_1d(as_binary_array(y_pred)).astype(np.int64)
+        )
+
+        if self.window == "cumulative":
+            self._panes[-1].update(y_true, y_pred, y_proba)
+            return
+
+        # Découpe le lot selon la capacité restante du panneau courant.
+        start = 0
+        while start < y_true.size:
+            pane = self._panes[-1]
+            room = self._pane_size - pane.n_samples
+            if room <= 0:
+                self._rotate()
+                continue
+            stop = start + room
+            pane.update(y_true[start:stop], y_pred[start:stop], y_proba[start:stop])
+            start = stop
+            if pane.n_samples >= self._pane_size:
+                self._rotate()
+
+    def _rotate(self) -> None:
+        """Clôt le panneau courant et en ouvre un nouveau."""
+        if self.window == "tumbling":
+            self._last_window = self._panes[-1]
+        self._panes.append(MetricsState(self.n_bins))
+
+    def merge(self, other: "StreamingMetricsAccumulator | MetricsState") -> None:
+        """
+        Fusionne l'état d'un autre accumulateur (ex: worker).
+
+        - "cumulative" : ajouté à l'état courant ;
+        - "tumbling"   : l'état fusionné devient la dernière fenêtre close ;
+        - "sliding"    : l'état fusionné devient un panneau clos, inséré
+                         avant le panneau en cours de remplissage.
+
+        En mode fenêtré, l'état fusionné n'est jamais ajouté au panneau
+        courant : sa capacité (window_size / n_panes) reste respectée.
+        """
+        state = other.snapshot() if isinstance(other, StreamingMetricsAccumulator) else other
+        if self.window == "cumulative":
+            self._panes[-1].merge(state)
+        elif self.window == "tumbling":
+            self._last_window = MetricsState(self.n_bins).merge(state)
+        else:
+            current = self._panes.pop()
+            self._panes.append(MetricsState(self.n_bins).merge(state))
+            self._panes.append(current)
+
+    def reset(self) -> None:
+        self._panes.clear()
+        self._panes.append(MetricsState(self.n_bins))
+        self._last_window = None
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def snapshot(self) -> MetricsState:
+        """État de la fenêtre de reporting courante (copie fusionnable)."""
+        if self.window == "tumbling" and self._last_window is not None:
+            return self._last_window.copy()
+
+        state = MetricsState(self.n_bins)
+        for pane in self._panes:
+            state.merge(pane)
+        return state
+
+    def compute(self) -> Dict[str, float]:
+        """Métriques de la fenêtre de reporting courante."""
+        return self._metrics_from_state(self.snapshot())
+
+    def calibration_table(self) -> Dict[str, List[float]]:
+        """
+        Table de fiabilité (reliability bins) de la fenêtre courante.
+        """
+        state = self.snapshot()
+        group = self.n_bins // self.calibration_bins
+        pos = state.pos_hist.reshape(self.calibration_bins, group).sum(axis=1)
+        count = pos + state.neg_hist.reshape(self.calibration_bins, group).sum(axis=1)
+        proba = state.proba_sum.reshape(self.calibration_bins, group).sum(axis=1)
+
+        return {
+            "bin_lower": (np.arange(self.calibration_bins) / self.calibration_bins).tolist(),
+            "count": count.tolist(),
+            "mean_predicted": safe_ratio(proba, count).tolist(),
+            "observed_rate": safe_ratio(pos, count).tolist(),
+        }
+
+    def compute_metrics(
+        self,
+        y_true: Sequence[int],
+        y_pred: Sequence[int],
+        y_proba: Sequence[float],
+    ) -> Dict[str, float]:
+        """Calcul ponctuel (MetricsPort) sur un lot, sans toucher au flux."""
+        state = MetricsState(self.n_bins)
+        state.update(
+            as_binary_array(y_true).astype(np.int64),
+            as_binary_array(y_pred).astype(np.int64),
+            np.asarray(y_proba, dtype=np.float64),
+        )
+        return self._metrics_from_state(state)
+
+    def _metrics_from_state(self, state: MetricsState) -> Dict[str, float]:
+        tn, fp, fn, tp = state.confusion
+        metrics = {k: round(float(v), 4) for k, v in threshold_metrics(tn, fp, fn, tp).items()}
+
+        auc_roc, auc_pr = histogram_ranking_scores(state.pos_hist, state.neg_hist)
+        metrics["auc_roc"] = round(auc_roc, 4)
+        metrics["auc_pr"] = round(auc_pr, 4)
+
+        # Expected Calibration Error sur les bins de calibration.
+        group = self.n_bins // self.calibration_bins
+        pos = state.pos_hist.reshape(self.calibration_bins, group).sum(axis=1)
+        count = pos + state.neg_hist.reshape(self.calibration_bins, group).sum(axis=1)
+        proba = state.proba_sum.reshape(self.calibration_bins, group).sum(axis=1)
+        gap = np.abs(safe_ratio(proba, count) - safe_ratio(pos, count))
+        metrics["ece"] = round(float(safe_ratio(np.sum(count * gap), count.sum())), 4)
+
+        metrics["n_samples"] = float(state.n_samples)
+        return metrics
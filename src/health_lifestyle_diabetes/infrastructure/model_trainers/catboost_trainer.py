@@ -1,10 +1,12 @@
 # src/health_lifestyle_diabetes/infrastructure/ml/model_trainers/catboost_trainer.py
 
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 from catboost import CatBoostClassifier
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
 from health_lifestyle_diabetes.domain.ports.model_trainer_port import ModelTrainerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
 from pandas import DataFrame, Series
 
 
@@ -23,7 +25,14 @@ class CatBoostTrainer(ModelTrainerPort):
     qu'un entraînement avec jeu de validation et sélection du meilleur modèle.
     """
 
-    def __init__(self, params: Dict[str, Any], logger: LoggerPort):
+    def __init__(
+        self,
+        params: Dict[str, Any],
+        logger: LoggerPort,
+        features: Optional[Sequence[str]] = None,
+        callbacks: Optional[Sequence[Any]] = None,
+        tracer: Optional[TracerPort] = None,
+    ):
         """
         Initialise le trainer CatBoost.
 
@@ -32,9 +41,20 @@ class CatBoostTrainer(ModelTrainerPort):
         params : dict
             Dictionnaire de paramètres CatBoost (learning_rate, depth,
             iterations, loss_function, etc.).
+        features : sequence[str], optionnel
+            Colonnes utilisées pour l'entraînement (ex: `load_selected_features()`).
+            Par défaut, toutes les colonnes de X_train.
+        callbacks : sequence, optionnel
+            Callbacks CatBoost (ex: CatBoostTrackingCallback) appelés à
+            chaque itération.
+        tracer : TracerPort, optional
+            Traceur (span "train.catboost" autour du fit) ; no-op par défaut.
         """
         self.params = params
         self.logger = logger
+        self.features = list(features) if features is not None else None
+        self.callbacks = list(callbacks) if callbacks else None
+        self.tracer = tracer or NullTracer()
         self.logger.info("CatBoostTrainer initialisé avec les paramètres fournis.")
 
     def train(
@@ -43,6 +63,7 @@ class CatBoostTrainer(ModelTrainerPort):
         y_train: Optional[Series],
         X_valid: Optional[DataFrame] = None,
         y_valid: Optional[Series] = None,
+        init_model: Optional[Union[CatBoostClassifier, str, Path]] = None,
     ) -> CatBoostClassifier:
         """
         Entraîne un modèle CatBoostClassifier à partir des données fournies.
@@ -53,7 +74,8 @@ class CatBoostTrainer(ModelTrainerPort):
         - détecte automatiquement les variables catégorielles si elles ne sont
           pas explicitement définies dans les paramètres du modèle,
         - entraîne le modèle avec ou sans jeu de validation,
-        - active la sélection du meilleur modèle lorsque la validation est présente.
+        - active la sélection du meilleur modèle lorsque la validation est présente,
+        - poursuit un modèle existant (warm-start) lorsque `init_model` est fourni.
 
         Paramètres
         ----------
@@ -67,6 +89,10 @@ class CatBoostTrainer(ModelTrainerPort):
         y_valid : Series, optionnel
             Variable cible associée au jeu de validation.
             Doit être fourni conjointement avec `X_valid`.
+        init_model : CatBoostClassifier | str | Path, optionnel
+            Modèle CatBoost déjà entraîné (ou chemin vers un fichier .cbm)
+            à partir duquel l'entraînement est poursuivi. Les features et
+            variables catégorielles doivent être identiques.
 
         Retours
         -------
@@ -105,6 +131,14 @@ class CatBoostTrainer(ModelTrainerPort):
             if len(X_valid) != len(y_valid):
                 raise ValueError("X_valid et y_valid doivent avoir la même taille.")
 
+        # =========================
+        # Restriction aux features sélectionnées
+        # =========================
+        if self.features is not None:
+            X_train = X_train[self.features]
+            if X_valid is not None:
+                X_valid = X_valid[self.features]
+
         # =========================
         # Logging sécurisé
         # =========================
@@ -149,7 +183,24 @@ class CatBoostTrainer(ModelTrainerPort):
                 }
             )
 
-        model.fit(**fit_kwargs)
+        if init_model is not None:
+            self.logger.info("Warm-start : reprise depuis un modèle CatBoost existant.")
+            fit_kwargs["init_model"] = (
+                str(init_model) if isinstance(init_model, Path) else init_model
+            )
+
+        if self.callbacks:
+            fit_kwargs["callbacks"] = self.callbacks
+
+        with self.tracer.span(
+            "train.catboost", rows=len(X_train), columns=X_train.shape[1]
+        ):
+            model.fit(**fit_kwargs)
+
+        # CatBoost n'expose pas de hook de fin d'entraînement.
+        for callback in self.callbacks or []:
+            if hasattr(callback, "flush"):
+                callback.flush()
 
         self.logger.info("Entraînement CatBoost terminé.")
 
@@ -1,9 +1,11 @@
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
 
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
 from health_lifestyle_diabetes.domain.ports.model_trainer_port import ModelTrainerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
 from health_lifestyle_diabetes.infrastructure.utils.exceptions import LightGBMTrainingError
-from lightgbm import LGBMClassifier
+from lightgbm import Booster, LGBMClassifier
 from pandas import DataFrame, Series
 
 
@@ -13,9 +15,22 @@ class LightGBMTrainer(ModelTrainerPort):
     Gère automatiquement les colonnes catégorielles.
     """
 
-    def __init__(self, params: Dict[str, Any], logger: LoggerPort):
+    def __init__(
+        self,
+        params: Dict[str, Any],
+        logger: LoggerPort,
+        features: Optional[Sequence[str]] = None,
+        callbacks: Optional[Sequence[Any]] = None,
+        tracer: Optional[TracerPort] = None,
+    ):
         self.params = params
         self.logger = logger
+        # Colonnes d'entraînement (ex: load_selected_features()) ; None = toutes.
+        self.features = list(features) if features is not None else None
+        # Callbacks LightGBM (ex: LightGBMTrackingCallback) appelés à chaque itération.
+        self.callbacks = list(callbacks) if callbacks else None
+        # Traceur (span "train.lightgbm" autour du fit) ; no-op par défaut.
+        self.tracer = tracer or NullTracer()
         self.model_name = "lightgbm"
         self.logger.info("Initialisation LightGBMTrainer terminée.")
 
@@ -25,7 +40,15 @@ class LightGBMTrainer(ModelTrainerPort):
         y_train: Series,
         X_valid: Optional[DataFrame] = None,
         y_valid: Optional[Series] = None,
+        init_model: Optional[Union[LGBMClassifier, Booster, str, Path]] = None,
     ) -> LGBMClassifier:
+        """
+        Entraîne un modèle LightGBM.
+
+        Si `init_model` est fourni (modèle LightGBM, Booster ou chemin vers
+        un modèle sauvegardé), l'entraînement poursuit ce modèle
+        (warm-start) : seuls `n_estimators` nouveaux arbres sont construits.
+        """
 
         self.logger.debug("Début de la méthode train()")
 
@@ -43,6 +66,10 @@ class LightGBMTrainer(ModelTrainerPort):
         self.logger.info(f"Taille valid: {X_valid.shape if X_valid is not None else 'N/A'}")
 
         # ---------- COPY FOR SAFETY (fix pandas warnings) ----------
+        if self.features is not None:
+            X_train = X_train[self.features]
+            if X_valid is not None:
+                X_valid = X_valid[self.features]
         X_train = X_train.copy()
         if X_valid is not None:
             X_valid = X_valid.copy()
@@ -62,30 +89,45 @@ class LightGBMTrainer(ModelTrainerPort):
         })
         model = LGBMClassifier(**self.params)
 
+        if init_model is not None:
+            self.logger.info("Warm-start : reprise depuis un modèle LightGBM existant.")
+
         # ---------- TRAINING ----------
         self.logger.info("Début de l'entraînement LightGBM...")
-        try:
-            if X_valid is not None and y_valid is not None:
-                self.logger.debug("Mode avec validation.")
-                model.fit(
-                    X_train,
-                    y_train,
-                    eval_set=[(X_train, y_train), (X_valid, y_valid)],
-                    eval_names=["train", "valid"],
-                    eval_metric=self.params.get("eval_metric", "logloss"),
-                    categorical_feature=cat_cols if cat_cols else None,
-                )
-            else:
-                self.logger.debug("Mode sans validation.")
-                model.fit(
-                    X_train,
-                    y_train,
-                    categorical_feature=cat_cols if cat_cols else None,
-                )
-
-        except Exception as e:
-            self.logger.error(f"Erreur pendant l'entraînement: {e}")
-            raise LightGBMTrainingError(f"Échec de l'entraînement LightGBM: {e}") from e
+        with self.tracer.span("train.lightgbm", rows=len(X_train), columns=X_train.shape[1]):
+            try:
+                if X_valid is not None and y_valid is not None:
+                    self.logger.debug("Mode avec validation.")
+                    model.fit(
+                        X_train,
+                        y_train,
+                        eval_set=[(X_train, y_train), (X_valid, y_valid)],
+                        eval_names=["train", "valid"],
+                        eval_metric=self.params.get("eval_metric", "logloss"),
+                        categorical_feature=cat_cols if cat_cols else None,
+                        init_model=init_model,
+                        callbacks=self.callbacks,
+                    )
+                else:
+                    self.logger.debug("Mode sans validation.")
+                    model.fit(
+                        X_train,
+                        y_train,
+                        categorical_feature=cat_cols if cat_cols else None,
+                        init_model=init_model,
+                        callbacks=self.callbacks,
+                    )
+
+            except Exception as e:
+                self.logger.error(f"Erreur pendant l'entraînement: {e}")
+                raise LightGBMTrainingError(f"Échec de l'entraînement LightGBM: {e}") from e
+
+            finally:
+                # Early stopping : les dernières itérations bufferisées ne
+                # sont pas envoyées par le callback lui-même.
+                for callback in self.callbacks or []:
+                    if hasattr(callback, "flush"):
+                        callback.flush()
 
         self.logger.info("LightGBM - Entraînement terminé avec succès.")
         self.logger.debug("Fin de train().")
@@ -1,14 +1,16 @@
 # src/health_lifestyle_diabetes/infrastructure/model_trainers/xgboost_trainer.py
 
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
 
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
 from health_lifestyle_diabetes.domain.ports.model_trainer_port import ModelTrainerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import NullTracer, TracerPort
 from health_lifestyle_diabetes.infrastructure.utils.exceptions import (
     XGBoostTrainingError,
 )
 from pandas import DataFrame, Series
-from xgboost import XGBClassifier
+from xgboost import Booster, XGBClassifier
 
 
 class XGBoostTrainer(ModelTrainerPort):
@@ -17,7 +19,14 @@ class XGBoostTrainer(ModelTrainerPort):
     pour l'entraînement d'un modèle XGBoost.
     """
 
-    def __init__(self, params: Dict[str, Any], logger: LoggerPort):
+    def __init__(
+        self,
+        params: Dict[str, Any],
+        logger: LoggerPort,
+        features: Optional[Sequence[str]] = None,
+        callbacks: Optional[Sequence[Any]] = None,
+        tracer: Optional[TracerPort] = None,
+    ):
         """
         Parameters
         ----------
@@ -25,9 +34,20 @@ class XGBoostTrainer(ModelTrainerPort):
             Hyperparamètres du modèle XGBoost.
         logger : LoggerPort
             Service de logging injecté (adapter infrastructure).
+        features : sequence[str], optional
+            Colonnes utilisées pour l'entraînement (ex: `load_selected_features()`).
+            Par défaut, toutes les colonnes de X_train.
+        callbacks : sequence, optional
+            Callbacks XGBoost (ex: XGBoostTrackingCallback) appelés à
+            chaque itération.
+        tracer : TracerPort, optional
+            Traceur (span "train.xgboost" autour du fit) ; no-op par défaut.
         """
         self.params = params
         self.logger = logger
+        self.features = list(features) if features is not None else None
+        self.callbacks = list(callbacks) if callbacks else None
+        self.tracer = tracer or NullTracer()
         self.logger.info("XGBoostTrainer initialisé avec les paramètres fournis.")
 
     def train(
@@ -36,6 +56,7 @@ class XGBoostTrainer(ModelTrainerPort):
         y_train: Series,
         X_valid: Optional[DataFrame] = None,
         y_valid: Optional[Series] = None,
+        init_model: Optional[Union[XGBClassifier, Booster, str, Path]] = None,
     ) -> XGBClassifier:
         """
         Entraîne un modèle XGBoost.
@@ -50,6 +71,10 @@ class XGBoostTrainer(ModelTrainerPort):
             Matrice de caractéristiques de validation.
         y_valid : Series, optional
             Vecteur cible de validation.
+        init_model : XGBClassifier | Booster | str | Path, optional
+            Modèle existant à partir duquel poursuivre l'entraînement
+            (warm-start via `xgb_model`). Les `n_estimators` nouveaux arbres
+            sont ajoutés au booster existant au lieu de repartir de zéro.
 
         Returns
         -------
@@ -72,6 +97,10 @@ class XGBoostTrainer(ModelTrainerPort):
         # -------------------------
         # 2. Protection contre les effets de bord (copy)
         # -------------------------
+        if self.features is not None:
+            X_train = X_train[self.features]
+            if X_valid is not None:
+                X_valid = X_valid[self.features]
         X_train = X_train.copy()
         if X_valid is not None:
             X_valid = X_valid.copy()
@@ -105,35 +134,45 @@ class XGBoostTrainer(ModelTrainerPort):
         model = XGBClassifier(
             **self.params,
             tree_method="hist",      # optimisé CPU
+            callbacks=self.callbacks,
         )
 
         # -------------------------
         # 6. Entraînement
         # -------------------------
-        try:
-            self.logger.info("XGBoost - Démarrage de l'entraînement...")
-
-            if X_valid is not None and y_valid is not None:
-                model.fit(
-                    X_train,
-                    y_train,
-                    eval_set=[
-                        (X_train, y_train),
-                        (X_valid, y_valid),
-                    ],
-                    #eval_metric=self.params.get("eval_metric", "logloss"),
-                    #early_stopping_rounds=self.params.get("early_stopping_rounds", None),
-                    verbose=True,
-                )
-            else:
-                model.fit(X_train, y_train)
-
-            self.logger.info("XGBoost - Entraînement terminé avec succès.")
-
-        except Exception as e:
-            self.logger.error(f"XGBoost - Erreur lors du fit : {e}")
-            raise XGBoostTrainingError(
-                f"Échec de l'entraînement du modèle XGBoost: {e}"
-            ) from e
+        if init_model is not None:
+            self.logger.info(
+                "XGBoost - Warm-start : reprise depuis un booster existant."
+            )
+            if isinstance(init_model, Path):
+                init_model = str(init_model)
+
+        with self.tracer.span("train.xgboost", rows=len(X_train), columns=X_train.shape[1]):
+            try:
+                self.logger.info("XGBoost - Démarrage de l'entraînement...")
+
+                if X_valid is not None and y_valid is not None:
+                    model.fit(
+                        X_train,
+                        y_train,
+                        eval_set=[
+                            (X_train, y_train),
+                            (X_valid, y_valid),
+                        ],
+                        #eval_metric=self.params.get("eval_metric", "logloss"),
+                        #early_stopping_rounds=self.params.get("early_stopping_rounds", None),
+                        verbose=True,
+                        xgb_model=init_model,
+                    )
+                else:
+                    model.fit(X_train, y_train, xgb_model=init_model)
+
+                self.logger.info("XGBoost - Entraînement terminé avec succès.")
+
+            except Exception as e:
+                self.logger.error(f"XGBoost - Erreur lors du fit : {e}")
+                raise XGBoostTrainingError(
+                    f"Échec de l'entraînement du modèle XGBoost: {e}"
+                ) from e
 
         return model
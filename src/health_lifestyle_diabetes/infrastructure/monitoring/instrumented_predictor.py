@@ -0,0 +1,88 @@
+"""
+instrumented_predictor.py
+================================================
+Décorateur de modèle (predict_proba / predict) publiant les métriques de
+scoring dans un MetricsRegistry :
+
+- hld_predict_requests_total{model,method}
+- hld_predict_errors_total{model,method}
+- hld_predict_rows_total{model}
+- hld_predict_batch_rows{model}          (histogramme, tailles de batch)
+- hld_predict_latency_seconds{model}     (histogramme, latence modèle)
+
+Compatible avec tout estimateur de type sklearn (LightGBM, XGBoost,
+CatBoost, CalibratedModel...).
+"""
+
+import time
+from typing import Any, Optional
+
+from health_lifestyle_diabetes.infrastructure.monitoring.metrics_registry import (
+    DEFAULT_SIZE_BUCKETS,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+
+
+class InstrumentedPredictor:
+    """
+    Modèle entraîné + métriques de scoring ; le comportement du modèle
+    est inchangé (les autres attributs sont délégués).
+    """
+
+    def __init__(
+        self,
+        estimator: Any,
+        model_name: str,
+        registry: Optional[MetricsRegistry] = None,
+    ):
+        self.estimator = estimator
+        self.model_name = model_name
+        registry = registry or get_metrics_registry()
+
+        requests = registry.counter(
+            "hld_predict_requests_total", "Appels de prédiction.", ["model", "method"]
+        )
+        errors = registry.counter(
+            "hld_predict_errors_total", "Appels de prédiction en échec.", ["model", "method"]
+        )
+        self._requests = {m: requests.labels(model_name, m) for m in ("predict_proba", "predict")}
+        self._errors = {m: errors.labels(model_name, m) for m in ("predict_proba", "predict")}
+        self._rows = registry.counter(
+            "hld_predict_rows_total", "Lignes scorées.", ["model"]
+        ).labels(model_name)
+        self._batch_rows = registry.histogram(
+            "hld_predict_batch_rows",
+            "Taille des batches de prédiction (lignes).",
+            ["model"],
+            buckets=DEFAULT_SIZE_BUCKETS,
+        ).labels(model_name)
+        self._latency = registry.histogram(
+            "hld_predict_latency_seconds", "Latence du modèle par appel.", ["model"]
+        ).labels(model_name)
+
+    def predict_proba(self, X) -> Any:
+        return self._call("predict_proba", X)
+
+    def predict(self, X) -> Any:
+        return self._call("predict", X)
+
+    def _call(self, method: str, X) -> Any:
+        self._requests[method].inc()
+        start = time.perf_counter()
+        try:
+            result = getattr(self.estimator, method)(X)
+        except Exception:
+            self._errors[method].inc()
+            raise
+        self._latency.observe(time.perf_counter() - start)
+        n_rows = len(X)
+        self._rows.inc(n_rows)
+        self._batch_rows.observe(n_rows)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        # classes_, feature_names_in_, booster_... : délégués au modèle.
+        if name == "estimator":
+            raise AttributeError(name)
+        return getattr(self.estimator, name)
@@ -0,0 +1,107 @@
+"""
+metrics_http_server.py
+================================================
+Endpoint HTTP local exposant un MetricsRegistry au format Prometheus.
+
+- GET /metrics : exposition texte (version 0.0.4) ;
+- serveur standard (http.server) dans un thread démon : aucun impact
+  sur le thread de scoring, aucune dépendance externe ;
+- écoute sur 127.0.0.1 par défaut (exposition réseau explicite).
+
+Usage :
+    server = MetricsHTTPServer(port=9108).start()
+    ...
+    server.stop()
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.monitoring.metrics_registry import (
+    MetricsRegistry,
+    get_metrics_registry,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsHTTPServer:
+    """
+    Exporteur HTTP du registre de métriques.
+
+    Parameters
+    ----------
+    registry : MetricsRegistry, optional
+        Registre exposé (défaut : registre partagé du processus).
+    host, port : str, int
+        Adresse d'écoute ; `port=0` choisit un port libre (voir `port`
+        après `start()`).
+    """
+
+    def __init__(
+        self,
+        registry: Optional[MetricsRegistry] = None,
+        host: str = "127.0.0.1",
+        port: int = 9108,
+        logger: Optional[LoggerPort] = None,
+    ):
+        self.registry = registry or get_metrics_registry()
+        self.host = host
+        self.port = port
+        self.logger = logger
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self) -> "MetricsHTTPServer":
+        if self._server is not None:
+            return self
+        registry = self.registry
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                # Pas de log par scrape.
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-http-server", daemon=True
+        )
+        self._thread.start()
+        if self.logger is not None:
+            self.logger.info(f"Endpoint de métriques démarré : {self.url}")
+        return self
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = self._thread = None
+        if self.logger is not None:
+            self.logger.info("Endpoint de métriques arrêté.")
+
+    def __enter__(self) -> "MetricsHTTPServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,428 @@
+"""
+metrics_registry.py
+================================================
+Registre de métriques en mémoire (compteurs, jauges, histogrammes),
+exporté au format texte Prometheus (0.0.4), sans dépendance externe.
+
+Coût d'écriture minimal sur les chemins chauds :
+- compteurs et histogrammes sont shardés par thread : chaque thread
+  écrit dans sa propre cellule, sans verrou ; la lecture (scrape) somme
+  les cellules. À la fin d'un thread, sa cellule est ajoutée à un total
+  résiduel puis libérée : mémoire et coût du scrape restent bornés par
+  le nombre de threads vivants (threads de requête éphémères compris),
+  et les compteurs ne reculent jamais.
+- histogrammes à buckets fixes : un `bisect` + deux additions par
+  observation.
+- jauges : valeur unique (ou fonction évaluée au scrape, ex: profondeur
+  d'une file).
+
+Usage :
+    registry = get_metrics_registry()
+    rows = registry.counter("hld_rows_total", "Lignes traitées.", ["source"])
+    rows.labels(source="stream").inc()
+    latency = registry.histogram("hld_latency_seconds", "Latence.")
+    with latency.time():
+        ...
+    print(registry.render())
+"""
+
+import math
+import re
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from health_lifestyle_diabetes.infrastructure.utils.exceptions import (
+    MetricsRegistryError,
+)
+
+# Latences (secondes) : de 0,5 ms à 10 s.
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+# Tailles de batch (lignes).
+DEFAULT_SIZE_BUCKETS: Tuple[float, ...] = (
+    1, 10, 100, 1_000, 10_000, 100_000, 1_000_000,
+)
+
+_NAME = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+# =====================================================================
+# Stockage shardé par thread
+# =====================================================================
+class _CellOwner:
+    """Jeton stocké dans le thread-local : collecté à la fin du thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _ThreadShards:
+    """
+    Une cellule (liste de `size` valeurs) par thread ; lecture = total
+    résiduel des threads terminés + somme des cellules vivantes.
+    """
+
+    __slots__ = ("_size", "_local", "_cells", "_retired", "_lock", "__weakref__")
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._cells: Dict[int, List[float]] = {}
+        self._retired = [0.0] * size
+        # Réentrant : la libération peut survenir pendant une section
+        # verrouillée du même thread (ramasse-miettes).
+        self._lock = threading.RLock()
+
+    def cell(self) -> List[float]:
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0.0] * self._size
+            owner = _CellOwner()
+            with self._lock:
+                self._cells[id(cell)] = cell
+            weakref.finalize(owner, _ThreadShards._retire, weakref.ref(self), cell)
+            self._local.cell = cell
+            self._local.owner = owner
+            return cell
+
+    @staticmethod
+    def _retire(shards_ref: "weakref.ref[_ThreadShards]", cell: List[float]) -> None:
+        shards = shards_ref()
+        if shards is None:
+            return
+        with shards._lock:
+            if shards._cells.pop(id(cell), None) is not None:
+                for i, value in enumerate(cell):
+                    shards._retired[i] += value
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            cells = list(self._cells.values())
+            totals = list(self._retired)
+        for cell in cells:
+            for i, value in enumerate(cell):
+                totals[i] += value
+        return totals
+
+    def __len__(self) -> int:
+        """Nombre de cellules vivantes (une par thread ayant écrit)."""
+        return len(self._cells)
+
+
+# =====================================================================
+# Séries (une par combinaison de labels)
+# =====================================================================
+class CounterChild:
+    """Compteur monotone."""
+
+    __slots__ = ("_shards",)
+
+    def __init__(self) -> None:
+        self._shards = _ThreadShards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Un compteur ne peut qu'augmenter.")
+        self._shards.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._shards.totals()[0]
+
+
+class GaugeChild:
+    """Valeur instantanée, fixée ou calculée au scrape (`set_function`)."""
+
+    __slots__ = ("_value", "_function", "_lock")
+
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        return float(self._function()) if self._function is not None else self._value
+
+
+class HistogramChild:
+    """Histogramme à buckets fixes (bornes supérieures incluses)."""
+
+    __slots__ = ("_bounds", "_shards")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        # Cellule : un compteur par bucket, +Inf, puis la somme observée.
+        self._shards = _ThreadShards(len(bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        cell = self._shards.cell()
+        cell[bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe la durée (secondes) du bloc."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """(comptes cumulés par borne, +Inf inclus ; somme ; nombre)."""
+        totals = self._shards.totals()
+        cumulative, running = [], 0.0
+        for count in totals[:-1]:
+            running += count
+            cumulative.append(running)
+        return cumulative, totals[-1], running
+
+
+# =====================================================================
+# Familles de métriques
+# =====================================================================
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    @abstractmethod
+    def _new_child(self):
+        """Nouvelle série (CounterChild, GaugeChild ou HistogramChild)."""
+
+    def labels(self, *values: object, **labels: object):
+        """Série associée aux valeurs de labels (créée au premier appel)."""
+        if labels:
+            if values or set(labels) != set(self.labelnames):
+                raise ValueError(f"{self.name} : labels attendus {self.labelnames}.")
+            values = tuple(labels[name] for name in self.labelnames)
+        elif len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} : labels attendus {self.labelnames}.")
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        try:
+            return self._children[()]
+        except KeyError:
+            raise ValueError(
+                f"{self.name} a des labels {self.labelnames} : utiliser .labels(...)."
+            ) from None
+
+    def _series(self) -> List[Tuple[Dict[str, str], object]]:
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.labelnames, key)), child) for key, child in items]
+
+    @abstractmethod
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        """Échantillons exposés : (nom, labels, valeur)."""
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    @property
+    def value(self) -> float:
+        return self._default().value
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._series():
+            yield self.name, labels, child.value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._default().set_function(function)
+
+    @property
+    def value(self) -> float:
+        return self._default().value
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self._series():
+            yield self.name, labels, child.value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        bounds = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+        if not bounds:
+            raise ValueError(f"{name} : au moins un bucket fini est requis.")
+        self.buckets = bounds
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        upper = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for labels, child in self._series():
+            cumulative, total, count = child.snapshot()
+            for le, value in zip(upper, cumulative):
+                yield f"{self.name}_bucket", {**labels, "le": le}, value
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+# =====================================================================
+# Registre
+# =====================================================================
+class MetricsRegistry:
+    """
+    Ensemble de métriques d'un processus.
+
+    `counter` / `gauge` / `histogram` sont idempotents : un second appel
+    avec le même nom, le même type et les mêmes labels renvoie la
+    métrique existante (plusieurs instances d'un composant partagent
+    ainsi leurs séries).
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def _register(self, cls, name, documentation, labelnames, **kwargs):
+        if not _NAME.match(name):
+            raise MetricsRegistryError(f"Nom de métrique invalide : {name!r}")
+        for label in labelnames:
+            if not _LABEL.match(label) or label == "le":
+                raise MetricsRegistryError(f"{name} : label invalide {label!r}")
+
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != tuple(labelnames):
+                    raise MetricsRegistryError(
+                        f"Métrique '{name}' déjà enregistrée ({existing.kind}, "
+                        f"labels={existing.labelnames})."
+                    )
+                return existing
+            metric = cls(name, documentation, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def render(self) -> str:
+        """Exposition au format texte Prometheus."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            doc = metric.documentation.replace("\\", r"\\").replace("\n", r"\n")
+            lines.append(f"# HELP {metric.name} {doc}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape_label_value(value)}"' for key, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r'\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+@lru_cache(maxsize=1)
+def get_metrics_registry() -> MetricsRegistry:
+    """Registre partagé du processus (exposé par MetricsHTTPServer)."""
+    return MetricsRegistry()
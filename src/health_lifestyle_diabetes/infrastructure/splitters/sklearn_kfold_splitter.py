@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Any, Iterator, Tuple
+
+import numpy as np
+from sklearn.model_selection import RepeatedStratifiedKFold, StratifiedKFold
+
+from health_lifestyle_diabetes.domain.ports.cross_validation_splitter_port import (
+    CrossValidationSplitterPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.infrastructure.utils.exceptions import DatasetValidationError
+
+
+class SklearnKFoldSplitter(CrossValidationSplitterPort):
+    """
+    Stratified (repeated) K-fold splitter based on scikit-learn.
+
+    Concrete infrastructure implementation of CrossValidationSplitterPort.
+    Uses StratifiedKFold when n_repeats == 1, RepeatedStratifiedKFold otherwise.
+    """
+
+    def __init__(
+        self,
+        *,
+        n_splits: int,
+        target_column: str,
+        random_state: int,
+        logger: LoggerPort,
+        n_repeats: int = 1,
+    ) -> None:
+        if n_splits < 2:
+            raise DatasetValidationError(f"n_splits must be >= 2, got {n_splits}")
+        if n_repeats < 1:
+            raise DatasetValidationError(f"n_repeats must be >= 1, got {n_repeats}")
+
+        self.n_splits = n_splits
+        self.n_repeats = n_repeats
+        self._target_column = target_column
+        self._random_state = random_state
+        self._logger = logger
+
+        self._logger.debug(
+            f"SklearnKFoldSplitter initialized | n_splits={n_splits} | n_repeats={n_repeats}"
+        )
+
+    def split_folds(self, dataset: Any) -> Iterator[Tuple[int, int, np.ndarray, np.ndarray]]:
+        if self._target_column not in dataset.columns:
+            raise DatasetValidationError(
+                f"Target column not found in dataset: '{self._target_column}'"
+            )
+
+        if self.n_repeats == 1:
+            cv = StratifiedKFold(
+                n_splits=self.n_splits,
+                shuffle=True,
+                random_state=self._random_state,
+            )
+        else:
+            cv = RepeatedStratifiedKFold(
+                n_splits=self.n_splits,
+                n_repeats=self.n_repeats,
+                random_state=self._random_state,
+            )
+
+        y = dataset[self._target_column].to_numpy()
+        # Seules les étiquettes sont utilisées pour la stratification :
+        # un placeholder évite de matérialiser les features.
+        placeholder = np.zeros(len(y), dtype=np.int8)
+
+        self._logger.info(
+            f"Starting K-fold split | n_splits={self.n_splits} | n_repeats={self.n_repeats}"
+        )
+
+        for i, (train_idx, valid_idx) in enumerate(cv.split(placeholder, y)):
+            yield i // self.n_splits, i % self.n_splits, train_idx, valid_idx
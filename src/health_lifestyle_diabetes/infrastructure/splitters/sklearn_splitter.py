@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 from typing import Any, Tuple
 
+import numpy as np
+from pandas.util import hash_array
 from sklearn.model_selection import train_test_split
 
+from health_lifestyle_diabetes.domain.entities.split_indices import SplitIndices
 from health_lifestyle_diabetes.domain.ports.dataset_splitter_port import DatasetSplitterPort
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
 from health_lifestyle_diabetes.infrastructure.utils.exceptions import DatasetValidationError
@@ -41,21 +45,54 @@ class SklearnDatasetSplitter(DatasetSplitterPort):
     def split(self, dataset: Any) -> Tuple[Any, Any]:
         self._logger.info("Starting dataset split")
 
+        indices = self.split_indices(dataset)
+        train_data = dataset.iloc[indices.train]
+        test_data = dataset.iloc[indices.test]
+
+        self._logger.info(
+            f"Split done | train={train_data.shape} | test={test_data.shape}"
+        )
+
+        return train_data, test_data
+
+    def split_indices(self, dataset: Any) -> SplitIndices:
+        """
+        Stratified split returning row positions only (no DataFrame copies).
+
+        The permutation is identical to train_test_split applied to the
+        DataFrame itself, so `dataset.iloc[indices.train]` matches `split()`.
+        """
         if self._target_column not in dataset.columns:
             raise DatasetValidationError(
                 f"Target column not found in dataset: '{self._target_column}'"
             )
 
-        train_data, test_data = train_test_split(
-            dataset,
+        n_rows = len(dataset)
+        index_dtype = np.int32 if n_rows < np.iinfo(np.int32).max else np.int64
+        target = dataset[self._target_column].to_numpy()
+
+        train_idx, test_idx = train_test_split(
+            np.arange(n_rows, dtype=index_dtype),
             train_size=self._train_size,
             random_state=self._random_state,
             shuffle=True,
-            stratify=dataset[self._target_column],
+            stratify=target,
         )
 
+        fingerprint = self._fingerprint(target, train_idx)
         self._logger.info(
-            f"Split done | train={train_data.shape} | test={test_data.shape}"
+            f"Index split done | train={len(train_idx)} | test={len(test_idx)} | "
+            f"fingerprint={fingerprint[:12]}"
         )
 
-        return train_data, test_data
\ No newline at end of file
+        return SplitIndices(train=train_idx, test=test_idx, fingerprint=fingerprint)
+
+    def _fingerprint(self, target: np.ndarray, train_idx: np.ndarray) -> str:
+        """sha256 over split parameters, target values and train positions."""
+        digest = hashlib.sha256()
+        digest.update(
+            f"{len(target)}|{self._train_size}|{self._random_state}|{self._target_column}".encode()
+        )
+        digest.update(hash_array(np.asarray(target)).tobytes())
+        digest.update(np.sort(train_idx).astype(np.int64).tobytes())
+        return digest.hexdigest()
@@ -1,23 +1,42 @@
 import random
 import time
 import uuid
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterator, Optional
 
 import pandas as pd
 from health_lifestyle_diabetes.domain.ports.dataframe_streamer_port import (
     DataFrameStreamerPort,
 )
 from health_lifestyle_diabetes.infrastructure.logger.loguru_logger import LoguruLogger
+from health_lifestyle_diabetes.infrastructure.logger.performance_logging import SampledLogger
+from health_lifestyle_diabetes.infrastructure.monitoring.metrics_registry import (
+    MetricsRegistry,
+    get_metrics_registry,
+)
 
 
 class PandasDataFrameStreamer(DataFrameStreamerPort):
     """
     Adapter technique pour streamer un DataFrame pandas ligne par ligne.
+
+    Les logs par ligne sont échantillonnés (1 sur `log_every`) et construits
+    paresseusement : le coût du logging reste négligeable dans la boucle.
+    `log_every=1` rétablit un log par ligne.
+
+    Métriques (registre partagé par défaut) : lignes émises et flux actifs.
     """
 
-    def __init__(self, logger=None):
+    def __init__(
+        self,
+        logger=None,
+        log_every: int = 1000,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
         self.logger = logger or LoguruLogger()
-
+        self.row_logger = SampledLogger(self.logger, every=log_every)
+        metrics = metrics or get_metrics_registry()
+        self._rows = metrics.counter("hld_stream_rows_total", "Lignes émises par le streamer.")
+        self._active = metrics.gauge("hld_stream_active", "Flux de streaming en cours.")
 
     def stream(
         self,
@@ -26,14 +45,19 @@ class PandasDataFrameStreamer(DataFrameStreamerPort):
         max_delay: float,
     ) -> Iterator[Dict[str, Any]]:
 
-        for _, row in df.iterrows():
-            # ID unique par ligne
-            payload = {
-                "user_id": str(uuid.uuid4()),
-                **row.to_dict(),
-            }
-            self.logger.info(f"Envoi ligne user_id={payload['user_id']}")
-            # Simule un flux temps réel
-            time.sleep(random.uniform(min_delay, max_delay))
-
-            yield payload
+        self._active.inc()
+        try:
+            for _, row in df.iterrows():
+                # ID unique par ligne
+                payload = {
+                    "user_id": str(uuid.uuid4()),
+                    **row.to_dict(),
+                }
+                self.row_logger.info(lambda: f"Envoi ligne user_id={payload['user_id']}")
+                # Simule un flux temps réel
+                time.sleep(random.uniform(min_delay, max_delay))
+
+                self._rows.inc()
+                yield payload
+        finally:
+            self._active.dec()
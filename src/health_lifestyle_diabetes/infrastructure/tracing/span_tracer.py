@@ -0,0 +1,243 @@
+"""
+span_tracer.py
+================================================
+Traceur léger (durées + pic mémoire) conforme au TracerPort.
+
+- Spans imbriqués via context manager ; une pile par thread.
+- Durée : time.perf_counter().
+- Pic mémoire par span : tracemalloc (démarré au premier span racine s'il
+  n'est pas déjà actif, arrêté à la fin du dernier). Le pic d'un parent
+  inclut celui de ses enfants. tracemalloc étant global au processus, les
+  allocations de threads concurrents sont comptées dans les spans ouverts.
+  Le suivi mémoire ralentit les allocations : `track_memory=False` le
+  désactive.
+- Export à la fermeture de chaque span :
+    * logger : un message `info` avec le contexte structuré (span,
+      duration_ms, peak_memory_mb, status, attributes), repris tel quel
+      par le sink JSON (voir logger/config.py),
+    * tracker (optionnel) : métriques `span.<chemin>.duration_s` et
+      `span.<chemin>.peak_memory_mb`, avec `step` = numéro d'occurrence
+      du chemin (folds, itérations...).
+- Mémoire bornée pour les processus longue durée : l'historique `spans`
+  ne garde que les `max_spans` derniers spans, `summary()` repose sur des
+  agrégats par chemin mis à jour à la fermeture (exacts sur toute la vie
+  du traceur).
+"""
+
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from health_lifestyle_diabetes.domain.entities.trace_span import TraceSpan
+from health_lifestyle_diabetes.domain.ports.experiment_tracking_port import (
+    ExperimentTrackingPort,
+)
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.tracer_port import TracerPort
+
+_MB = 1024 * 1024
+
+
+class _Frame:
+    """Span ouvert + état mémoire (octets) au démarrage et pic observé."""
+
+    __slots__ = ("span", "start_memory", "peak_memory")
+
+    def __init__(self, span: TraceSpan, start_memory: int = 0):
+        self.span = span
+        self.start_memory = start_memory
+        self.peak_memory = start_memory
+
+
+class SpanTracer(TracerPort):
+    """
+    Traceur par défaut pour le profilage des use cases et pipelines.
+
+    Parameters
+    ----------
+    logger : LoggerPort, optional
+        Destination des spans terminés (sink JSON en production).
+    tracker : ExperimentTrackingPort, optional
+        Run de tracking recevant les durées et pics mémoire. Une erreur
+        du tracker est loggée sans interrompre le traitement.
+    track_memory : bool
+        Mesure du pic mémoire par span (tracemalloc).
+    max_spans : int, optional
+        Taille de l'historique `spans` (derniers spans terminés) ; None :
+        historique non borné (scripts courts uniquement).
+    """
+
+    def __init__(
+        self,
+        logger: Optional[LoggerPort] = None,
+        tracker: Optional[ExperimentTrackingPort] = None,
+        track_memory: bool = True,
+        max_spans: Optional[int] = 1000,
+    ):
+        self.logger = logger
+        self.tracker = tracker
+        self.track_memory = track_memory
+        self.max_spans = max_spans
+        # Derniers spans terminés, dans l'ordre de fermeture (enfants avant parents).
+        self.spans: Deque[TraceSpan] = deque(maxlen=max_spans)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Agrégats par chemin (count sert aussi de `step` pour le tracker).
+        self._summary: Dict[str, Dict[str, float]] = {}
+        self._open_roots = 0
+        self._owns_tracemalloc = False
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[TraceSpan]:
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span = TraceSpan(
+            name=name,
+            path=f"{parent.span.path}/{name}" if parent else name,
+            depth=len(stack),
+            attributes=dict(attributes),
+        )
+
+        if parent is None:
+            self._root_opened()
+        frame = _Frame(span, self._enter_memory(parent))
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            span.status = "error"
+            raise
+        finally:
+            span.duration_s = time.perf_counter() - start
+            stack.pop()
+            self._exit_memory(frame, parent)
+            if parent is None:
+                self._root_closed()
+            self._export(span)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Agrégat par chemin : nombre d'occurrences, durée totale / max (s)
+        et pic mémoire max (Mo), sur tous les spans terminés (y compris
+        ceux sortis de l'historique `spans`).
+        """
+        with self._lock:
+            return {path: dict(entry) for path, entry in self._summary.items()}
+
+    # ------------------------------------------------------------------
+    # Sérialisation (trainer envoyé aux workers de validation croisée)
+    # ------------------------------------------------------------------
+    def __getstate__(self) -> Dict[str, Any]:
+        # Le worker trace localement (logs) : ni historique, ni tracker
+        # (la run active appartient au processus parent).
+        return {
+            "logger": self.logger,
+            "track_memory": self.track_memory,
+            "max_spans": self.max_spans,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    # ------------------------------------------------------------------
+    # Pile par thread
+    # ------------------------------------------------------------------
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    # ------------------------------------------------------------------
+    # Mémoire (tracemalloc)
+    # ------------------------------------------------------------------
+    def _root_opened(self) -> None:
+        if not self.track_memory:
+            return
+        with self._lock:
+            self._open_roots += 1
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+
+    def _root_closed(self) -> None:
+        if not self.track_memory:
+            return
+        with self._lock:
+            self._open_roots -= 1
+            if self._open_roots == 0 and self._owns_tracemalloc:
+                tracemalloc.stop()
+                self._owns_tracemalloc = False
+
+    def _enter_memory(self, parent: Optional[_Frame]) -> int:
+        if not self.track_memory:
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            # Le pic courant appartient au parent avant d'être remis à zéro.
+            parent.peak_memory = max(parent.peak_memory, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def _exit_memory(self, frame: _Frame, parent: Optional[_Frame]) -> None:
+        if not self.track_memory:
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        frame.peak_memory = max(frame.peak_memory, peak)
+        frame.span.peak_memory_bytes = frame.peak_memory - frame.start_memory
+        if parent is not None:
+            parent.peak_memory = max(parent.peak_memory, frame.peak_memory)
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    def _export(self, span: TraceSpan) -> None:
+        duration_ms = span.duration_s * 1000
+        peak_mb = (
+            span.peak_memory_bytes / _MB if span.peak_memory_bytes is not None else None
+        )
+
+        with self._lock:
+            self.spans.append(span)
+            entry = self._summary.setdefault(
+                span.path,
+                {"count": 0, "total_s": 0.0, "max_s": 0.0, "max_peak_memory_mb": 0.0},
+            )
+            step = entry["count"]
+            entry["count"] += 1
+            entry["total_s"] += span.duration_s
+            entry["max_s"] = max(entry["max_s"], span.duration_s)
+            if peak_mb is not None:
+                entry["max_peak_memory_mb"] = max(entry["max_peak_memory_mb"], peak_mb)
+
+        if self.logger is not None:
+            memory = f" | pic_mémoire={peak_mb:.1f} Mo" if peak_mb is not None else ""
+            self.logger.info(
+                f"Span terminé | {span.path} | durée={duration_ms:.1f} ms{memory}"
+                f" | statut={span.status}",
+                span=span.path,
+                duration_ms=round(duration_ms, 3),
+                peak_memory_mb=round(peak_mb, 3) if peak_mb is not None else None,
+                status=span.status,
+                attributes=span.attributes,
+            )
+
+        if self.tracker is not None:
+            metrics = {f"span.{span.path}.duration_s": span.duration_s}
+            if peak_mb is not None:
+                metrics[f"span.{span.path}.peak_memory_mb"] = peak_mb
+            try:
+                self.tracker.log_metrics(metrics, step=step)
+            except Exception as exc:
+                if self.logger is not None:
+                    self.logger.warning(
+                        f"Export du span '{span.path}' vers le tracker impossible : {exc}"
+                    )
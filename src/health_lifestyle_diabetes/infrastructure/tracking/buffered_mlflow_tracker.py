@@ -0,0 +1,337 @@
+# infrastructure/tracking/buffered_mlflow_tracker.py
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, List, Mapping, Optional, Tuple
+
+from health_lifestyle_diabetes.domain.ports.experiment_tracking_port import ExperimentTrackingPort
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.run_query_port import RunQueryPort
+from health_lifestyle_diabetes.infrastructure.monitoring.metrics_registry import (
+    MetricsRegistry,
+    get_metrics_registry,
+)
+from health_lifestyle_diabetes.infrastructure.tracking.mlflow_setup import MLflowConfigurator
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from mlflow.entities import Metric, Param
+    from mlflow.tracking import MlflowClient
+
+# Limites d'un appel MlflowClient.log_batch.
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_PER_BATCH = 100
+
+_FLUSH = object()
+_STOP = object()
+
+
+@lru_cache(maxsize=1)
+def _entities() -> Tuple[type, type]:
+    """Import différé des entités MLflow (Metric, Param)."""
+    from mlflow.entities import Metric, Param
+
+    return Metric, Param
+
+
+class BufferedMLflowExperimentTracker(ExperimentTrackingPort, RunQueryPort):
+    """
+    Adaptateur MLflow asynchrone du port ExperimentTrackingPort.
+
+    - Les appels log_* ne font qu'empiler dans une file bornée : la boucle
+      d'entraînement ne bloque jamais sur le backend.
+    - Un thread de fond regroupe paramètres et métriques et les envoie par
+      MlflowClient.log_batch (par chunks respectant les limites MLflow).
+    - end_run() vide la file avant de clôturer la run ; l'attente est
+      bornée par `flush_timeout` (thread de fond arrêté : pas d'attente).
+    - Backend lent ou indisponible : retries avec backoff, puis abandon du
+      batch (journalisé) ; file pleine : l'élément est ignoré et compté.
+    - Initialisation paresseuse : ni import de mlflow ni appel réseau à la
+      construction ; le client est configuré au premier usage.
+    - Métriques : profondeur de file (`hld_tracking_queue_depth`, lue au
+      scrape) et éléments ignorés (`hld_tracking_dropped_total`). Jauge
+      non labellisée : la dernière instance créée est exposée.
+    """
+
+    def __init__(
+        self,
+        logger: LoggerPort,
+        *,
+        max_queue_size: int = 10_000,
+        flush_interval: float = 2.0,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        flush_timeout: float = 30.0,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        self.logger = logger
+        self._client: Optional[MlflowClient] = None
+        self._artifact_uri: Optional[str] = None
+        self._init_lock = threading.Lock()
+
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.flush_timeout = flush_timeout
+
+        self.experiment_id: Optional[str] = None
+        self.run_id: Optional[str] = None
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+
+        # Profondeur de file lue au scrape (aucun coût sur log_*).
+        metrics = metrics or get_metrics_registry()
+        metrics.gauge(
+            "hld_tracking_queue_depth", "Éléments en attente d'envoi vers MLflow."
+        ).set_function(self._queue.qsize)
+        self._dropped_total = metrics.counter(
+            "hld_tracking_dropped_total", "Éléments de tracking ignorés (file pleine)."
+        )
+        self._worker = threading.Thread(
+            target=self._consume, name="mlflow-buffered-tracker", daemon=True
+        )
+        self._worker.start()
+        self.logger.info("BufferedMLflowExperimentTracker prêt (initialisation différée).")
+
+    # -------------------------
+    # Initialisation différée
+    # -------------------------
+    @property
+    def client(self) -> MlflowClient:
+        self._ensure_initialized()
+        return self._client
+
+    @property
+    def artifact_uri(self) -> str:
+        self._ensure_initialized()
+        return self._artifact_uri
+
+    def _ensure_initialized(self) -> None:
+        if self._client is not None:
+            return
+        with self._init_lock:
+            if self._client is None:
+                configurator = MLflowConfigurator(self.logger)
+                client, self._artifact_uri = configurator.configure()
+                self._client = client
+                self.logger.info("BufferedMLflowExperimentTracker initialisé.")
+
+    # -------------------------
+    # Expériences
+    # -------------------------
+    def setup_experiment(self, name: str) -> str:
+        """
+        Active (ou crée) une expérience MLflow.
+        Si l'expérience existe mais est supprimée, elle est restaurée.
+        """
+        experiment = self.client.get_experiment_by_name(name)
+
+        if experiment and experiment.lifecycle_stage == "deleted":
+            self.logger.warning("Expérience supprimée détectée. Restauration en cours.")
+            self.client.restore_experiment(experiment.experiment_id)
+
+        if experiment:
+            self.experiment_id = experiment.experiment_id
+        else:
+            self.experiment_id = self.client.create_experiment(
+                name=name,
+                artifact_location=self.artifact_uri,
+            )
+            self.logger.info(f"Expérience créée : {name}")
+
+        self.logger.info(f"Expérience active : {name}")
+        return self.experiment_id
+
+    # -------------------------
+    # Runs
+    # -------------------------
+    def start_run(self, run_name: str | None = None) -> None:
+        """Crée une run via le client (aucun état global mlflow)."""
+        if self.run_id is not None:
+            self.logger.warning("Run déjà active détectée. Fermeture automatique.")
+            self.end_run()
+
+        if self.experiment_id is None:
+            raise RuntimeError("setup_experiment() doit être appelé avant start_run().")
+
+        run = self.client.create_run(self.experiment_id, run_name=run_name)
+        self.run_id = run.info.run_id
+        self.logger.info(f"Run démarrée : {run_name} ({self.run_id})")
+
+    def end_run(self) -> None:
+        """Vide la file puis ferme la run active."""
+        if self.run_id is None:
+            return
+        self.flush()
+        self.logger.info(f"Fermeture de la run : {self.run_id}")
+        self.client.set_terminated(self.run_id)
+        self.run_id = None
+        with self._dropped_lock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            self.logger.warning(f"{dropped} éléments de tracking ignorés (file pleine).")
+        self._dropped_lock = threading.Lock()
+
+    # -------------------------
+    # Logging (non bloquant)
+    # -------------------------
+    def log_params(self, params: Mapping[str, Any]) -> None:
+        _, Param = _entities()
+        for key, value in params.items():
+            self._enqueue(("param", self.run_id, Param(str(key), str(value))))
+
+    def log_metrics(self, metrics: Mapping[str, float], step: int | None = None) -> None:
+        Metric, _ = _entities()
+        timestamp = int(time.time() * 1000)
+        for key, value in metrics.items():
+            self._enqueue(
+                ("metric", self.run_id, Metric(str(key), float(value), timestamp, step or 0))
+            )
+
+    def log_artifact(self, path: str) -> None:
+        self._enqueue(("artifact", self.run_id, path))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend l'envoi de tous les éléments en file, au plus `timeout`
+        secondes (défaut : `flush_timeout`). Retourne False si la file n'a
+        pas été vidée (délai dépassé ou thread de fond arrêté).
+        """
+        if not self._worker.is_alive():
+            self.logger.error(
+                f"Thread MLflow arrêté : {self._queue.qsize()} éléments non envoyés."
+            )
+            return False
+
+        timeout = self.flush_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        done = threading.Event()
+        try:
+            self._queue.put((_FLUSH, None, done), timeout=timeout)
+        except queue.Full:
+            self.logger.warning("Flush MLflow impossible : file pleine dans le délai imparti.")
+            return False
+        if not done.wait(max(deadline - time.monotonic(), 0.0)):
+            self.logger.warning("Flush MLflow non terminé dans le délai imparti.")
+            return False
+        return True
+
+    def close(self) -> None:
+        """Vide la file et arrête le thread de fond (attente bornée)."""
+        self.end_run()
+        if not self._worker.is_alive():
+            return
+        try:
+            self._queue.put((_STOP, None, None), timeout=self.flush_timeout)
+        except queue.Full:
+            self.logger.warning("Arrêt du thread MLflow impossible : file pleine.")
+            return
+        self._worker.join(self.flush_timeout)
+
+    # -------------------------
+    # Requêtes (RunQueryPort)
+    # -------------------------
+    def search_runs_page(
+        self,
+        experiment_name: str,
+        *,
+        max_results: int = 1000,
+        page_token: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, Optional[str]]:
+        """Vide d'abord la file : la run courante est visible dans les résultats."""
+        if self.run_id is not None:
+            self.flush()
+        from health_lifestyle_diabetes.infrastructure.tracking.mlflow_run_query import (
+            search_mlflow_runs_page,
+        )
+
+        return search_mlflow_runs_page(
+            self.client, experiment_name, max_results=max_results, page_token=page_token
+        )
+
+    # -------------------------
+    # Thread de fond
+    # -------------------------
+    def _enqueue(self, item: Tuple[str, Optional[str], Any]) -> None:
+        if item[1] is None:
+            self.logger.warning("Aucune run active : élément de tracking ignoré.")
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+            self._dropped_total.inc()
+
+    def _consume(self) -> None:
+        params: List[Tuple[str, Param]] = []
+        metrics: List[Tuple[str, Metric]] = []
+        last_flush = time.monotonic()
+
+        while True:
+            timeout = max(self.flush_interval - (time.monotonic() - last_flush), 0.0)
+            try:
+                kind, run_id, payload = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                kind = None
+
+            if kind == "param":
+                params.append((run_id, payload))
+            elif kind == "metric":
+                metrics.append((run_id, payload))
+            elif kind == "artifact":
+                self._send_batches(params, metrics)
+                self._with_retries(self.client.log_artifact, run_id, payload)
+
+            if (
+                kind in (_FLUSH, _STOP, None)
+                or len(metrics) >= MAX_METRICS_PER_BATCH
+                or len(params) >= MAX_PARAMS_PER_BATCH
+            ):
+                self._send_batches(params, metrics)
+                last_flush = time.monotonic()
+
+            if kind is not None:
+                self._queue.task_done()
+            if kind is _FLUSH:
+                payload.set()
+            elif kind is _STOP:
+                return
+
+    def _send_batches(
+        self,
+        params: List[Tuple[str, Param]],
+        metrics: List[Tuple[str, Metric]],
+    ) -> None:
+        """Envoie les éléments accumulés, groupés par run, en chunks log_batch."""
+        run_ids = dict.fromkeys(r for r, _ in params + metrics)
+        for run_id in run_ids:
+            run_params = [p for r, p in params if r == run_id]
+            run_metrics = [m for r, m in metrics if r == run_id]
+            while run_params or run_metrics:
+                chunk_params = run_params[:MAX_PARAMS_PER_BATCH]
+                chunk_metrics = run_metrics[: MAX_METRICS_PER_BATCH - len(chunk_params)]
+                run_params = run_params[len(chunk_params):]
+                run_metrics = run_metrics[len(chunk_metrics):]
+                self._with_retries(
+                    self.client.log_batch, run_id, metrics=chunk_metrics, params=chunk_params
+                )
+        params.clear()
+        metrics.clear()
+
+    def _with_retries(self, func, *args, **kwargs) -> None:
+        for attempt in range(self.max_retries + 1):
+            try:
+                func(*args, **kwargs)
+                return
+            except Exception as exc:  # backend lent / indisponible
+                if attempt == self.max_retries:
+                    self.logger.error(f"Échec d'envoi MLflow abandonné : {exc}")
+                    return
+                time.sleep(self.retry_backoff * 2**attempt)
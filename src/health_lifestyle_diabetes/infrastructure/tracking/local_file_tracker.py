@@ -0,0 +1,352 @@
+# infrastructure/tracking/local_file_tracker.py
+
+from __future__ import annotations
+
+import json
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, TextIO, Tuple
+
+import pandas as pd
+
+from health_lifestyle_diabetes.domain.ports.experiment_tracking_port import ExperimentTrackingPort
+from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.run_query_port import RunQueryPort
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
+
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
+
+# Fichiers append-only du store.
+_EXPERIMENTS = "experiments.jsonl"
+_RUNS = "runs.jsonl"
+_PARAMS = "params.jsonl"
+_METRICS = "metrics.jsonl"
+_EXPORTS = "exports.jsonl"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def __getattr__(name: str):
+    """Constantes de chemin résolues à la demande (PEP 562), sans effet de bord à l'import."""
+    if name == "LOCAL_TRACKING_DIR":
+        return get_settings().paths.tracking.local_store
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class LocalFileExperimentTracker(ExperimentTrackingPort, RunQueryPort):
+    """
+    Tracker local, hors-ligne, implémentant ExperimentTrackingPort.
+
+    Stockage append-only (une ligne JSON par événement) :
+    - experiments.jsonl / runs.jsonl : cycle de vie des expériences et runs,
+    - params.jsonl / metrics.jsonl   : toutes les runs dans un seul fichier,
+      lu en une passe (pandas) pour interroger des milliers de runs,
+    - artifacts/<run_id>/            : copies des fichiers loggés.
+
+    Aucun serveur requis : les runs peuvent être exportées plus tard dans
+    MLflow (`export_to_mlflow`).
+    """
+
+    def __init__(
+        self,
+        logger: LoggerPort,
+        root_dir: Optional[str | Path] = None,
+        flush_every: int = 500,
+        settings: Optional[AppSettings] = None,
+    ):
+        self.logger = logger
+        self.root_dir = (
+            Path(root_dir)
+            if root_dir is not None
+            else (settings or get_settings()).paths.tracking.local_store
+        )
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+
+        self.experiment_id: Optional[str] = None
+        self.experiment_name: Optional[str] = None
+        self.run_id: Optional[str] = None
+
+        self._handles: Dict[str, TextIO] = {}
+        self._pending = 0
+        self._frames_cache: Dict[str, tuple] = {}
+        self.logger.info(f"LocalFileExperimentTracker prêt ({self.root_dir}).")
+
+    # -------------------------
+    # Expériences
+    # -------------------------
+    def setup_experiment(self, name: str) -> str:
+        experiments = self._read_jsonl(_EXPERIMENTS)
+        match = experiments[experiments["name"] == name] if not experiments.empty else experiments
+
+        if not match.empty:
+            self.experiment_id = str(match["experiment_id"].iloc[0])
+        else:
+            self.experiment_id = uuid.uuid4().hex[:12]
+            self._append(
+                _EXPERIMENTS,
+                {"experiment_id": self.experiment_id, "name": name, "created_at": _now_ms()},
+                flush=True,
+            )
+            self.logger.info(f"Expérience créée : {name}")
+
+        self.experiment_name = name
+        self.logger.info(f"Expérience active : {name}")
+        return self.experiment_id
+
+    # -------------------------
+    # Runs
+    # -------------------------
+    def start_run(self, run_name: str | None = None) -> None:
+        if self.run_id is not None:
+            self.logger.warning("Run déjà active détectée. Fermeture automatique.")
+            self.end_run()
+        if self.experiment_id is None:
+            raise RuntimeError("setup_experiment() doit être appelé avant start_run().")
+
+        self.run_id = uuid.uuid4().hex
+        self._append(
+            _RUNS,
+            {
+                "event": "start",
+                "run_id": self.run_id,
+                "experiment_id": self.experiment_id,
+                "run_name": run_name,
+                "timestamp": _now_ms(),
+            },
+            flush=True,
+        )
+        self.logger.info(f"Run démarrée : {run_name} ({self.run_id})")
+
+    def end_run(self) -> None:
+        if self.run_id is None:
+            return
+        self._append(
+            _RUNS,
+            {"event": "end", "run_id": self.run_id, "status": "FINISHED", "timestamp": _now_ms()},
+        )
+        self.flush()
+        self.logger.info(f"Fermeture de la run : {self.run_id}")
+        self.run_id = None
+
+    # -------------------------
+    # Logging
+    # -------------------------
+    def log_params(self, params: Mapping[str, Any]) -> None:
+        run_id = self._require_run()
+        for key, value in params.items():
+            self._append(_PARAMS, {"run_id": run_id, "key": str(key), "value": str(value)})
+
+    def log_metrics(self, metrics: Mapping[str, float], step: int | None = None) -> None:
+        run_id = self._require_run()
+        timestamp = _now_ms()
+        for key, value in metrics.items():
+            self._append(
+                _METRICS,
+                {
+                    "run_id": run_id,
+                    "key": str(key),
+                    "value": float(value),
+                    "step": int(step or 0),
+                    "timestamp": timestamp,
+                },
+            )
+
+    def log_artifact(self, path: str) -> None:
+        run_id = self._require_run()
+        target = self.root_dir / "artifacts" / run_id
+        target.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(path, target / Path(path).name)
+        self.logger.debug(f"Artefact enregistré : {path}")
+
+    def flush(self) -> None:
+        for handle in self._handles.values():
+            handle.flush()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.end_run()
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+    # -------------------------
+    # Requêtes
+    # -------------------------
+    def search_runs(self, experiment_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        Une ligne par run : identifiants, statut, `params.<clé>` et
+        `metrics.<clé>` (dernière valeur loggée, step maximal).
+        """
+        self.flush()
+        runs = self._read_jsonl(_RUNS)
+        if runs.empty:
+            return pd.DataFrame(columns=["run_id", "run_name", "experiment_id", "status"])
+
+        starts = runs[runs["event"] == "start"].drop(columns=["event", "status"], errors="ignore")
+        starts = starts.rename(columns={"timestamp": "start_time"})
+        ends = runs[runs["event"] == "end"][["run_id", "status", "timestamp"]]
+        ends = ends.rename(columns={"timestamp": "end_time"})
+        frame = starts.merge(ends, on="run_id", how="left")
+        frame["status"] = frame["status"].fillna("RUNNING")
+
+        experiments = self._read_jsonl(_EXPERIMENTS)
+        if not experiments.empty:
+            frame = frame.merge(
+                experiments[["experiment_id", "name"]].rename(columns={"name": "experiment_name"}),
+                on="experiment_id",
+                how="left",
+            )
+            if experiment_name is not None:
+                frame = frame[frame["experiment_name"] == experiment_name]
+
+        params = self._read_jsonl(_PARAMS)
+        if not params.empty:
+            wide = params.drop_duplicates(["run_id", "key"], keep="last").pivot(
+                index="run_id", columns="key", values="value"
+            )
+            frame = frame.merge(wide.add_prefix("params."), left_on="run_id", right_index=True, how="left")
+
+        metrics = self._read_jsonl(_METRICS)
+        if not metrics.empty:
+            last = metrics.sort_values(["step", "timestamp"], kind="stable").drop_duplicates(
+                ["run_id", "key"], keep="last"
+            )
+            wide = last.pivot(index="run_id", columns="key", values="value")
+            frame = frame.merge(wide.add_prefix("metrics."), left_on="run_id", right_index=True, how="left")
+
+        return frame.reset_index(drop=True)
+
+    def search_runs_page(
+        self,
+        experiment_name: str,
+        *,
+        max_results: int = 1000,
+        page_token: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, Optional[str]]:
+        """RunQueryPort : pagination par offset sur `search_runs`."""
+        frame = self.search_runs(experiment_name)
+        offset = int(page_token) if page_token else 0
+        end = offset + max_results
+        next_token = str(end) if end < len(frame) else None
+        return frame.iloc[offset:end].reset_index(drop=True), next_token
+
+    def get_metric_history(self, run_id: str, key: str) -> pd.DataFrame:
+        """Historique (step, value, timestamp) d'une métrique d'une run."""
+        self.flush()
+        metrics = self._read_jsonl(_METRICS)
+        if metrics.empty:
+            return pd.DataFrame(columns=["step", "value", "timestamp"])
+        mask = (metrics["run_id"] == run_id) & (metrics["key"] == key)
+        return metrics.loc[mask, ["step", "value", "timestamp"]].sort_values("step").reset_index(drop=True)
+
+    # -------------------------
+    # Export MLflow
+    # -------------------------
+    def export_to_mlflow(self, client: Any, batch_size: int = 1000) -> List[str]:
+        """
+        Exporte dans MLflow les runs terminées non encore exportées.
+
+        `client` : instance MlflowClient déjà configurée. Retourne les
+        identifiants MLflow des runs créées.
+        """
+        from mlflow.entities import Metric, Param
+
+        self.flush()
+        runs = self.search_runs()
+        exported = set(self._read_jsonl(_EXPORTS).get("run_id", pd.Series(dtype=str)))
+        runs = runs[(runs["status"] == "FINISHED") & ~runs["run_id"].isin(exported)]
+        if runs.empty:
+            return []
+
+        params = self._read_jsonl(_PARAMS)
+        metrics = self._read_jsonl(_METRICS)
+        params_by_run = dict(tuple(params.groupby("run_id"))) if not params.empty else {}
+        metrics_by_run = dict(tuple(metrics.groupby("run_id"))) if not metrics.empty else {}
+
+        created: List[str] = []
+        experiment_ids: Dict[str, str] = {}
+        for run in runs.itertuples(index=False):
+            name = getattr(run, "experiment_name", None) or "local_import"
+            if name not in experiment_ids:
+                experiment = client.get_experiment_by_name(name)
+                experiment_ids[name] = (
+                    experiment.experiment_id if experiment else client.create_experiment(name)
+                )
+
+            mlflow_run = client.create_run(
+                experiment_ids[name], start_time=int(run.start_time), run_name=run.run_name
+            )
+            mlflow_run_id = mlflow_run.info.run_id
+
+            run_params = params_by_run.get(run.run_id)
+            param_entities = (
+                [
+                    Param(k, v)
+                    for k, v in run_params.drop_duplicates("key", keep="last")[["key", "value"]].itertuples(index=False)
+                ]
+                if run_params is not None
+                else []
+            )
+            run_metrics = metrics_by_run.get(run.run_id)
+            metric_entities = (
+                [
+                    Metric(k, float(v), int(ts), int(s))
+                    for k, v, ts, s in run_metrics[["key", "value", "timestamp", "step"]].itertuples(index=False)
+                ]
+                if run_metrics is not None
+                else []
+            )
+
+            for i in range(0, len(param_entities), 100):
+                client.log_batch(mlflow_run_id, params=param_entities[i:i + 100])
+            for i in range(0, len(metric_entities), batch_size):
+                client.log_batch(mlflow_run_id, metrics=metric_entities[i:i + batch_size])
+
+            artifacts = self.root_dir / "artifacts" / run.run_id
+            if artifacts.exists():
+                client.log_artifacts(mlflow_run_id, str(artifacts))
+
+            client.set_terminated(mlflow_run_id, end_time=int(run.end_time))
+            self._append(_EXPORTS, {"run_id": run.run_id, "mlflow_run_id": mlflow_run_id}, flush=True)
+            created.append(mlflow_run_id)
+
+        self.logger.info(f"Export MLflow terminé : {len(created)} runs.")
+        return created
+
+    # -------------------------
+    # I/O
+    # -------------------------
+    def _require_run(self) -> str:
+        if self.run_id is None:
+            raise RuntimeError("Aucune run active : appeler start_run() avant de logger.")
+        return self.run_id
+
+    def _append(self, filename: str, record: Mapping[str, Any], flush: bool = False) -> None:
+        handle = self._handles.get(filename)
+        if handle is None:
+            handle = open(self.root_dir / filename, "a", encoding="utf-8")
+            self._handles[filename] = handle
+        handle.write(json.dumps(record) + "\n")
+        self._pending += 1
+        if flush or self._pending >= self.flush_every:
+            self.flush()
+
+    def _read_jsonl(self, filename: str) -> pd.DataFrame:
+        """Lecture en une passe, mise en cache tant que le fichier n'a pas changé."""
+        path = self.root_dir / filename
+        if not path.exists() or path.stat().st_size == 0:
+            return pd.DataFrame()
+        stat = path.stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        cached = self._frames_cache.get(filename)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        frame = pd.read_json(path, lines=True, dtype=False, convert_dates=False)
+        self._frames_cache[filename] = (signature, frame)
+        return frame
@@ -0,0 +1,48 @@
+# infrastructure/tracking/mlflow_run_query.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+RUN_COLUMNS = ["run_id", "run_name", "status", "start_time", "end_time"]
+
+
+def search_mlflow_runs_page(
+    client: Any,
+    experiment_name: str,
+    *,
+    max_results: int = 1000,
+    page_token: Optional[str] = None,
+) -> Tuple[pd.DataFrame, Optional[str]]:
+    """
+    Une page de `MlflowClient.search_runs` convertie en DataFrame colonnaire
+    (format RunQueryPort). Partagé par les trackers MLflow.
+    """
+    experiment = client.get_experiment_by_name(experiment_name)
+    if experiment is None:
+        return pd.DataFrame(columns=RUN_COLUMNS), None
+
+    page = client.search_runs(
+        [experiment.experiment_id],
+        max_results=max_results,
+        page_token=page_token,
+    )
+
+    rows: List[Dict[str, Any]] = []
+    for run in page:
+        info, data = run.info, run.data
+        row: Dict[str, Any] = {
+            "run_id": info.run_id,
+            "run_name": info.run_name,
+            "status": info.status,
+            "start_time": info.start_time,
+            "end_time": info.end_time,
+        }
+        row.update({f"params.{k}": v for k, v in data.params.items()})
+        row.update({f"metrics.{k}": v for k, v in data.metrics.items()})
+        rows.append(row)
+
+    frame = pd.DataFrame(rows) if rows else pd.DataFrame(columns=RUN_COLUMNS)
+    return frame, getattr(page, "token", None) or None
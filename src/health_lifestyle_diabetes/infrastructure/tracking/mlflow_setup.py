@@ -1,14 +1,18 @@
 # infrastructure/tracking/mlflow_setup.py
 
+from __future__ import annotations
+
 import os
+from typing import TYPE_CHECKING
 
-import mlflow
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
 from health_lifestyle_diabetes.infrastructure.utils.exceptions import (
     MLflowConfigurationError,
     MLflowSetupError,
 )
-from mlflow.tracking import MlflowClient
+
+if TYPE_CHECKING:
+    from mlflow.tracking import MlflowClient
 
 
 class MLflowConfigurator:
@@ -18,6 +22,9 @@ class MLflowConfigurator:
     - Vérifie la configuration requise.
     - Configure l'URI de tracking et l'URI des artefacts.
     - Vérifie l'accès au backend MLflow.
+
+    mlflow n'est importé qu'à l'appel de `configure()` : importer ce module
+    reste gratuit pour les processus qui ne trackent rien (inférence).
     """
 
     def __init__(self, logger: LoggerPort):
@@ -39,6 +46,9 @@ class MLflowConfigurator:
     def configure(self) -> tuple[MlflowClient, str]:
         """Configure MLflow et retourne le client + l'URI normalisée des artefacts."""
         try:
+            import mlflow
+            from mlflow.tracking import MlflowClient
+
             mlflow.set_tracking_uri(self.tracking_uri)
 
             artifact_uri = (
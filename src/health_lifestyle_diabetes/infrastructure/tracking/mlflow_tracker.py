@@ -1,28 +1,79 @@
 # infrastructure/tracking/mlflow_tracker.py
 
 from __future__ import annotations
-import mlflow
-from typing import Mapping, Any
+
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Tuple
 
 from health_lifestyle_diabetes.domain.ports.experiment_tracking_port import ExperimentTrackingPort
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
+from health_lifestyle_diabetes.domain.ports.run_query_port import RunQueryPort
 from health_lifestyle_diabetes.infrastructure.tracking.mlflow_setup import MLflowConfigurator
-from health_lifestyle_diabetes.infrastructure.utils.exceptions import MLflowSetupError
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from mlflow.tracking import MlflowClient
 
 
-class MLflowExperimentTracker(ExperimentTrackingPort):
+class MLflowExperimentTracker(ExperimentTrackingPort, RunQueryPort):
     """
     Adaptateur MLflow du port ExperimentTrackingPort.
 
     - Gestion du cycle de vie des expériences et runs.
     - Enregistrement des métriques, paramètres et artefacts.
+    - Recherche paginée des runs (RunQueryPort).
+
+    Initialisation paresseuse : la construction ne fait ni import de mlflow
+    ni appel réseau. Le client est configuré au premier appel qui en a
+    besoin (setup_experiment, start_run, log_*).
     """
 
     def __init__(self, logger: LoggerPort):
         self.logger = logger
-        configurator = MLflowConfigurator(logger)
-        self.client, self.artifact_uri = configurator.configure()
-        self.logger.info("MLflowExperimentTracker prêt.")
+        self._mlflow: Optional[ModuleType] = None
+        self._client: Optional[MlflowClient] = None
+        self._artifact_uri: Optional[str] = None
+        self._init_lock = threading.Lock()
+        self.logger.info("MLflowExperimentTracker prêt (initialisation différée).")
+
+    # -------------------------
+    # Initialisation différée
+    # -------------------------
+    @property
+    def is_initialized(self) -> bool:
+        return self._client is not None
+
+    @property
+    def client(self) -> MlflowClient:
+        self._ensure_initialized()
+        return self._client
+
+    @property
+    def artifact_uri(self) -> str:
+        self._ensure_initialized()
+        return self._artifact_uri
+
+    @property
+    def mlflow(self) -> ModuleType:
+        self._ensure_initialized()
+        return self._mlflow
+
+    def _ensure_initialized(self) -> None:
+        if self._client is not None:
+            return
+        with self._init_lock:
+            if self._client is not None:
+                return
+            configurator = MLflowConfigurator(self.logger)
+            client, artifact_uri = configurator.configure()
+
+            import mlflow
+
+            self._mlflow = mlflow
+            self._artifact_uri = artifact_uri
+            self._client = client
+            self.logger.info("MLflowExperimentTracker initialisé.")
 
     # -------------------------
     # Expériences
@@ -54,7 +105,7 @@ class MLflowExperimentTracker(ExperimentTrackingPort):
             self.logger.info(f"Expérience créée : {name}")
 
         self.logger.info(f"Expérience active : {name}")
-        mlflow.set_experiment(experiment_id=exp_id)
+        self.mlflow.set_experiment(experiment_id=exp_id)
         return exp_id
 
     # -------------------------
@@ -62,31 +113,51 @@ class MLflowExperimentTracker(ExperimentTrackingPort):
     # -------------------------
     def start_run(self, run_name: str | None = None) -> None:
         """Démarre une run MLflow en fermant la précédente si nécessaire."""
-        if mlflow.active_run() is not None:
+        if self.mlflow.active_run() is not None:
             self.logger.warning("Run déjà active détectée. Fermeture automatique.")
-            mlflow.end_run()
+            self.mlflow.end_run()
 
-        mlflow.start_run(run_name=run_name)
+        self.mlflow.start_run(run_name=run_name)
         self.logger.info(f"Run démarrée : {run_name}")
 
     def end_run(self) -> None:
-        """Ferme la run active."""
-        active = mlflow.active_run()
+        """Ferme la run active (sans effet si MLflow n'a jamais été initialisé)."""
+        if not self.is_initialized:
+            return
+        active = self._mlflow.active_run()
         if active:
             self.logger.info(f"Fermeture de la run : {active.info.run_id}")
-            mlflow.end_run()
+            self._mlflow.end_run()
 
     # -------------------------
     # Logging
     # -------------------------
     def log_params(self, params: Mapping[str, Any]) -> None:
         self.logger.debug(f"Paramètres enregistrés : {params}")
-        mlflow.log_params(params)
+        self.mlflow.log_params(params)
 
-    def log_metrics(self, metrics: Mapping[str, float]) -> None:
+    def log_metrics(self, metrics: Mapping[str, float], step: int | None = None) -> None:
         self.logger.debug(f"Métriques enregistrées : {metrics}")
-        mlflow.log_metrics(metrics)
+        self.mlflow.log_metrics(metrics, step=step)
 
     def log_artifact(self, path: str) -> None:
         self.logger.debug(f"Artefact enregistré : {path}")
-        mlflow.log_artifact(path)
\ No newline at end of file
+        self.mlflow.log_artifact(path)
+
+    # -------------------------
+    # Requêtes (RunQueryPort)
+    # -------------------------
+    def search_runs_page(
+        self,
+        experiment_name: str,
+        *,
+        max_results: int = 1000,
+        page_token: Optional[str] = None,
+    ) -> Tuple[pd.DataFrame, Optional[str]]:
+        from health_lifestyle_diabetes.infrastructure.tracking.mlflow_run_query import (
+            search_mlflow_runs_page,
+        )
+
+        return search_mlflow_runs_page(
+            self.client, experiment_name, max_results=max_results, page_token=page_token
+        )
@@ -1,25 +1,22 @@
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import (
-    YamlConfigLoader,
-)
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
 
 from .metrics_extractor import BoostingMetricsExtractor
 from .plotters.matplotlib import MatplotlibLearningCurvePlotter
 from .plotters.plotly import PlotlyLearningCurvePlotter
 from .saver import FigureSaver
 
-# Détermine la racine du projet.
-root = get_repository_root()
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
 
-# Load configuration
-paths = YamlConfigLoader.load_config(root / "configs/paths.yaml")
-fig_path = paths["reports"]["curves_reports"]
 
-# Extrait le chemin relatif du figure.
-DEFAULT_OUTPUT_DIR = root / fig_path
+def __getattr__(name: str):
+    """Constantes de chemin résolues à la demande (PEP 562), sans effet de bord à l'import."""
+    if name == "DEFAULT_OUTPUT_DIR":
+        return get_settings().paths.reports.curves_reports
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class BoostingTrainingDiagnostics:
@@ -33,11 +30,16 @@ class BoostingTrainingDiagnostics:
         model_name: str, # lightgbm, xgboost, catboost
         run_name: str,   # run_catboost_001
         output_dir: Optional[str] = None,
+        settings: Optional["AppSettings"] = None,
     ):
         self.model = model
         self.model_name = model_name
         self.run_name = run_name
-        self.output_dir = self.output_dir = Path(output_dir) if output_dir else Path(DEFAULT_OUTPUT_DIR)
+        self.output_dir = (
+            Path(output_dir)
+            if output_dir
+            else (settings or get_settings()).paths.reports.curves_reports
+        )
 
         self.extractor = BoostingMetricsExtractor()
         self.saver = FigureSaver(output_dir=self.output_dir, run_name=self.run_name, model_name=self.model_name)
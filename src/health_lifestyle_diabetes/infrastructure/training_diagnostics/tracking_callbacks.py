@@ -0,0 +1,175 @@
+"""
+Callbacks d'entraînement streamant les courbes d'apprentissage.
+
+Contrairement à BoostingMetricsExtractor (lecture de evals_result après
+le fit), ces callbacks publient pendant l'entraînement, à chaque itération :
+
+- les métriques train / valid (clés normalisées "train_<metric>",
+  "valid_<metric>"),
+- la durée de l'itération ("iteration_time_s") et le temps écoulé
+  ("elapsed_s").
+
+Les itérations sont regroupées par paquets de `log_every` avant d'être
+transmises à `log_fn(metrics, step)` (ex:
+ExperimentTrackingService.log_training_iteration), ce qui limite les
+appels au backend de tracking.
+
+Le callback XGBoost vit dans xgboost_tracking_callback.py : xgboost n'est
+importé que si ce callback est demandé.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+LogFunction = Callable[[Mapping[str, float], int], None]
+
+# Normalisation des noms de jeux d'évaluation des trois librairies.
+_DATASET_ALIASES = {
+    "validation_0": "train",
+    "validation_1": "valid",
+    "learn": "train",
+    "training": "train",
+    "validation": "valid",
+}
+
+
+class IterationMetricsStreamer:
+    """
+    Tampon commun aux callbacks : horodatage des itérations et envoi
+    groupé des métriques indexées par step.
+    """
+
+    def __init__(self, log_fn: LogFunction, log_every: int = 10):
+        self.log_fn = log_fn
+        self.log_every = max(1, log_every)
+        self.reset()
+
+    def reset(self) -> None:
+        self._buffer: List[Tuple[int, Dict[str, float]]] = []
+        self._start = time.perf_counter()
+        self._last = self._start
+
+    def record(self, iteration: int, evals: Mapping[str, Mapping[str, float]]) -> None:
+        """
+        Enregistre une itération.
+
+        evals : {jeu: {métrique: valeur}} tel que fourni par la librairie.
+        """
+        now = time.perf_counter()
+        metrics = {
+            f"{_DATASET_ALIASES.get(dataset, dataset)}_{name}": float(value)
+            for dataset, values in evals.items()
+            for name, value in values.items()
+        }
+        metrics["iteration_time_s"] = now - self._last
+        metrics["elapsed_s"] = now - self._start
+        self._last = now
+
+        self._buffer.append((iteration, metrics))
+        if len(self._buffer) >= self.log_every:
+            self.flush()
+
+    def flush(self) -> None:
+        for step, metrics in self._buffer:
+            self.log_fn(metrics, step)
+        self._buffer.clear()
+
+
+# ======================
+# LightGBM
+# ======================
+class LightGBMTrackingCallback:
+    """
+    Callback LightGBM (à passer via `fit(..., callbacks=[...])`).
+    """
+
+    order = 30
+
+    def __init__(self, log_fn: LogFunction, log_every: int = 10):
+        self.streamer = IterationMetricsStreamer(log_fn, log_every)
+
+    def __call__(self, env: Any) -> None:
+        if env.iteration == env.begin_iteration:
+            self.streamer.reset()
+
+        evals: Dict[str, Dict[str, float]] = {}
+        for item in env.evaluation_result_list or []:
+            dataset, name, value = item[0], item[1], item[2]
+            evals.setdefault(dataset, {})[name] = value
+        self.streamer.record(env.iteration, evals)
+
+        if env.iteration + 1 >= env.end_iteration:
+            self.streamer.flush()
+
+    def flush(self) -> None:
+        """
+        Envoie les itérations en attente. L'early stopping interrompt le
+        fit (EarlyStopException) avant la dernière itération : à appeler
+        après fit() (fait par LightGBMTrainer).
+        """
+        self.streamer.flush()
+
+
+# ======================
+# CatBoost
+# ======================
+class CatBoostTrackingCallback:
+    """
+    Callback CatBoost (à passer via `fit(..., callbacks=[...])`).
+    """
+
+    def __init__(self, log_fn: LogFunction, log_every: int = 10):
+        self.streamer = IterationMetricsStreamer(log_fn, log_every)
+        self._last_iteration = -1
+
+    def after_iteration(self, info: Any) -> bool:
+        if info.iteration <= self._last_iteration:
+            self.streamer.reset()
+        self._last_iteration = info.iteration
+
+        self.streamer.record(
+            info.iteration,
+            {
+                dataset: {name: values[-1] for name, values in metrics.items()}
+                for dataset, metrics in info.metrics.items()
+            },
+        )
+        return True
+
+    def flush(self) -> None:
+        """CatBoost n'a pas de hook de fin : à appeler après fit()."""
+        self.streamer.flush()
+
+
+def _xgboost_callback_class() -> type:
+    """Import différé : xgboost n'est chargé que pour ce callback."""
+    from health_lifestyle_diabetes.infrastructure.training_diagnostics.xgboost_tracking_callback import (
+        XGBoostTrackingCallback,
+    )
+
+    return XGBoostTrackingCallback
+
+
+_CALLBACKS: Dict[str, Callable[[], type]] = {
+    "xgboost": _xgboost_callback_class,
+    "lightgbm": lambda: LightGBMTrackingCallback,
+    "catboost": lambda: CatBoostTrackingCallback,
+}
+
+
+def build_tracking_callback(model_name: str, log_fn: LogFunction, log_every: int = 10) -> Any:
+    """
+    Callback de streaming adapté à la librairie (xgboost | lightgbm | catboost).
+    """
+    try:
+        callback_class = _CALLBACKS[model_name.lower()]()
+    except KeyError as exc:
+        raise ValueError(f"Modèle non supporté : {model_name}") from exc
+    return callback_class(log_fn, log_every)
+
+
+def __getattr__(name: str):
+    """Compatibilité : `XGBoostTrackingCallback` résolu à la demande (PEP 562)."""
+    if name == "XGBoostTrackingCallback":
+        return _xgboost_callback_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,47 @@
+"""
+Callback XGBoost streamant les courbes d'apprentissage
+(voir tracking_callbacks.py).
+
+Module séparé pour que l'import de xgboost ne soit payé que par les
+entraînements XGBoost.
+"""
+
+from typing import Any, Dict, List
+
+import xgboost as xgb
+
+from health_lifestyle_diabetes.infrastructure.training_diagnostics.tracking_callbacks import (
+    IterationMetricsStreamer,
+    LogFunction,
+)
+
+
+class XGBoostTrackingCallback(xgb.callback.TrainingCallback):
+    """
+    Callback XGBoost (à passer via `callbacks=[...]` au constructeur).
+    """
+
+    def __init__(self, log_fn: LogFunction, log_every: int = 10):
+        super().__init__()
+        self.streamer = IterationMetricsStreamer(log_fn, log_every)
+
+    def before_training(self, model: Any) -> Any:
+        self.streamer.reset()
+        return model
+
+    def after_iteration(self, model: Any, epoch: int, evals_log: Dict[str, Dict[str, List]]) -> bool:
+        self.streamer.record(
+            epoch,
+            {
+                dataset: {
+                    name: (values[-1][0] if isinstance(values[-1], tuple) else values[-1])
+                    for name, values in metrics.items()
+                }
+                for dataset, metrics in evals_log.items()
+            },
+        )
+        return False
+
+    def after_training(self, model: Any) -> Any:
+        self.streamer.flush()
+        return model
@@ -243,6 +243,22 @@ class LightGBMTrainingError(BaseAppError):
     pass
 
 
+class ModelCalibrationError(BaseAppError):
+    """
+    Erreur lors de l'ajustement, de l'application ou de la
+    (dé)sérialisation d'un calibrateur de probabilités.
+    """
+    pass
+
+
+class MetricsRegistryError(BaseAppError):
+    """
+    Erreur d'enregistrement d'une métrique de monitoring (nom invalide,
+    nom déjà utilisé par un autre type ou d'autres labels).
+    """
+    pass
+
+
 
 # ============================================================
 # ===============   4. Export Public (Best Practice)   ========
@@ -274,4 +290,6 @@ __all__ = [
     "XGBoostTrainingError",
     "CatBoostTrainingError",
     "LightGBMTrainingError",
+    "ModelCalibrationError",
+    "MetricsRegistryError",
 ]
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""
+Benchmark du temps d'import des points d'entrée (`python -X importtime`).
+
+Chaque module est importé dans un interpréteur neuf ; la sortie
+`-X importtime` est analysée pour obtenir le temps cumulé du module, les
+dépendances les plus coûteuses et la présence de modules lourds qui ne
+devraient pas être chargés à l'import (ex: mlflow).
+
+Garde-fous de régression :
+- lecture de configuration YAML pendant l'import (effet de bord interdit),
+- temps cumulé supérieur à une référence enregistrée (`--baseline`).
+
+Usage :
+    python -m health_lifestyle_diabetes.infrastructure.utils.import_benchmark
+    python -m health_lifestyle_diabetes.infrastructure.utils.import_benchmark \\
+        --save-baseline reports/importtime_baseline.json
+    python -m health_lifestyle_diabetes.infrastructure.utils.import_benchmark \\
+        --strict --baseline reports/importtime_baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Points d'entrée principaux du package.
+ENTRY_POINTS: Tuple[str, ...] = (
+    "health_lifestyle_diabetes.infrastructure.tracking.mlflow_tracker",
+    "health_lifestyle_diabetes.infrastructure.tracking.buffered_mlflow_tracker",
+    "health_lifestyle_diabetes.infrastructure.tracking.local_file_tracker",
+    "health_lifestyle_diabetes.application.services.experiment_tracking_service",
+    "health_lifestyle_diabetes.application.use_cases.evaluate_model_uc",
+    "health_lifestyle_diabetes.application.use_cases.split_dataset_use_case",
+    "health_lifestyle_diabetes.infrastructure.data_sources.csv_dataset_repository",
+    "health_lifestyle_diabetes.infrastructure.feature_engineering.pipeline_feature_engineering",
+    "health_lifestyle_diabetes.infrastructure.features_selections.json_selected_features_repository",
+    "health_lifestyle_diabetes.infrastructure.training_diagnostics.diagnostics",
+    "health_lifestyle_diabetes.infrastructure.training_diagnostics.tracking_callbacks",
+    "health_lifestyle_diabetes.infrastructure.visualization.calibration_matplotlib_adapter",
+    "health_lifestyle_diabetes.infrastructure.visualization.feature_importance_plotter",
+)
+
+# Modules lourds qui ne doivent pas être importés par les points d'entrée.
+HEAVY_MODULES: Tuple[str, ...] = ("mlflow", "xgboost")
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+# Compte les lectures YAML déclenchées par l'import du module.
+_CONFIG_PROBE = """
+import health_lifestyle_diabetes.infrastructure.utils.config_loader as loader
+calls = []
+original = loader.YamlConfigLoader.load_config
+def probe(*args, **kwargs):
+    calls.append(args)
+    return original(*args, **kwargs)
+loader.YamlConfigLoader.load_config = staticmethod(probe)
+import {module}
+print(len(calls))
+"""
+
+
+@dataclass
+class ImportReport:
+    module: str
+    cumulative_ms: float
+    top: List[Tuple[str, float]] = field(default_factory=list)
+    heavy_loaded: List[str] = field(default_factory=list)
+    config_loads: int = 0
+    error: Optional[str] = None
+
+
+def _run_importtime(module: str) -> Tuple[Dict[str, float], subprocess.CompletedProcess]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    cumulative: Dict[str, float] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            name = match.group(4)
+            cumulative[name] = max(cumulative.get(name, 0.0), int(match.group(2)) / 1000)
+    return cumulative, proc
+
+
+def count_config_loads(module: str) -> int:
+    """Nombre d'appels à YamlConfigLoader.load_config pendant l'import de `module`."""
+    proc = subprocess.run(
+        [sys.executable, "-c", _CONFIG_PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+    )
+    lines = proc.stdout.strip().splitlines()
+    return int(lines[-1]) if proc.returncode == 0 and lines else -1
+
+
+def measure_import(
+    module: str,
+    top: int = 10,
+    heavy_modules: Sequence[str] = HEAVY_MODULES,
+    repeat: int = 1,
+) -> ImportReport:
+    """
+    Importe `module` dans un sous-processus et analyse `-X importtime`.
+    Avec `repeat > 1`, le temps cumulé retenu est la médiane des mesures.
+    """
+    timings: List[float] = []
+    cumulative: Dict[str, float] = {}
+    for _ in range(max(1, repeat)):
+        cumulative, proc = _run_importtime(module)
+        if proc.returncode != 0:
+            stderr = proc.stderr.strip()
+            return ImportReport(
+                module=module,
+                cumulative_ms=float("nan"),
+                error=stderr.splitlines()[-1] if stderr else "échec",
+            )
+        timings.append(cumulative.get(module, 0.0))
+
+    # Dépendances de premier niveau (paquets racines) les plus coûteuses.
+    roots: Dict[str, float] = {}
+    for name, value in cumulative.items():
+        root = name.split(".")[0]
+        if name == root:
+            roots[root] = max(roots.get(root, 0.0), value)
+
+    loaded_roots = {name.split(".")[0] for name in cumulative}
+    return ImportReport(
+        module=module,
+        cumulative_ms=statistics.median(timings),
+        top=sorted(roots.items(), key=lambda item: -item[1])[:top],
+        heavy_loaded=[m for m in heavy_modules if m in loaded_roots],
+        config_loads=count_config_loads(module),
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark du temps d'import.")
+    parser.add_argument("--modules", nargs="+", default=list(ENTRY_POINTS))
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--fail-on-heavy",
+        action="store_true",
+        help="Code retour 1 si un module lourd est importé par un point d'entrée.",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Comme --fail-on-heavy, et échec si une configuration est lue à l'import "
+        "ou si un temps dépasse la référence.",
+    )
+    parser.add_argument("--baseline", type=Path, help="Référence JSON {module: ms} à comparer.")
+    parser.add_argument("--save-baseline", type=Path, help="Enregistre les temps mesurés.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.5,
+        help="Dépassement relatif toléré par rapport à la référence (0.5 = +50%%).",
+    )
+    args = parser.parse_args(argv)
+
+    baseline: Dict[str, float] = (
+        json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else {}
+    )
+    measured: Dict[str, float] = {}
+
+    status = 0
+    for module in args.modules:
+        report = measure_import(module, top=args.top, repeat=args.repeat)
+        if report.error:
+            print(f"{module}\n  ERREUR : {report.error}")
+            status = 1
+            continue
+        measured[module] = round(report.cumulative_ms, 1)
+
+        print(f"{module}\n  cumulé : {report.cumulative_ms:8.1f} ms")
+        for name, value in report.top:
+            print(f"    {name:<30} {value:8.1f} ms")
+
+        if report.heavy_loaded:
+            print(f"  modules lourds importés : {', '.join(report.heavy_loaded)}")
+            if args.fail_on_heavy or args.strict:
+                status = 1
+        if report.config_loads:
+            print(f"  lectures de configuration à l'import : {report.config_loads}")
+            if args.strict:
+                status = 1
+        reference = baseline.get(module)
+        if reference and report.cumulative_ms > reference * (1 + args.max_regression):
+            print(f"  RÉGRESSION : {report.cumulative_ms:.1f} ms (référence {reference:.1f} ms)")
+            if args.strict:
+                status = 1
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(measured, indent=2), encoding="utf-8")
+        print(f"Référence enregistrée : {args.save_baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
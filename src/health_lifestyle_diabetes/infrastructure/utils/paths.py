@@ -1,12 +1,53 @@
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Explicit repository root (e.g. containers where neither .git nor
+# pyproject.toml is shipped next to the installed package).
+ROOT_ENV_VAR = "HLD_ROOT"
+
+
+@lru_cache(maxsize=1)
+def _resolve_repository_root() -> Path:
+    """
+    Resolve the repository root once per process.
+
+    The environment override costs a single stat; otherwise parent
+    directories are walked until a project marker is found.
+    """
+    override = os.environ.get(ROOT_ENV_VAR)
+    if override:
+        root = Path(override).expanduser()
+        if not root.is_dir():
+            raise FileNotFoundError(
+                f"{ROOT_ENV_VAR}={override!r} does not point to an existing directory."
+            )
+        return root.resolve()
+
+    current = Path(__file__).resolve().parent
+
+    # Files or folders that indicate the root of a project (Git, Poetry...)
+    root_markers = ("pyproject.toml", ".git")
+
+    for parent in [current, *current.parents]:
+        if any((parent / marker).exists() for marker in root_markers):
+            return parent
+
+    raise FileNotFoundError(
+        "Repository root not found. No 'pyproject.toml' or '.git' directory detected. "
+        f"Set {ROOT_ENV_VAR} to the project directory."
+    )
+
 
 def get_repository_root(add_to_sys_path: bool = False) -> Path:
     """
     Locate the root directory of the repository by searching for known project markers
     such as 'pyproject.toml' or '.git'. Optionally add it to sys.path.
 
+    The result is cached for the lifetime of the process. The lookup can be
+    bypassed with the ``HLD_ROOT`` environment variable.
+
     Parameters
     ----------
     add_to_sys_path : bool, optional
@@ -20,19 +61,15 @@ def get_repository_root(add_to_sys_path: bool = False) -> Path:
     Raises
     ------
     FileNotFoundError
-        If no project root markers are found in parent directories.
+        If no project root markers are found in parent directories, or if
+        ``HLD_ROOT`` points to a missing directory.
     """
-    current = Path(__file__).resolve().parent
+    root = _resolve_repository_root()
+    if add_to_sys_path and str(root) not in sys.path:
+        sys.path.append(str(root))
+    return root
 
-    # Files or folders that indicate the root of a project (Git, Poetry...)
-    root_markers = {"pyproject.toml", ".git"}
 
-    for parent in [current, *current.parents]:
-        if any((parent / marker).exists() for marker in root_markers):
-            if add_to_sys_path:
-                sys.path.append(str(parent))
-            return parent
-
-    raise FileNotFoundError(
-        "Repository root not found. No 'pyproject.toml' or '.git' directory detected."
-    )
+def clear_repository_root_cache() -> None:
+    """Forget the cached root (tests, or after changing ``HLD_ROOT``)."""
+    _resolve_repository_root.cache_clear()
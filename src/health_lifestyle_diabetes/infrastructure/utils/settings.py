@@ -0,0 +1,141 @@
+"""
+settings.py
+-----------
+
+Configuration typée et validée du projet, construite depuis configs/*.yaml.
+
+Objectifs :
+- Aucun effet de bord à l'import : ni parcours du système de fichiers,
+  ni lecture YAML, ni création de dossiers.
+- paths.yaml, preprocessing.yaml, splitter.yaml et training.yaml sont
+  parsés et validés (pydantic) une seule fois par processus
+  (`get_settings()` est mémoïsé).
+- Les chemins de paths.yaml sont résolus en chemins absolus depuis la
+  racine du dépôt.
+- Toute valeur peut être surchargée par variable d'environnement :
+  préfixe `HLD_`, sections séparées par `__` (insensible à la casse).
+
+    HLD_TRAINING__MODEL__NAME=lightgbm
+    HLD_PATHS__REPORTS__CURVES_REPORTS=/tmp/figures
+    HLD_SPLITTER__SPLITTER__TRAIN_SIZE=0.8
+
+  La racine du dépôt elle-même peut être imposée par `HLD_ROOT`
+  (voir paths.get_repository_root).
+
+Modèles : settings_schema.py. Les adaptateurs reçoivent un `AppSettings`
+par injection (paramètre `settings`) ; à défaut, ils utilisent l'instance
+partagée `get_settings()`.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
+
+import yaml
+
+from .config_loader import YamlConfigLoader
+from .exceptions import ConfigLoadingError
+from .paths import clear_repository_root_cache, get_repository_root
+
+if TYPE_CHECKING:
+    from .settings_schema import AppSettings
+
+ENV_PREFIX = "HLD_"
+ENV_DELIMITER = "__"
+
+# Section de AppSettings -> fichier YAML.
+CONFIG_FILES: Dict[str, str] = {
+    "paths": "paths.yaml",
+    "preprocessing": "preprocessing.yaml",
+    "splitter": "splitter.yaml",
+    "training": "training.yaml",
+}
+
+
+# =====================================================================
+# Chargement
+# =====================================================================
+def _env_overrides(environ: Mapping[str, str]) -> Dict[str, Any]:
+    """Variables `HLD_A__B__C=valeur` -> {"a": {"b": {"c": valeur}}} (valeurs typées YAML)."""
+    overrides: Dict[str, Any] = {}
+    for name, raw in environ.items():
+        if not name.upper().startswith(ENV_PREFIX):
+            continue
+        keys = [k.lower() for k in name[len(ENV_PREFIX):].split(ENV_DELIMITER) if k]
+        if len(keys) < 2 or keys[0] not in CONFIG_FILES:
+            continue
+        try:
+            value = yaml.safe_load(raw)
+        except yaml.YAMLError:
+            value = raw
+        node = overrides
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+    return overrides
+
+
+def _deep_merge(base: Dict[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _resolve_paths(node: Any, root: Path) -> Any:
+    """Chemins relatifs de paths.yaml -> chemins absolus sous `root`."""
+    if isinstance(node, dict):
+        return {key: _resolve_paths(value, root) for key, value in node.items()}
+    if isinstance(node, (str, Path)):
+        return root / node
+    return node
+
+
+def load_settings(
+    root: Optional[Path] = None,
+    environ: Optional[Mapping[str, str]] = None,
+) -> AppSettings:
+    """
+    Construit (sans cache) les settings depuis configs/*.yaml et l'environnement.
+
+    Raises
+    ------
+    ConfigLoadingError
+        Fichier manquant/illisible ou configuration invalide.
+    """
+    from pydantic import ValidationError
+
+    from .settings_schema import AppSettings
+
+    root = Path(root) if root is not None else get_repository_root()
+    environ = os.environ if environ is None else environ
+
+    raw = {
+        section: YamlConfigLoader.load_config(root / "configs" / filename)
+        for section, filename in CONFIG_FILES.items()
+    }
+    raw = _deep_merge(raw, _env_overrides(environ))
+    raw["paths"] = _resolve_paths(raw["paths"], root)
+
+    try:
+        return AppSettings(root=root, **raw)
+    except ValidationError as exc:
+        raise ConfigLoadingError(f"Configuration invalide : {exc}") from exc
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Instance unique (par processus) des settings."""
+    return load_settings()
+
+
+def reset_settings() -> None:
+    """Invalide le cache (tests, notebooks après modification des YAML ou de HLD_ROOT)."""
+    clear_repository_root_cache()
+    get_settings.cache_clear()
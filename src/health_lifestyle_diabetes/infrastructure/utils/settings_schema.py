@@ -0,0 +1,134 @@
+"""
+settings_schema.py
+------------------
+
+Modèles pydantic de la configuration du projet (configs/*.yaml).
+
+Séparés de settings.py : la construction des schémas pydantic a un coût
+d'import, payé uniquement au premier `get_settings()`.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _Section(BaseModel):
+    """Section de configuration immuable ; les clés inconnues sont conservées."""
+
+    model_config = ConfigDict(frozen=True, extra="allow")
+
+
+# =====================================================================
+# paths.yaml
+# =====================================================================
+class DataInputPaths(_Section):
+    raw_dataset: Path
+    train_dataset: Path
+    test_dataset: Path
+    train_indices: Path
+    test_indices: Path
+    split_fingerprint: Path
+
+
+class DataProcessedPaths(_Section):
+    cleaned_dataset: Path
+    features_dataset: Path
+
+
+class DataOutputPaths(_Section):
+    model: Path
+    pipeline: Path
+    selected_features: Path
+
+
+class DataPaths(_Section):
+    root: Path
+    input: DataInputPaths
+    processed: DataProcessedPaths
+    output: DataOutputPaths
+
+
+class ReportsPaths(_Section):
+    eda_report: Path
+    metrics_report: Path
+    curves_reports: Path
+    cm_reports: Path
+
+
+class TrackingPaths(_Section):
+    local_store: Path
+
+
+class LogsPaths(_Section):
+    folder: Path
+    main_log: Path
+
+
+class PathsConfig(_Section):
+    data: DataPaths
+    reports: ReportsPaths
+    tracking: TrackingPaths
+    logs: LogsPaths
+
+
+# =====================================================================
+# preprocessing.yaml
+# =====================================================================
+class FeatureEngineeringConfig(_Section):
+    age_group_strategy: Literal["detailed", "coarse"] = "detailed"
+
+
+class PreprocessingConfig(_Section):
+    feature_engineering: FeatureEngineeringConfig = FeatureEngineeringConfig()
+
+
+# =====================================================================
+# splitter.yaml
+# =====================================================================
+class SplitterSection(_Section):
+    train_size: float = Field(gt=0, lt=1)
+    target_column: str
+    random_state: int = 42
+
+
+class SplitterConfig(_Section):
+    splitter: SplitterSection
+
+
+# =====================================================================
+# training.yaml
+# =====================================================================
+class ExperimentSection(_Section):
+    name: str
+
+
+class ModelSection(_Section):
+    name: Literal["xgboost", "catboost", "lightgbm"]
+    params: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+
+    @property
+    def active_params(self) -> Dict[str, Any]:
+        """Hyperparamètres du modèle sélectionné (`name`)."""
+        return dict(self.params.get(self.name, {}))
+
+
+class TrainingConfig(_Section):
+    experiment: ExperimentSection
+    model: ModelSection
+
+
+# =====================================================================
+# Agrégat
+# =====================================================================
+class AppSettings(BaseModel):
+    """Configuration complète du projet (chemins absolus)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    root: Path
+    paths: PathsConfig
+    preprocessing: PreprocessingConfig
+    splitter: SplitterConfig
+    training: TrainingConfig
@@ -1,5 +1,4 @@
-from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Optional, Sequence
 
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -7,17 +6,11 @@ from health_lifestyle_diabetes.domain.ports.calibration_plot_port import (
     CalibrationPlotPort,
 )
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import (
-    YamlConfigLoader,
-)
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
 from sklearn.calibration import calibration_curve
 
-# === Résolution chemin sortie depuis paths.yaml ===
-root = get_repository_root()
-paths = YamlConfigLoader.load_config(root / "configs/paths.yaml")
-OUTPUT_DIR = root / paths["reports"]["curves_reports"]
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
 
 # === Palette couleurs cohérente ===
 COLOR_BEFORE = "#E74C3C"  # Rouge avant calibration
@@ -25,14 +18,22 @@ COLOR_AFTER  = "#27AE60"  # Vert après calibration
 COLOR_REF    = "#34495E"  # Ligne de référence (gris bleuté)
 
 
+def __getattr__(name: str):
+    """Constantes de chemin résolues à la demande (PEP 562), sans effet de bord à l'import."""
+    if name == "OUTPUT_DIR":
+        return get_settings().paths.reports.curves_reports
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class MatplotlibCalibrationPlotAdapter(CalibrationPlotPort):
     """
     Implémentation Matplotlib du port CalibrationPlotPort.
     Produit un plot de calibration (avant/après) pour un modèle calibré.
     """
 
-    def __init__(self, logger: LoggerPort):
+    def __init__(self, logger: LoggerPort, settings: Optional["AppSettings"] = None):
         self.logger = logger
+        self.output_dir = (settings or get_settings()).paths.reports.curves_reports
 
     def plot_calibration(
         self,
@@ -110,7 +111,8 @@ class MatplotlibCalibrationPlotAdapter(CalibrationPlotPort):
 
         # === Sauvegarde éventuelle ===
         if save:
-            outfile = OUTPUT_DIR / f"{model_name}_calibration_plot.png"
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            outfile = self.output_dir / f"{model_name}_calibration_plot.png"
             plt.savefig(outfile, dpi=300)
             self.logger.info(f"Calibration plot sauvegardé : {outfile}")
 
@@ -1,5 +1,4 @@
-from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 import matplotlib.pyplot as plt
 import numpy as np
 from sklearn.metrics import confusion_matrix
@@ -7,8 +6,10 @@ from sklearn.metrics import confusion_matrix
 from health_lifestyle_diabetes.domain.ports.confusion_matrix_plot_port import ConfusionMatrixPlotPort
 from health_lifestyle_diabetes.domain.entities.confusion_matrix_config import ConfusionMatrixConfig
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import YamlConfigLoader
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
+
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
 
 
 class ConfusionMatrixMatplotlibAdapter(ConfusionMatrixPlotPort):
@@ -17,13 +18,10 @@ class ConfusionMatrixMatplotlibAdapter(ConfusionMatrixPlotPort):
     des matrices de confusion (une ou deux).
     """
 
-    def __init__(self, logger: LoggerPort):
+    def __init__(self, logger: LoggerPort, settings: Optional["AppSettings"] = None):
         self.logger = logger
 
-        root = get_repository_root()
-        cfg = YamlConfigLoader.load_config(f"{root}/configs/paths.yaml")
-        self.save_dir = Path(root / cfg["reports"]["cm_reports"])
-        self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.save_dir = (settings or get_settings()).paths.reports.cm_reports
 
 
     # ---------------------------------------------------------------------
@@ -65,6 +63,7 @@ class ConfusionMatrixMatplotlibAdapter(ConfusionMatrixPlotPort):
             fig = self._plot_dual(y_test, y_pred_test, y_valid, y_pred_valid, config)
 
         if save:
+            self.save_dir.mkdir(parents=True, exist_ok=True)
             file = self.save_dir / f"{run_name}_cm_{config.normalization}.png"
             fig.savefig(file, dpi=300)
             self.logger.info(f"[ADAPTER] Sauvegardé -> {file}")
@@ -1,19 +1,25 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.metrics import confusion_matrix
 
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import YamlConfigLoader
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
 from health_lifestyle_diabetes.infrastructure.logger.loguru_logger import LoguruLogger
 
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
+
 
 class ConfusionMatrixPlotter:
 
-    def __init__(self, logger: Optional[LoggerPort] = None) -> None:
+    def __init__(
+        self,
+        logger: Optional[LoggerPort] = None,
+        settings: Optional["AppSettings"] = None,
+    ) -> None:
         """
         Classe dédiée à l'affichage et sauvegarde de matrices de confusion
         adaptées au domaine médical (diabète).
@@ -28,8 +34,9 @@ class ConfusionMatrixPlotter:
         self.labels = [0, 1]
         self.class_labels = ["Non-Diabétique", "Diabétique"]
 
-        self.root = get_repository_root()
-        self.paths = YamlConfigLoader.load_config(f"{self.root}/configs/paths.yaml")
+        settings = settings or get_settings()
+        self.root = settings.root
+        self.save_dir = settings.paths.reports.cm_reports
 
         self.logger.info("ConfusionMatrixPlotter initialized ⚕️ (default normalization : pred).")
 
@@ -109,7 +116,7 @@ class ConfusionMatrixPlotter:
     # SAVE TO PNG
     # ==========================================================
     def __save_figure(self, fig, run_name: str, method: str) -> None:
-        save_dir = Path(self.root / self.paths["reports"]["cm_reports"])
+        save_dir = Path(self.save_dir)
         save_dir.mkdir(parents=True, exist_ok=True)
 
         file_name = f"{run_name}_confusion_matrix_{method}.png"
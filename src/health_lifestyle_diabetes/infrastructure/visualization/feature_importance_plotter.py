@@ -1,18 +1,19 @@
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 from numpy import linspace
 
 import matplotlib.pyplot as plt
 from health_lifestyle_diabetes.domain.ports.logger_port import LoggerPort
-from health_lifestyle_diabetes.infrastructure.utils.config_loader import (
-    YamlConfigLoader,
-)
-from health_lifestyle_diabetes.infrastructure.utils.paths import get_repository_root
+from health_lifestyle_diabetes.infrastructure.utils.settings import get_settings
 
-# === Résolution chemin sortie depuis paths.yaml ===
-root = get_repository_root()
-paths = YamlConfigLoader.load_config(root / "configs/paths.yaml")
-OUTPUT_DIR = root / paths["reports"]["curves_reports"]
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+if TYPE_CHECKING:
+    from health_lifestyle_diabetes.infrastructure.utils.settings_schema import AppSettings
+
+
+def __getattr__(name: str):
+    """Constantes de chemin résolues à la demande (PEP 562), sans effet de bord à l'import."""
+    if name == "OUTPUT_DIR":
+        return get_settings().paths.reports.curves_reports
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class FeatureImportancePlotter:
@@ -20,8 +21,9 @@ class FeatureImportancePlotter:
     Plot horizontal inversé des importances des features.
     """
 
-    def __init__(self, logger: LoggerPort):
+    def __init__(self, logger: LoggerPort, settings: Optional["AppSettings"] = None):
         self.logger = logger
+        self.output_dir = (settings or get_settings()).paths.reports.curves_reports
 
     def plot(
         self,
@@ -50,8 +52,9 @@ class FeatureImportancePlotter:
                 filename = f"feature_importances_{model_name.lower().replace(' ', '_')}.png"
             else:
                 filename = "feature_importances.png"
-            plt.savefig(OUTPUT_DIR / filename, dpi=300)
-            self.logger.info(f"Figure sauvegardée ➜ {OUTPUT_DIR / filename}")
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            plt.savefig(self.output_dir / filename, dpi=300)
+            self.logger.info(f"Figure sauvegardée ➜ {self.output_dir / filename}")
 
         plt.show()
         self.logger.info("Affichage du barplot des feature importances terminé")
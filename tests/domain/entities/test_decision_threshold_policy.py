@@ -0,0 +1,59 @@
+"""
+DecisionThresholdPolicy.from_selection : la politique appliquée reproduit
+la matrice de confusion de la sélection.
+"""
+
+import numpy as np
+import pytest
+
+from health_lifestyle_diabetes.domain.entities.decision_threshold_policy import (
+    NEVER_POSITIVE_THRESHOLD,
+    DecisionThresholdPolicy,
+)
+from health_lifestyle_diabetes.domain.services.threshold_service import ThresholdService
+from health_lifestyle_diabetes.infrastructure.logger.performance_logging import (
+    NullLogger,
+)
+from health_lifestyle_diabetes.infrastructure.metrics.numpy_threshold_optimizer import (
+    NumpyThresholdOptimizer,
+)
+
+
+def _confusion(y_true, y_pred):
+    y_true, y_pred = np.asarray(y_true), np.asarray(y_pred)
+    return (
+        int(np.sum((y_pred == 1) & (y_true == 1))),
+        int(np.sum((y_pred == 1) & (y_true == 0))),
+        int(np.sum((y_pred == 0) & (y_true == 0))),
+        int(np.sum((y_pred == 0) & (y_true == 1))),
+    )
+
+
+CASES = {
+    # Faux positifs coûteux : l'optimum est « aucun positif » (seuil > 1).
+    "predict_nothing": ([0, 0, 0, 1], [0.9999999, 0.99999995, 1.0, 0.1], "cost", 10.0),
+    # Probabilité minimale nulle : l'optimum est « tout positif » (seuil 0).
+    "predict_everything": ([1, 1, 1, 0], [0.0, 0.3, 0.6, 0.0], "cost", 0.1),
+    "f1": ([0, 1, 0, 1, 1, 0, 1], [0.1, 0.8, 0.4, 0.35, 0.9, 0.2, 0.6], "f1", 1.0),
+}
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_policy_reproduces_selection_counts(case):
+    y_true, y_proba, objective, cost_fp = CASES[case]
+    selection = NumpyThresholdOptimizer(NullLogger()).find_optimal_threshold(
+        y_true, y_proba, objective, cost_fp=cost_fp
+    )
+
+    policy = DecisionThresholdPolicy.from_selection(selection)
+    y_pred = ThresholdService.apply_threshold(y_proba, policy.threshold)
+
+    assert _confusion(y_true, y_pred) == (selection.tp, selection.fp, selection.tn, selection.fn)
+
+
+def test_never_positive_threshold_bounds():
+    assert DecisionThresholdPolicy(NEVER_POSITIVE_THRESHOLD).threshold > 1.0
+    with pytest.raises(ValueError):
+        DecisionThresholdPolicy(1.5)
+    with pytest.raises(ValueError):
+        DecisionThresholdPolicy(-0.1)
@@ -0,0 +1,65 @@
+"""
+Calibrateurs prefit : parité Platt / sklearn et bins vides de
+l'histogram binning.
+"""
+
+import numpy as np
+import pytest
+from sklearn.calibration import _sigmoid_calibration
+
+from health_lifestyle_diabetes.infrastructure.calibration.prefit_calibrators import (
+    HistogramBinningCalibrator,
+    PlattCalibrator,
+    PrefitCalibrator,
+)
+from health_lifestyle_diabetes.infrastructure.utils.exceptions import (
+    ModelCalibrationError,
+)
+
+
+def _scores(seed: int, n: int = 2_000):
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, n)
+    # Probabilités sur-confiantes : la calibration a un effet mesurable.
+    y_proba = np.clip(0.5 + (y_true - 0.5) * rng.random(n) * 1.2, 0.0, 1.0)
+    return y_proba, y_true
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_platt_matches_sklearn_sigmoid_calibration(seed):
+    y_proba, y_true = _scores(seed)
+
+    a_sk, b_sk = _sigmoid_calibration(y_proba, y_true)
+    calibrator = PlattCalibrator().fit(y_proba, y_true)
+
+    assert calibrator.a == pytest.approx(-a_sk, abs=1e-3)
+    assert calibrator.b == pytest.approx(-b_sk, abs=1e-3)
+    expected = 1.0 / (1.0 + np.exp(a_sk * y_proba + b_sk))
+    np.testing.assert_allclose(calibrator.transform(y_proba), expected, atol=1e-4)
+
+
+def test_platt_roundtrip_and_v1_artifact_rejected():
+    y_proba, y_true = _scores(0)
+    calibrator = PlattCalibrator().fit(y_proba, y_true)
+
+    restored = PrefitCalibrator.from_dict(calibrator.to_dict())
+    np.testing.assert_array_equal(restored.transform(y_proba), calibrator.transform(y_proba))
+
+    with pytest.raises(ModelCalibrationError, match="v1"):
+        PrefitCalibrator.from_dict({**calibrator.to_dict(), "version": 1})
+
+
+def test_histogram_binning_ties_at_minimum():
+    # 60 % des probabilités ex-aequo au minimum : le premier quantile vaut
+    # 0.1, le bin sous 0.1 est vide.
+    rng = np.random.default_rng(0)
+    y_proba = np.r_[np.full(600, 0.1), rng.uniform(0.2, 0.9, 400)]
+    y_true = np.r_[np.tile([1, 0, 0, 0], 150), (rng.random(400) < 0.6).astype(int)]
+
+    calibrator = HistogramBinningCalibrator(n_bins=10).fit(y_proba, y_true)
+
+    assert calibrator.transform([0.05])[0] == pytest.approx(0.25)
+    assert calibrator.transform([0.1])[0] == pytest.approx(0.25)
+    # Aucun bin vide : chaque valeur est une fréquence observée.
+    bins = np.searchsorted(calibrator.edges, y_proba, side="right")
+    assert np.bincount(bins, minlength=calibrator.bin_values.size).min() > 0
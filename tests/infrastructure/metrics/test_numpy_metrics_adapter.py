@@ -0,0 +1,100 @@
+"""
+Parité NumpyMetricsAdapter / SklearnMetricsAdapter (mêmes clés, même arrondi).
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from health_lifestyle_diabetes.infrastructure.metrics.numpy_metrics_adapter import (
+    NumpyMetricsAdapter,
+)
+from health_lifestyle_diabetes.infrastructure.metrics.sklearn_metrics_adapter import (
+    SklearnMetricsAdapter,
+)
+
+THRESHOLD = 0.5
+RANKING_KEYS = ("auc_roc", "auc_pr")
+
+
+def _inputs(y_true, y_proba):
+    y_true = np.asarray(y_true)
+    y_proba = np.asarray(y_proba, dtype=np.float64)
+    return y_true, (y_proba >= THRESHOLD).astype(int), y_proba
+
+
+def _random_case(seed: int, n: int = 5_000, decimals=None):
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, n)
+    # Signal partiel : AUC ni triviale ni aléatoire.
+    y_proba = np.clip(0.35 * y_true + rng.random(n) * 0.65, 0.0, 1.0)
+    if decimals is not None:
+        y_proba = np.round(y_proba, decimals)
+    return _inputs(y_true, y_proba)
+
+
+CASES = {
+    "untied": _random_case(0),
+    # Probabilités arrondies : nombreux ex-aequo (scores de modèle quantifiés).
+    "rounded_2_decimals": _random_case(1, decimals=2),
+    "rounded_1_decimal": _random_case(2, decimals=1),
+    # Ex-aequo entre classes sur toutes les valeurs.
+    "all_tied": _inputs([0, 1, 0, 1, 1, 0], [0.5] * 6),
+    "tied_blocks": _inputs(
+        [0, 0, 1, 1, 0, 1, 1, 0], [0.2, 0.2, 0.2, 0.7, 0.7, 0.7, 0.9, 0.1]
+    ),
+    # Classe positive rare.
+    "imbalanced": _inputs(
+        np.r_[np.zeros(995, dtype=int), np.ones(5, dtype=int)],
+        np.r_[np.linspace(0.0, 0.6, 995), [0.55, 0.7, 0.8, 0.3, 0.9]],
+    ),
+    # Une seule classe prédite (MCC = 0 par convention, precision = 0).
+    "single_predicted_class": _inputs([0, 1, 0, 1, 1], [0.1, 0.2, 0.3, 0.4, 0.45]),
+}
+
+
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_parity_with_sklearn(case):
+    y_true, y_pred, y_proba = CASES[case]
+
+    expected = SklearnMetricsAdapter().compute_metrics(y_true, y_pred, y_proba)
+    result = NumpyMetricsAdapter().compute_metrics(y_true, y_pred, y_proba)
+
+    assert list(result) == list(expected)
+    assert result == pytest.approx(expected, abs=1e-4)
+
+
+@pytest.mark.parametrize("label", [0, 1])
+def test_single_class_ground_truth(label):
+    """
+    Une seule classe réelle : ROC-AUC / AUC-PR indéfinies (NaN) ; les
+    métriques à seuil restent celles de sklearn.
+
+    Comparaison métrique par métrique : selon la version, sklearn lève une
+    erreur ou renvoie NaN (avec avertissement) pour la ROC-AUC.
+    """
+    from sklearn.metrics import (
+        accuracy_score,
+        cohen_kappa_score,
+        f1_score,
+        precision_score,
+        recall_score,
+    )
+
+    y_true, y_pred, y_proba = _inputs([label] * 6, [0.1, 0.4, 0.6, 0.8, 0.3, 0.9])
+
+    result = NumpyMetricsAdapter().compute_metrics(y_true, y_pred, y_proba)
+
+    for key in RANKING_KEYS:
+        assert math.isnan(result[key])
+    assert result["accuracy"] == pytest.approx(accuracy_score(y_true, y_pred), abs=1e-4)
+    assert result["precision"] == pytest.approx(
+        precision_score(y_true, y_pred, zero_division=0), abs=1e-4
+    )
+    assert result["recall"] == pytest.approx(
+        recall_score(y_true, y_pred, zero_division=0), abs=1e-4
+    )
+    assert result["f1"] == pytest.approx(f1_score(y_true, y_pred, zero_division=0), abs=1e-4)
+    assert result["kappa"] == pytest.approx(cohen_kappa_score(y_true, y_pred), abs=1e-4)
+    assert result["mcc"] == 0.0
@@ -0,0 +1,72 @@
+"""
+Fenêtrage de StreamingMetricsAccumulator après fusion d'états de workers.
+"""
+
+import numpy as np
+import pytest
+
+from health_lifestyle_diabetes.infrastructure.metrics.streaming_metrics_accumulator import (
+    StreamingMetricsAccumulator,
+)
+
+
+def _batch(n: int, seed: int):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2, n), rng.random(n)
+
+
+def _worker(n: int, seed: int) -> StreamingMetricsAccumulator:
+    worker = StreamingMetricsAccumulator(n_bins=20, calibration_bins=10)
+    worker.update(*_batch(n, seed))
+    return worker
+
+
+def test_tumbling_merge_then_update():
+    acc = StreamingMetricsAccumulator(
+        n_bins=20, calibration_bins=10, window="tumbling", window_size=10
+    )
+    acc.merge(_worker(15, seed=0))
+    assert acc.snapshot().n_samples == 15
+
+    y_true, y_proba = _batch(20, seed=1)
+    acc.update(y_true, y_proba)
+
+    # La dernière fenêtre close contient exactement les 10 dernières lignes.
+    expected = StreamingMetricsAccumulator(n_bins=20, calibration_bins=10)
+    expected.update(y_true[10:], y_proba[10:])
+    assert acc.snapshot().n_samples == 10
+    assert acc.compute() == expected.compute()
+    assert acc._panes[-1].n_samples == 0
+
+
+def test_sliding_merge_then_update():
+    acc = StreamingMetricsAccumulator(
+        n_bins=20, calibration_bins=10, window="sliding", window_size=10, n_panes=2
+    )
+    acc.update(*_batch(3, seed=2))
+    acc.merge(_worker(15, seed=0))
+    assert acc.snapshot().n_samples == 18
+
+    y_true, y_proba = _batch(20, seed=1)
+    acc.update(y_true, y_proba)
+
+    # 2 lignes complètent le panneau ouvert, puis 5 + 5 + 5 + 3 : la fenêtre
+    # ne contient plus que les 8 dernières lignes, chacune comptée une fois.
+    expected = StreamingMetricsAccumulator(n_bins=20, calibration_bins=10)
+    expected.update(y_true[-8:], y_proba[-8:])
+    assert [pane.n_samples for pane in acc._panes] == [5, 3]
+    assert acc.compute() == expected.compute()
+
+
+@pytest.mark.parametrize("window", ["tumbling", "sliding"])
+def test_update_after_merge_never_overfills_panes(window):
+    acc = StreamingMetricsAccumulator(
+        n_bins=20, calibration_bins=10, window=window, window_size=10, n_panes=2
+    )
+    acc.merge(_worker(15, seed=0))
+    acc.update(*_batch(20, seed=1))
+    acc.merge(_worker(7, seed=3))
+    acc.update(*_batch(13, seed=4))
+
+    capacity = 10 if window == "tumbling" else 5
+    assert acc._panes[-1].n_samples < capacity